@@ -0,0 +1,175 @@
+"""
+Benchmark row-wise (jaydebeapi fetchall) vs. columnar JDBC result conversion.
+
+By default the benchmark runs against a simulated in-process ResultSet, which
+counts JVM-boundary calls and can charge a fixed cost per call to model JPype
+overhead. Pass --url to measure against a live database instead.
+
+Usage:
+    python benchmarks/bench_jdbc_columnar.py [--rows 200000] [--call-cost-us 1.0]
+    python benchmarks/bench_jdbc_columnar.py --url jdbc:postgresql://localhost/db \\
+        --user u --password p --query "SELECT * FROM wide_table"
+"""
+
+import argparse
+import datetime
+import time
+
+import pandas as pd
+
+from yavai.connections import columnar
+from yavai.connections.columnar import fetch_columns
+
+COLUMNS = [
+    ("id", columnar.BIGINT, 19, 0),
+    ("amount", columnar.DOUBLE, 15, 0),
+    ("qty", columnar.INTEGER, 10, 0),
+    ("customer", columnar.VARCHAR, 64, 0),
+    ("created_at", columnar.TIMESTAMP, 29, 0),
+]
+
+
+class _Timestamp:
+    """Stand-in for java.sql.Timestamp."""
+
+    def __init__(self, value: datetime.datetime):
+        self._value = value
+
+    def getNanos(self):
+        return self._value.microsecond * 1000
+
+    def __str__(self):
+        return self._value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class SimulatedResultSet:
+    """In-process ResultSet/ResultSetMetaData that counts JVM-boundary calls."""
+
+    def __init__(self, n_rows: int, call_cost_us: float):
+        base = datetime.datetime(2024, 1, 1)
+        self._rows = [
+            (i, i * 1.25, i % 1000, f"cust-{i % 5000}", base + datetime.timedelta(seconds=i))
+            for i in range(n_rows)
+        ]
+        self._pos = -1
+        self._cost = call_cost_us / 1e6
+        self.calls = 0
+
+    def _call(self):
+        self.calls += 1
+        if self._cost:
+            end = time.perf_counter() + self._cost
+            while time.perf_counter() < end:
+                pass
+
+    # ResultSet
+    def next(self):
+        self._call()
+        self._pos += 1
+        return self._pos < len(self._rows)
+
+    def getObject(self, col):
+        self._call()
+        value = self._rows[self._pos][col - 1]
+        return _Timestamp(value) if isinstance(value, datetime.datetime) else value
+
+    def getTimestamp(self, col):
+        self._call()
+        return _Timestamp(self._rows[self._pos][col - 1])
+
+    def getString(self, col):
+        self._call()
+        value = self._rows[self._pos][col - 1]
+        return str(_Timestamp(value)) if isinstance(value, datetime.datetime) else str(value)
+
+    def setFetchSize(self, size):
+        pass
+
+    # ResultSetMetaData
+    def getColumnCount(self):
+        self._call()
+        return len(COLUMNS)
+
+    def getColumnName(self, col):
+        return COLUMNS[col - 1][0]
+
+    def getColumnType(self, col):
+        self._call()
+        return COLUMNS[col - 1][1]
+
+    def getPrecision(self, col):
+        return COLUMNS[col - 1][2]
+
+    def getScale(self, col):
+        return COLUMNS[col - 1][3]
+
+
+def _simulated_cursor(n_rows: int, call_cost_us: float):
+    import jaydebeapi
+
+    types = {name: getattr(columnar, name) for name in dir(columnar) if name.isupper()
+             and isinstance(getattr(columnar, name), int)}
+    types["BINARY"] = -2
+    jaydebeapi._init_types(types)
+
+    cursor = jaydebeapi.Cursor(None, jaydebeapi._converters)
+    rs = SimulatedResultSet(n_rows, call_cost_us)
+    cursor._rs = rs
+    cursor._meta = rs
+    return cursor, rs
+
+
+def run_simulated(args):
+    results = []
+    for label in ("row-wise", "columnar"):
+        cursor, rs = _simulated_cursor(args.rows, args.call_cost_us)
+        start = time.perf_counter()
+        if label == "row-wise":
+            cols = [d[0] for d in COLUMNS]
+            df = pd.DataFrame(cursor.fetchall(), columns=cols)
+        else:
+            df = fetch_columns(cursor)
+        elapsed = time.perf_counter() - start
+        results.append((label, elapsed, rs.calls, df))
+    return results
+
+
+def run_live(args):
+    from yavai.connections.jdbc import JDBC
+
+    results = []
+    for label in ("row-wise", "columnar"):
+        jdbc = JDBC()
+        jdbc.connect(args.url, args.user, args.password)
+        try:
+            start = time.perf_counter()
+            df = jdbc.execute(args.query, columnar=(label == "columnar"))
+            results.append((label, time.perf_counter() - start, None, df))
+        finally:
+            jdbc.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--call-cost-us", type=float, default=0.0,
+                        help="simulated cost of one JVM-boundary call in microseconds")
+    parser.add_argument("--url")
+    parser.add_argument("--user")
+    parser.add_argument("--password")
+    parser.add_argument("--query")
+    args = parser.parse_args()
+
+    results = run_live(args) if args.url else run_simulated(args)
+
+    baseline = results[0][1]
+    print(f"{'path':10} {'seconds':>8} {'speedup':>8} {'jvm calls':>10} {'memory MB':>10}")
+    for label, elapsed, calls, df in results:
+        memory = df.memory_usage(deep=True).sum() / 1e6
+        calls_str = f"{calls:10d}" if calls is not None else f"{'-':>10}"
+        print(f"{label:10} {elapsed:8.2f} {baseline / elapsed:7.2f}x {calls_str} {memory:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark memory and conversion time of typed vs. object JDBC result DataFrames.
+
+By default rows are generated the way jaydebeapi returns them (Python ints,
+Decimals, timestamp strings, low-cardinality strings) together with a
+jaydebeapi-style cursor description. Pass --url to measure a live query.
+
+Usage:
+    python benchmarks/bench_jdbc_dtypes.py [--rows 500000]
+    python benchmarks/bench_jdbc_dtypes.py --url jdbc:postgresql://localhost/db \\
+        --user u --password p --query "SELECT * FROM sales"
+"""
+
+import argparse
+import datetime
+import decimal
+import time
+
+import jaydebeapi
+import pandas as pd
+
+from yavai.connections.dtypes import categorize, convert_types
+
+DESCRIPTION = [
+    ("id", jaydebeapi.NUMBER, None, None, 19, 0, False),
+    ("amount", jaydebeapi.DECIMAL, None, None, 12, 2, True),
+    ("qty", jaydebeapi.NUMBER, None, None, 10, 0, True),
+    ("region", jaydebeapi.STRING, None, None, 16, 0, True),
+    ("created_at", jaydebeapi.DATETIME, None, None, 29, 6, True),
+]
+
+
+def _rows(n_rows: int) -> list:
+    base = datetime.datetime(2024, 1, 1)
+    regions = ["north", "south", "east", "west", "central"]
+    return [
+        (
+            i,
+            decimal.Decimal(i % 10000) / 100,
+            None if i % 17 == 0 else i % 1000,
+            regions[i % len(regions)],
+            (base + datetime.timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        for i in range(n_rows)
+    ]
+
+
+def _measure(label: str, build) -> tuple:
+    start = time.perf_counter()
+    df = build()
+    elapsed = time.perf_counter() - start
+    return label, elapsed, df.memory_usage(deep=True).sum() / 1e6, df
+
+
+def run_simulated(args):
+    rows = _rows(args.rows)
+    columns = [d[0] for d in DESCRIPTION]
+    return [
+        _measure("object", lambda: pd.DataFrame(rows, columns=columns, dtype=object)),
+        _measure("typed", lambda: categorize(
+            convert_types(pd.DataFrame(rows, columns=columns, dtype=object), DESCRIPTION))),
+    ]
+
+
+def run_live(args):
+    from yavai.connections.jdbc import JDBC
+
+    jdbc = JDBC()
+    jdbc.connect(args.url, args.user, args.password, backend="jdbc")
+    try:
+        def untyped():
+            jdbc._cursor.execute(args.query)
+            cols = [d[0] for d in jdbc._cursor.description]
+            return pd.DataFrame(jdbc._cursor.fetchall(), columns=cols, dtype=object)
+
+        return [
+            _measure("object", untyped),
+            _measure("typed", lambda: jdbc.execute(args.query, use_cache=False)),
+        ]
+    finally:
+        jdbc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--url")
+    parser.add_argument("--user")
+    parser.add_argument("--password")
+    parser.add_argument("--query")
+    args = parser.parse_args()
+
+    results = run_live(args) if args.url else run_simulated(args)
+
+    baseline_memory = results[0][2]
+    print(f"{'frame':8} {'seconds':>8} {'memory MB':>10} {'reduction':>10}")
+    for label, elapsed, memory, df in results:
+        print(f"{label:8} {elapsed:8.2f} {memory:10.1f} {baseline_memory / memory:9.1f}x")
+    print()
+    print(results[-1][3].dtypes.to_string())
+
+
+if __name__ == "__main__":
+    main()
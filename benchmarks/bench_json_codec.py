@@ -0,0 +1,88 @@
+"""
+Benchmark the JSON codecs used by YAVAIClient.
+
+Compares stdlib json against orjson (when installed) on payloads shaped like
+dataset-browse and JDBC-preview responses, decoding from response bytes.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--files 200000] [--rows 50000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from yavai.datasets.codec import _CODECS, get_codec
+
+
+def browse_payload(n_files: int) -> dict:
+    return {
+        "status": 200,
+        "data": {
+            "id": "dataset-1",
+            "name": "images",
+            "files": [
+                {
+                    "id": f"file-{i:08d}",
+                    "name": f"train/class_{i % 100}/img_{i}.jpg",
+                    "size": 10_000 + i,
+                    "etag": f"{i:032x}",
+                }
+                for i in range(n_files)
+            ],
+        },
+    }
+
+
+def preview_payload(n_rows: int) -> dict:
+    return {
+        "status": 200,
+        "data": [
+            {"id": i, "amount": i * 1.25, "customer": f"cust-{i % 5000}",
+             "created_at": "2024-01-01 00:00:00", "active": i % 2 == 0}
+            for i in range(n_rows)
+        ],
+    }
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=200_000)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = {
+        f"browse ({args.files} files)": browse_payload(args.files),
+        f"jdbc preview ({args.rows} rows)": preview_payload(args.rows),
+    }
+
+    codecs = []
+    for name in _CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    reference = get_codec("json")
+    print(f"{'payload':32} {'codec':8} {'MB':>8} {'decode ms':>10} {'encode ms':>10}")
+    for label, payload in payloads.items():
+        body = reference.dumps(payload)
+        size_mb = len(body) / 1e6
+        for codec in codecs:
+            decode = best_of(lambda: codec.loads(body), args.repeat)
+            encode = best_of(lambda: codec.dumps(payload), args.repeat)
+            print(f"{label:32} {codec.name:8} {size_mb:8.1f} "
+                  f"{decode * 1e3:10.1f} {encode * 1e3:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
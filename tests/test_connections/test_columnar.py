@@ -0,0 +1,135 @@
+# tests/test_connections/test_columnar.py
+from unittest.mock import Mock
+import numpy as np
+import pandas as pd
+from yavai.connections import columnar
+from yavai.connections.columnar import fetch_columns
+
+
+class FakeMeta:
+    def __init__(self, columns):
+        self._columns = columns  # (name, jdbc_type, precision, scale)
+
+    def getColumnCount(self):
+        return len(self._columns)
+
+    def getColumnName(self, col):
+        return self._columns[col - 1][0]
+
+    def getColumnType(self, col):
+        return self._columns[col - 1][1]
+
+    def getPrecision(self, col):
+        return self._columns[col - 1][2]
+
+    def getScale(self, col):
+        return self._columns[col - 1][3]
+
+
+class FakeResultSet:
+    def __init__(self, rows):
+        self._rows = rows
+        self._pos = -1
+        self._last_null = False
+        self.fetch_size = None
+
+    def next(self):
+        self._pos += 1
+        return self._pos < len(self._rows)
+
+    def getObject(self, col):
+        return self._rows[self._pos][col - 1]
+
+    def getString(self, col):
+        value = self._rows[self._pos][col - 1]
+        return None if value is None else str(value)
+
+    def getBoolean(self, col):
+        value = self._rows[self._pos][col - 1]
+        self._last_null = value is None
+        return bool(value)
+
+    def wasNull(self):
+        return self._last_null
+
+    def setFetchSize(self, size):
+        self.fetch_size = size
+
+
+def _cursor(columns, rows):
+    cursor = Mock()
+    cursor._rs = FakeResultSet(rows)
+    cursor._meta = FakeMeta(columns)
+    cursor._converters = {}
+    return cursor
+
+
+COLUMNS = [
+    ('id', columnar.BIGINT, 19, 0),
+    ('score', columnar.DOUBLE, 15, 0),
+    ('name', columnar.VARCHAR, 100, 0),
+    ('active', columnar.BOOLEAN, 1, 0),
+    ('created', columnar.TIMESTAMP, 29, 0),
+]
+
+
+def test_fetch_columns_typed_columns():
+    rows = [(1, 1.5, 'a', True, '2024-01-01 10:00:00'),
+            (2, 2.5, 'b', False, '2024-01-02 11:30:00')]
+    
+    df = fetch_columns(_cursor(COLUMNS, rows))
+    
+    assert list(df.columns) == ['id', 'score', 'name', 'active', 'created']
+    assert df['id'].dtype == np.int64
+    assert df['score'].dtype == np.float64
+    assert df['active'].dtype == bool
+    assert pd.api.types.is_datetime64_any_dtype(df['created'])
+    assert df['name'].tolist() == ['a', 'b']
+
+
+def test_fetch_columns_nulls_become_nullable():
+    rows = [(1, None, None, None, None), (None, 2.0, 'x', True, '2024-01-01')]
+    
+    df = fetch_columns(_cursor(COLUMNS, rows))
+    
+    assert str(df['id'].dtype) == 'Int64'
+    assert df['id'].isna().tolist() == [False, True]
+    assert np.isnan(df['score'][0])
+    assert str(df['active'].dtype) == 'boolean'
+    assert pd.isna(df['name'][0])
+    assert pd.isna(df['created'][0])
+
+
+def test_fetch_columns_grows_buffers():
+    rows = [(i, float(i), str(i), True, None) for i in range(10)]
+    
+    df = fetch_columns(_cursor(COLUMNS, rows), capacity=3)
+    
+    assert len(df) == 10
+    assert df['id'].tolist() == list(range(10))
+
+
+def test_fetch_columns_max_rows_and_fetch_size():
+    cursor = _cursor(COLUMNS, [(i, 0.0, 'x', True, None) for i in range(5)])
+    
+    first = fetch_columns(cursor, max_rows=3, fetch_size=3)
+    rest = fetch_columns(cursor, max_rows=3)
+    
+    assert first['id'].tolist() == [0, 1, 2]
+    assert rest['id'].tolist() == [3, 4]
+    assert cursor._rs.fetch_size == 3
+
+
+def test_fetch_columns_decimal_scale():
+    columns = [('qty', columnar.DECIMAL, 10, 0), ('price', columnar.NUMERIC, 10, 2)]
+    
+    df = fetch_columns(_cursor(columns, [(3, 9.99), (None, None)]))
+    
+    assert str(df['qty'].dtype) == 'Int64'
+    assert df['price'].dtype == np.float64
+
+
+def test_fetch_columns_no_result_set():
+    cursor = Mock(_rs=None, _meta=None)
+    
+    assert fetch_columns(cursor) is None
@@ -0,0 +1,128 @@
+# tests/test_connections/test_dtypes.py
+import decimal
+import pytest
+from unittest.mock import Mock, patch
+import jaydebeapi
+import pandas as pd
+from yavai.connections import columnar
+from yavai.connections.dtypes import apply_dtypes, categorize, column_kind, convert_types
+from yavai.connections.jdbc import JDBC
+
+
+def _desc(name, type_code, precision=None, scale=None):
+    return (name, type_code, None, None, precision, scale, True)
+
+
+def test_column_kind_jaydebeapi_type_objects():
+    assert column_kind(jaydebeapi.NUMBER) == 'int'
+    assert column_kind(jaydebeapi.FLOAT) == 'float'
+    assert column_kind(jaydebeapi.DECIMAL, 10, 0) == 'int'
+    assert column_kind(jaydebeapi.DECIMAL, 38, 2) == 'float'
+    assert column_kind(jaydebeapi.DATETIME) == 'datetime'
+    assert column_kind(jaydebeapi.STRING) == 'string'
+    assert column_kind(jaydebeapi.BINARY) == 'object'
+    assert column_kind(None) == 'object'
+
+
+def test_column_kind_hive_and_java_types():
+    assert column_kind('BIGINT_TYPE') == 'int'
+    assert column_kind('TIMESTAMP_TYPE') == 'datetime'
+    assert column_kind('BOOLEAN_TYPE') == 'bool'
+    assert column_kind(columnar.DOUBLE) == 'float'
+    assert column_kind(columnar.VARCHAR) == 'string'
+
+
+def test_convert_types():
+    df = pd.DataFrame({
+        'id': [1, 2, None],
+        'amount': [decimal.Decimal('1.50'), None, decimal.Decimal('2.25')],
+        'qty': [decimal.Decimal('3'), decimal.Decimal('4'), decimal.Decimal('5')],
+        'flag': [True, None, False],
+        'ts': ['2024-01-01 10:00:00', None, '2024-01-03 00:00:00'],
+        'name': ['a', 'b', 'c'],
+    }, dtype=object)
+    description = [
+        _desc('id', jaydebeapi.NUMBER),
+        _desc('amount', jaydebeapi.DECIMAL, 38, 2),
+        _desc('qty', jaydebeapi.DECIMAL, 10, 0),
+        _desc('flag', jaydebeapi.NUMBER),
+        _desc('ts', jaydebeapi.DATETIME),
+        _desc('name', jaydebeapi.STRING),
+    ]
+
+    result = convert_types(df, description)
+
+    assert str(result['id'].dtype) == 'Int64'
+    assert result['id'].tolist()[:2] == [1, 2]
+    assert result['amount'].dtype == 'float64'
+    assert result['qty'].dtype == 'int64'
+    assert str(result['flag'].dtype) == 'boolean'
+    assert pd.api.types.is_datetime64_any_dtype(result['ts'])
+    assert result['name'].dtype == object
+    assert df['id'].dtype == object
+
+
+def test_categorize_low_cardinality_only():
+    df = pd.DataFrame({
+        'region': ['north', 'south'] * 1000,
+        'id': [str(i) for i in range(2000)],
+    })
+
+    result = categorize(df, threshold=0.5)
+
+    assert isinstance(result['region'].dtype, pd.CategoricalDtype)
+    assert not isinstance(result['id'].dtype, pd.CategoricalDtype)
+    assert categorize(df.head(10), threshold=0.5) is not None
+
+
+def test_apply_dtypes_overrides():
+    df = pd.DataFrame({'id': [1, 2], 'ts': ['2024-01-01', '2024-01-02']})
+
+    result = apply_dtypes(df, {'id': 'int32', 'ts': 'datetime64[ns]'})
+
+    assert result['id'].dtype == 'int32'
+    assert pd.api.types.is_datetime64_any_dtype(result['ts'])
+    with pytest.raises(KeyError):
+        apply_dtypes(df, {'missing': 'int32'})
+
+
+def test_jdbc_execute_maps_dtypes():
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    jdbc._cursor = Mock()
+    jdbc._cursor.description = [_desc('id', jaydebeapi.NUMBER), _desc('score', jaydebeapi.FLOAT)]
+    jdbc._cursor.fetchall.return_value = [(1, 0.5), (None, 1.5)]
+
+    df = jdbc.execute('SELECT id, score FROM t', dtypes={'score': 'float32'})
+
+    assert str(df['id'].dtype) == 'Int64'
+    assert df['score'].dtype == 'float32'
+
+
+def test_jdbc_categoricals_are_opt_in():
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    jdbc._cursor = Mock()
+    jdbc._cursor.description = [_desc('region', jaydebeapi.STRING)]
+    jdbc._cursor.fetchall.return_value = [('north',), ('south',)] * 1000
+
+    assert not isinstance(jdbc.execute('SELECT region FROM t')['region'].dtype, pd.CategoricalDtype)
+    jdbc.categorical_threshold = 0.5
+    assert isinstance(jdbc.execute('SELECT region FROM t')['region'].dtype, pd.CategoricalDtype)
+
+
+def test_read_table_categorizes_combined_result():
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    jdbc._cursor = Mock()
+    jdbc.categorical_threshold = 0.5
+    parts = iter([
+        pd.DataFrame({'region': pd.Categorical(['north'] * 1000)}),
+        pd.DataFrame({'region': pd.Categorical(['south'] * 1000)}),
+    ])
+
+    with patch.object(jdbc, 'execute', side_effect=lambda *a, **kw: next(parts)):
+        result = jdbc.read_table('t', 'id', 0, 10, 2)
+
+    assert isinstance(result['region'].dtype, pd.CategoricalDtype)
+    assert sorted(result['region'].cat.categories) == ['north', 'south']
@@ -0,0 +1,113 @@
+# tests/test_connections/test_hive.py
+import pytest
+from unittest.mock import Mock, patch
+import pandas as pd
+from yavai.connections.hive import HiveBackend
+from yavai.connections.jdbc import JDBC
+
+
+def _cursor(rows, columns=('id', 'name')):
+    cursor = Mock()
+    cursor.description = [(c, 'STRING_TYPE') for c in columns]
+    chunks = [rows[i:i + 2] for i in range(0, len(rows), 2)] + [[]]
+    cursor.fetchmany.side_effect = chunks
+    return cursor
+
+
+@pytest.fixture
+def connection():
+    with patch('pyhive.hive.Connection') as mock_connection:
+        yield mock_connection
+
+
+def test_parse_url():
+    params = HiveBackend.parse_url(
+        'jdbc:hive2://hs2.example.com:10001/sales;principal=hive/_HOST@EXAMPLE.COM'
+        '?hive.exec.parallel=true;mapreduce.job.queuename=etl'
+    )
+
+    assert params == {
+        'host': 'hs2.example.com', 'port': 10001, 'database': 'sales',
+        'auth': 'KERBEROS', 'kerberos_service_name': 'hive',
+        'configuration': {'hive.exec.parallel': 'true', 'mapreduce.job.queuename': 'etl'},
+    }
+
+
+def test_parse_url_defaults_and_http():
+    assert HiveBackend.parse_url('jdbc:hive2://localhost') == {
+        'host': 'localhost', 'port': 10000, 'database': 'default'
+    }
+    params = HiveBackend.parse_url(
+        'jdbc:hive2://gw:443/db;transportMode=http;ssl=true;httpPath=cliservice'
+    )
+    assert params['scheme'] == 'https'
+
+    with pytest.raises(ValueError):
+        HiveBackend.parse_url('jdbc:hive2://gw:443/db;transportMode=http;httpPath=gateway/hive')
+
+
+def test_connect_with_password_uses_ldap(connection):
+    HiveBackend('jdbc:hive2://localhost:10000/default', 'etl', 'secret')
+
+    connection.assert_called_once_with(host='localhost', port=10000, database='default',
+                                       username='etl', password='secret', auth='LDAP')
+
+
+def test_connect_kerberos(connection):
+    HiveBackend('jdbc:hive2://localhost:10000/default', kerberos=True)
+
+    kwargs = connection.call_args.kwargs
+    assert kwargs['auth'] == 'KERBEROS'
+    assert kwargs['kerberos_service_name'] == 'hive'
+
+
+def test_execute_uses_arraysize(connection):
+    cursor = _cursor([(1, 'a'), (2, 'b'), (3, 'c')])
+    connection.return_value.cursor.return_value = cursor
+    backend = HiveBackend('jdbc:hive2://localhost:10000/default', arraysize=2)
+
+    df = backend.execute('SELECT id, name FROM t')
+
+    connection.return_value.cursor.assert_called_once_with(arraysize=2)
+    assert df['id'].tolist() == [1, 2, 3]
+    cursor.fetchmany.assert_called_with(2)
+    cursor.close.assert_called_once()
+
+
+def test_execute_iter_streams_batches(connection):
+    cursor = _cursor([(1, 'a'), (2, 'b'), (3, 'c')])
+    connection.return_value.cursor.return_value = cursor
+    backend = HiveBackend('jdbc:hive2://localhost:10000/default')
+
+    batches = list(backend.execute_iter('SELECT id, name FROM t', batch_size=2))
+
+    assert [len(b) for b in batches] == [2, 1]
+    assert isinstance(batches[0], pd.DataFrame)
+    cursor.close.assert_called_once()
+
+
+def test_jdbc_native_hive_skips_jars(connection):
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+
+    with patch.object(jdbc, '_open_connection') as mock_open, \
+            patch.object(jdbc, '_ensure_jar_exists') as mock_jar:
+        jdbc.connect('jdbc:hive2://localhost:10000/default', backend='native',
+                     backend_options={'arraysize': 50000})
+
+    mock_open.assert_not_called()
+    mock_jar.assert_not_called()
+    assert jdbc._backend.arraysize == 50000
+    with pytest.raises(NotImplementedError):
+        jdbc.write_dataframe(pd.DataFrame({'id': [1]}), 't')
+
+
+def test_jdbc_auto_keeps_hive_on_jdbc(connection):
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+
+    with patch.object(jdbc, '_open_connection', return_value=Mock()) as mock_open:
+        jdbc.connect('jdbc:hive2://localhost:10000/default')
+
+    mock_open.assert_called_once()
+    connection.assert_not_called()
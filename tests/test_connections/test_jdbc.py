@@ -2,7 +2,9 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
+import hashlib
 import pandas as pd
+import requests
 from yavai.connections.jdbc import JDBC
 
 
@@ -88,24 +90,134 @@ def test_ensure_jar_not_found_no_download(jdbc):
         assert result is None
 
 
+def _response(body=b'', text=''):
+    response = Mock()
+    response.headers = {'content-length': str(len(body))}
+    response.iter_content = Mock(return_value=[body[:3], body[3:]])
+    response.content = body
+    response.text = text
+    return response
+
+
 @patch('requests.get')
-@patch('builtins.open', create=True)
-def test_download_jar_success(mock_open, mock_get, jdbc):
+def test_download_jar_success(mock_get, jdbc, tmp_path):
     jar_info = {
         'group_id': 'org.test',
         'artifact_id': 'test-driver',
         'version': '1.0.0'
     }
+    body = b'jar-bytes'
+    mock_get.side_effect = [_response(body), _response(text=hashlib.sha1(body).hexdigest())]
     
-    mock_response = Mock()
-    mock_response.headers = {'content-length': '1000'}
-    mock_response.iter_content = Mock(return_value=[b'chunk1', b'chunk2'])
-    mock_get.return_value = mock_response
-    
-    result = jdbc._download_jar(jar_info, Path('/tmp/test.jar'))
+    result = jdbc._download_jar(jar_info, tmp_path / 'test.jar')
     
     assert result is True
+    assert (tmp_path / 'test.jar').read_bytes() == body
+    assert list(tmp_path.glob('*.part')) == []
+    assert mock_get.call_args_list[1].args[0].endswith('test-driver-1.0.0.jar.sha1')
+
+
+@patch('requests.get')
+def test_download_jar_checksum_mismatch(mock_get, jdbc, tmp_path):
+    jar_info = {'group_id': 'org.test', 'artifact_id': 'test-driver', 'version': '1.0.0'}
+    mock_get.side_effect = [_response(b'truncated'), _response(text='0' * 40)]
+    
+    result = jdbc._download_jar(jar_info, tmp_path / 'test.jar')
+    
+    assert result is False
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch('requests.get')
+def test_download_jar_without_checksum_fails_closed(mock_get, jdbc, tmp_path):
+    jar_info = {'group_id': 'org.test', 'artifact_id': 'test-driver', 'version': '1.0.0'}
+    mock_get.side_effect = [_response(b'jar-bytes'), requests.exceptions.ConnectionError('reset')]
+    
+    assert jdbc._download_jar(jar_info, tmp_path / 'test.jar') is False
+    assert list(tmp_path.iterdir()) == []
+    
+    jdbc.verify_checksums = False
+    mock_get.side_effect = [_response(b'jar-bytes'), requests.exceptions.ConnectionError('reset')]
+    
+    assert jdbc._download_jar(jar_info, tmp_path / 'test.jar') is True
+    assert (tmp_path / 'test.jar').read_bytes() == b'jar-bytes'
+
+
+@patch('requests.get')
+def test_download_jar_pinned_sha256(mock_get, jdbc, tmp_path):
+    body = b'jar-bytes'
+    jar_info = {'group_id': 'org.test', 'artifact_id': 'test-driver', 'version': '1.0.0',
+                'classifier': 'standalone', 'sha256': hashlib.sha256(body).hexdigest()}
+    mock_get.return_value = _response(body)
+    
+    assert jdbc._download_jar(jar_info, tmp_path / 'test.jar') is True
     mock_get.assert_called_once()
+    assert mock_get.call_args.args[0].endswith(
+        '/org/test/test-driver/1.0.0/test-driver-1.0.0-standalone.jar'
+    )
+
+
+def test_ensure_jar_copies_from_mirror(tmp_path):
+    mirror = tmp_path / 'mirror' / 'org' / 'test' / 'test-driver' / '1.0.0'
+    mirror.mkdir(parents=True)
+    (mirror / 'test-driver-1.0.0.jar').write_bytes(b'jar-bytes')
+    sha1 = hashlib.sha1(b'jar-bytes').hexdigest()
+    (mirror / 'test-driver-1.0.0.jar.sha1').write_text(sha1 + '  file\n')
+    jdbc = JDBC(jar_dir=str(tmp_path / 'jars'), auto_download=False,
+                mirror_dir=str(tmp_path / 'mirror'))
+    
+    with patch('requests.get') as mock_get:
+        result = jdbc._ensure_jar_exists('test', {'group_id': 'org.test',
+                                                  'artifact_id': 'test-driver',
+                                                  'version': '1.0.0'})
+    
+    assert result == tmp_path / 'jars' / 'test-driver-1.0.0.jar'
+    assert result.read_bytes() == b'jar-bytes'
+    mock_get.assert_not_called()
+
+
+def test_ensure_jar_refuses_unverified_mirror_copy(tmp_path):
+    (tmp_path / 'mirror').mkdir()
+    (tmp_path / 'mirror' / 'test-driver-1.0.0.jar').write_bytes(b'jar-bytes')
+    jar_info = {'group_id': 'org.test', 'artifact_id': 'test-driver', 'version': '1.0.0'}
+    jdbc = JDBC(jar_dir=str(tmp_path / 'jars'), auto_download=False,
+                mirror_dir=str(tmp_path / 'mirror'))
+    
+    assert jdbc._ensure_jar_exists('test', jar_info) is None
+    assert list((tmp_path / 'jars').iterdir()) == []
+    
+    jdbc.verify_checksums = False
+    
+    assert jdbc._ensure_jar_exists('test', jar_info) == tmp_path / 'jars' / 'test-driver-1.0.0.jar'
+
+
+def test_ensure_jar_finds_classified_jar_under_plain_name(tmp_path):
+    jdbc = JDBC(jar_dir=str(tmp_path), auto_download=False)
+    jar_info = {'group_id': 'org.test', 'artifact_id': 'test-driver', 'version': '1.0.0',
+                'classifier': 'standalone'}
+    installed = jdbc.jar_dir / 'test-driver-1.0.0.jar'
+    installed.write_bytes(b'jar-bytes')
+    
+    with patch.object(jdbc, '_download_jar') as mock_download:
+        assert jdbc._ensure_jar_exists('test', jar_info) == installed
+        (jdbc.jar_dir / 'test-driver-1.0.0-standalone.jar').write_bytes(b'jar-bytes')
+        assert jdbc._ensure_jar_exists('test', jar_info).name == 'test-driver-1.0.0-standalone.jar'
+    
+    mock_download.assert_not_called()
+
+
+def test_provision_jars_fetches_concurrently(jdbc):
+    seen = []
+    
+    def ensure(jar_type, jar_info):
+        seen.append(jar_type)
+        return Path(f'/tmp/{jar_type}.jar')
+    
+    with patch.object(jdbc, '_ensure_jar_exists', side_effect=ensure):
+        paths = jdbc.provision_jars('jdbc:hive2://localhost:10000/default')
+    
+    assert sorted(seen) == ['hadoop', 'hive']
+    assert paths == [Path('/tmp/hive.jar'), Path('/tmp/hadoop.jar')]
 
 
 @patch('requests.get')
@@ -205,4 +317,87 @@ def test_add_custom_driver(jdbc):
     )
     
     assert 'oracle' in jdbc.JAR_REGISTRY
-    assert jdbc.JAR_REGISTRY['oracle']['driver_class'] == 'oracle.jdbc.OracleDriver'
\ No newline at end of file
+    assert jdbc.JAR_REGISTRY['oracle']['driver_class'] == 'oracle.jdbc.OracleDriver'
+
+def _batched_cursor(rows, columns=('col1', 'col2')):
+    cursor = Mock()
+    cursor.description = [(c,) for c in columns]
+    remaining = list(rows)
+    
+    def fetchmany(size):
+        chunk = remaining[:size]
+        del remaining[:size]
+        return chunk
+    
+    cursor.fetchmany.side_effect = fetchmany
+    return cursor
+
+
+def test_execute_iter_yields_batches(jdbc):
+    jdbc._cursor = _batched_cursor([(i, i * 2) for i in range(5)])
+    
+    batches = list(jdbc.execute_iter('SELECT * FROM table', batch_size=2))
+    
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert all(isinstance(b, pd.DataFrame) for b in batches)
+    assert list(batches[0].columns) == ['col1', 'col2']
+    jdbc._cursor.fetchall.assert_not_called()
+
+
+def test_execute_iter_fetch_size(jdbc):
+    jdbc._cursor = _batched_cursor([(i, i) for i in range(6)])
+    
+    batches = list(jdbc.execute_iter('SELECT 1', batch_size=4, fetch_size=2))
+    
+    assert [len(b) for b in batches] == [4, 2]
+    assert all(c[0][0] <= 2 for c in jdbc._cursor.fetchmany.call_args_list)
+
+
+def test_execute_iter_arrow(jdbc):
+    pa = pytest.importorskip('pyarrow')
+    jdbc._cursor = _batched_cursor([(1, 2), (3, 4)])
+    
+    batches = list(jdbc.execute_iter('SELECT 1', batch_size=10, as_arrow=True))
+    
+    assert len(batches) == 1
+    assert isinstance(batches[0], pa.RecordBatch)
+    assert batches[0].num_rows == 2
+
+
+def test_execute_iter_no_results(jdbc):
+    mock_cursor = Mock()
+    mock_cursor.description = None
+    jdbc._cursor = mock_cursor
+    
+    assert list(jdbc.execute_iter('CREATE TABLE test')) == []
+
+
+def test_execute_iter_not_connected(jdbc):
+    with pytest.raises(ConnectionError, match='Not connected'):
+        jdbc.execute_iter('SELECT 1')
+
+
+def test_execute_columnar(jdbc):
+    mock_cursor = Mock()
+    mock_cursor.description = [('col1',)]
+    jdbc._cursor = mock_cursor
+    expected = pd.DataFrame({'col1': [1, 2]})
+    
+    with patch('yavai.connections.jdbc.fetch_columns', return_value=expected) as mock_fetch:
+        result = jdbc.execute('SELECT * FROM table', columnar=True)
+    
+    assert result is expected
+    mock_fetch.assert_called_once_with(mock_cursor)
+    mock_cursor.fetchall.assert_not_called()
+
+
+def test_execute_iter_columnar(jdbc):
+    mock_cursor = Mock()
+    mock_cursor.description = [('col1',)]
+    jdbc._cursor = mock_cursor
+    frames = [pd.DataFrame({'col1': [1, 2]}), pd.DataFrame({'col1': [3]})]
+    
+    with patch('yavai.connections.jdbc.fetch_columns', side_effect=frames):
+        batches = list(jdbc.execute_iter('SELECT 1', batch_size=2, columnar=True))
+    
+    assert [len(b) for b in batches] == [2, 1]
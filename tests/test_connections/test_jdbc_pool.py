@@ -0,0 +1,317 @@
+# tests/test_connections/test_jdbc_pool.py
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+import pandas as pd
+from yavai.connections.jdbc import JDBC, JDBCPool
+
+
+def _factory():
+    def make():
+        conn = Mock()
+        conn.jconn.isValid.return_value = True
+        return conn
+    return Mock(side_effect=make)
+
+
+@pytest.fixture
+def jdbc():
+    with patch('pathlib.Path.mkdir'):
+        return JDBC(auto_download=False)
+
+
+def test_pool_reuses_connections():
+    factory = _factory()
+    pool = JDBCPool(factory, max_size=2)
+    
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    
+    assert first is second
+    assert factory.call_count == 1
+
+
+def test_pool_min_size_opens_up_front():
+    factory = _factory()
+    pool = JDBCPool(factory, min_size=2, max_size=4)
+    
+    assert factory.call_count == 2
+    assert pool.stats() == {'size': 2, 'idle': 2, 'in_use': 0}
+
+
+def test_pool_blocks_at_max_size_and_times_out():
+    pool = JDBCPool(_factory(), max_size=1)
+    conn = pool.acquire()
+    
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+    
+    pool.release(conn)
+    assert pool.acquire(timeout=0.05) is conn
+
+
+def test_pool_waiter_wakes_on_release():
+    pool = JDBCPool(_factory(), max_size=1)
+    conn = pool.acquire()
+    borrowed = []
+    
+    waiter = threading.Thread(target=lambda: borrowed.append(pool.acquire(timeout=2)))
+    waiter.start()
+    time.sleep(0.05)
+    pool.release(conn)
+    waiter.join()
+    
+    assert borrowed == [conn]
+
+
+def test_pool_validation_on_borrow_replaces_invalid():
+    factory = _factory()
+    pool = JDBCPool(factory, max_size=1)
+    stale = pool.acquire()
+    pool.release(stale)
+    stale.jconn.isValid.return_value = False
+    
+    fresh = pool.acquire()
+    
+    assert fresh is not stale
+    stale.close.assert_called_once()
+    assert pool.stats()['size'] == 1
+
+
+def test_pool_validation_query():
+    pool = JDBCPool(_factory(), validation_query='SELECT 1')
+    conn = pool.acquire()
+    pool.release(conn)
+    
+    pool.acquire()
+    
+    conn.cursor.return_value.execute.assert_called_with('SELECT 1')
+
+
+def test_pool_idle_eviction_keeps_min_size():
+    pool = JDBCPool(_factory(), min_size=1, max_size=3, idle_timeout=0.01)
+    conns = [pool.acquire() for _ in range(3)]
+    for conn in conns:
+        pool.release(conn)
+    time.sleep(0.05)
+    
+    pool.acquire()
+    
+    assert pool.stats()['size'] == 1
+    assert sum(c.close.call_count for c in conns) == 2
+
+
+def test_pool_reaps_idle_connections_without_acquire():
+    pool = JDBCPool(_factory(), max_size=3, idle_timeout=0.05)
+    conns = [pool.acquire() for _ in range(3)]
+    for conn in conns:
+        pool.release(conn)
+    
+    deadline = time.monotonic() + 2
+    while pool.stats()['size'] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    
+    assert pool.stats() == {'size': 0, 'idle': 0, 'in_use': 0}
+    assert all(c.close.call_count == 1 for c in conns)
+    pool.close()
+
+
+def test_pool_concurrent_borrowers_respect_max_size():
+    pool = JDBCPool(_factory(), max_size=3)
+    peak = []
+    lock = threading.Lock()
+    
+    def worker():
+        with pool.connection():
+            with lock:
+                peak.append(pool.stats()['in_use'])
+            time.sleep(0.01)
+    
+    threads = [threading.Thread(target=worker) for _ in range(12)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    assert max(peak) <= 3
+    assert pool.stats()['in_use'] == 0
+
+
+def test_pool_close():
+    pool = JDBCPool(_factory(), min_size=2)
+    
+    pool.close()
+    
+    with pytest.raises(RuntimeError, match='closed'):
+        pool.acquire()
+
+
+def test_pool_invalid_sizes():
+    with pytest.raises(ValueError):
+        JDBCPool(_factory(), min_size=3, max_size=2)
+
+
+def test_add_datasource_and_execute(jdbc):
+    conn = Mock()
+    cursor = conn.cursor.return_value
+    cursor.description = [('col1',)]
+    cursor.fetchall.return_value = [(1,), (2,)]
+    
+    with patch.object(jdbc, '_open_connection', return_value=conn) as mock_open:
+        jdbc.add_datasource('warehouse', 'jdbc:postgresql://localhost/db', 'u', 'p')
+        result = jdbc.execute('SELECT 1', datasource='warehouse')
+    
+    mock_open.assert_called_once_with('jdbc:postgresql://localhost/db', 'u', 'p', False)
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 2
+    cursor.close.assert_called_once()
+    assert jdbc._pools['warehouse'].stats()['in_use'] == 0
+
+
+def test_execute_iter_datasource_returns_connection(jdbc):
+    conn = Mock()
+    cursor = conn.cursor.return_value
+    cursor.description = [('col1',)]
+    cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+    
+    with patch.object(jdbc, '_open_connection', return_value=conn):
+        jdbc.add_datasource('warehouse', 'jdbc:postgresql://localhost/db')
+        batches = jdbc.execute_iter('SELECT 1', batch_size=2, datasource='warehouse')
+        assert [len(b) for b in batches] == [2, 1]
+    
+    assert jdbc._pools['warehouse'].stats()['in_use'] == 0
+
+
+def test_unknown_datasource(jdbc):
+    with pytest.raises(ValueError, match='Unknown data source'):
+        jdbc.execute('SELECT 1', datasource='missing')
+
+
+def test_connect_closes_previous_connection(jdbc):
+    old_conn, old_cursor = Mock(), Mock()
+    jdbc._conn, jdbc._cursor = old_conn, old_cursor
+    
+    with patch.object(jdbc, '_open_connection', return_value=Mock()):
+        jdbc.connect('jdbc:postgresql://localhost/db', backend='jdbc')
+    
+    old_cursor.close.assert_called_once()
+    old_conn.close.assert_called_once()
+
+
+def test_close_closes_datasources(jdbc):
+    with patch.object(jdbc, '_open_connection', return_value=Mock()):
+        pool = jdbc.add_datasource('warehouse', 'jdbc:postgresql://localhost/db', min_size=1)
+    
+    jdbc.close()
+    
+    assert jdbc._pools == {}
+    assert pool.stats()['size'] == 0
+
+
+def test_partition_predicates_cover_range():
+    predicates = JDBC._partition_predicates('id', 0, 100, 4)
+    
+    assert predicates == [
+        'id < 25 OR id IS NULL',
+        'id >= 25 AND id < 50',
+        'id >= 50 AND id < 75',
+        'id >= 75',
+    ]
+
+
+def test_partition_predicates_clamps_to_range():
+    assert len(JDBC._partition_predicates('id', 0, 2, 10)) == 2
+    assert JDBC._partition_predicates('id', 5, 5, 4) == ['1=1']
+
+
+def test_partition_predicates_dates():
+    import datetime
+    
+    predicates = JDBC._partition_predicates('d', datetime.date(2024, 1, 1),
+                                            datetime.date(2024, 1, 11), 2)
+    
+    assert predicates == ["d < '2024-01-06' OR d IS NULL", "d >= '2024-01-06'"]
+
+
+def test_partition_predicates_invalid():
+    with pytest.raises(ValueError):
+        JDBC._partition_predicates('id', 10, 0, 2)
+    with pytest.raises(ValueError):
+        JDBC._partition_predicates('id', 0, 10, 0)
+
+
+def test_read_table_runs_partitions_concurrently(jdbc):
+    queries = []
+    active, peak = [0], [0]
+    lock = threading.Lock()
+    
+    def fake_execute(query, columnar=False, datasource=None):
+        with lock:
+            queries.append(query)
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return pd.DataFrame({'id': [len(query)]})
+    
+    with patch.object(jdbc, '_open_connection', return_value=Mock()):
+        jdbc.add_datasource('warehouse', 'jdbc:postgresql://localhost/db', max_size=4)
+    with patch.object(jdbc, 'execute', side_effect=fake_execute):
+        result = jdbc.read_table('big_table', 'id', 0, 100, 4, datasource='warehouse',
+                                 columns=['id', 'name'], where='active')
+    
+    assert len(result) == 4
+    assert peak[0] > 1
+    assert all(q.startswith('SELECT id, name FROM big_table WHERE (') for q in queries)
+    assert all(q.endswith(' AND (active)') for q in queries)
+
+
+def test_read_table_iterator_in_partition_order(jdbc):
+    def fake_execute(query, columnar=False, datasource=None):
+        return pd.DataFrame({'query': [query]})
+    
+    with patch.object(jdbc, '_open_connection', return_value=Mock()):
+        jdbc.add_datasource('warehouse', 'jdbc:postgresql://localhost/db')
+    with patch.object(jdbc, 'execute', side_effect=fake_execute):
+        parts = list(jdbc.read_table('t', 'id', 0, 30, 3, datasource='warehouse',
+                                     as_iterator=True))
+    
+    assert [p['query'][0] for p in parts] == [
+        'SELECT * FROM t WHERE id < 10 OR id IS NULL',
+        'SELECT * FROM t WHERE id >= 10 AND id < 20',
+        'SELECT * FROM t WHERE id >= 20',
+    ]
+
+
+def test_read_table_iterator_bounds_partitions_in_flight(jdbc):
+    executed = []
+    
+    def fake_execute(query, columnar=False, datasource=None):
+        executed.append(query)
+        return pd.DataFrame({'query': [query]})
+    
+    with patch.object(jdbc, '_open_connection', return_value=Mock()):
+        jdbc.add_datasource('warehouse', 'jdbc:postgresql://localhost/db')
+    with patch.object(jdbc, 'execute', side_effect=fake_execute):
+        parts = jdbc.read_table('t', 'id', 0, 60, 6, datasource='warehouse',
+                                as_iterator=True, max_workers=2)
+        next(parts)
+        time.sleep(0.1)
+        
+        assert len(executed) == 3
+        assert len(list(parts)) == 5
+    assert len(executed) == 6
+
+
+def test_read_table_without_datasource_uses_connection(jdbc):
+    jdbc._cursor = Mock()
+    
+    with patch.object(jdbc, 'execute', return_value=pd.DataFrame({'a': [1]})) as mock_exec:
+        result = jdbc.read_table('t', 'id', 0, 10, 2)
+    
+    assert len(result) == 2
+    assert all(c[1]['datasource'] is None for c in mock_exec.call_args_list)
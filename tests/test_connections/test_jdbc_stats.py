@@ -0,0 +1,106 @@
+# tests/test_connections/test_jdbc_stats.py
+import pytest
+from unittest.mock import Mock, patch
+import pandas as pd
+from yavai.connections.instrumentation import QueryProfiler, estimate_bytes
+from yavai.connections.jdbc import JDBC
+
+
+@pytest.fixture
+def jdbc():
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    jdbc._conn = Mock()
+    jdbc._cursor = Mock()
+    jdbc._cursor.description = [('id',), ('name',)]
+    jdbc._cursor.fetchone.return_value = (1, 'a')
+    jdbc._cursor.fetchall.return_value = [(2, 'b'), (3, 'c')]
+    return jdbc
+
+
+def test_stats_disabled_by_default(jdbc):
+    jdbc.execute('SELECT id, name FROM t')
+
+    assert jdbc.get_stats() == []
+    assert jdbc.stats_summary() == {}
+    jdbc._cursor.fetchone.assert_not_called()
+
+
+def test_execute_records_phases(jdbc):
+    jdbc.enable_stats()
+
+    df = jdbc.execute('SELECT id, name FROM t')
+
+    assert df['id'].tolist() == [1, 2, 3]
+    [record] = jdbc.get_stats('query')
+    assert record['query'] == 'SELECT id, name FROM t'
+    assert record['rows'] == 3
+    assert record['bytes'] > 0
+    for phase in ('connect_s', 'execute_s', 'first_row_s', 'fetch_s', 'convert_s', 'total_s'):
+        assert record[phase] >= 0
+    assert record['first_row_s'] <= record['fetch_s']
+    assert record['error'] is None
+
+
+def test_hooks_receive_records(jdbc):
+    seen = []
+    jdbc.add_stats_hook(seen.append)
+    jdbc._cursor.execute.side_effect = [None, RuntimeError('boom')]
+
+    jdbc.execute('SELECT 1')
+    with pytest.raises(RuntimeError):
+        jdbc.execute('SELECT 2')
+
+    assert [r['query'] for r in seen] == ['SELECT 1', 'SELECT 2']
+    assert seen[1]['error'] == 'RuntimeError: boom'
+    assert jdbc.stats_summary()['errors'] == 1
+
+
+def test_failing_hook_does_not_break_query(jdbc):
+    jdbc.enable_stats(hooks=[Mock(side_effect=ValueError('bad hook'))])
+
+    assert len(jdbc.execute('SELECT 1')) == 3
+
+
+def test_execute_iter_records_batches(jdbc):
+    jdbc._cursor.fetchmany.side_effect = [[(1, 'a'), (2, 'b')], [(3, 'c')]]
+    jdbc.enable_stats()
+
+    batches = list(jdbc.execute_iter('SELECT id, name FROM t', batch_size=2))
+
+    assert len(batches) == 2
+    [record] = jdbc.get_stats('iter')
+    assert record['rows'] == 3
+    assert record['first_row_s'] is not None
+    assert record['fetch_s'] >= 0
+
+
+def test_connect_is_recorded(jdbc):
+    jdbc.enable_stats()
+
+    with patch.object(jdbc, '_open_connection', return_value=Mock()):
+        jdbc.connect('jdbc:hive2://localhost:10000/default')
+
+    [record] = jdbc.get_stats('connect')
+    assert record['connect_s'] >= 0
+    assert jdbc.stats_summary()['connects'] == 1
+
+
+def test_profiler_bounded_and_summary():
+    profiler = QueryProfiler(max_records=2)
+    for i in range(3):
+        record = profiler.start('query', f'SELECT {i}')
+        record['execute_s'] = 1.0
+        profiler.finish(record, result=pd.DataFrame({'a': range(10)}))
+
+    assert [r['query'] for r in profiler.records()] == ['SELECT 1', 'SELECT 2']
+    summary = profiler.summary()
+    assert summary['queries'] == 2
+    assert summary['execute_s'] == 2.0
+    assert summary['rows'] == 20
+
+
+def test_estimate_bytes_extrapolates():
+    df = pd.DataFrame({'a': range(5000)})
+
+    assert estimate_bytes(df) == 5000 * 8
@@ -0,0 +1,145 @@
+# tests/test_connections/test_jdbc_write.py
+import pytest
+from unittest.mock import Mock, patch
+import numpy as np
+import pandas as pd
+from yavai.connections.jdbc import JDBC
+
+
+@pytest.fixture
+def jdbc():
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    jdbc._conn = Mock()
+    jdbc._cursor = Mock()
+    jdbc._url = 'jdbc:postgresql://localhost:5432/db'
+    return jdbc
+
+
+@pytest.fixture
+def scores():
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'score': [0.5, np.nan, 0.9],
+        'label': ['a', None, 'c'],
+        'flag': [True, False, True],
+        'ts': pd.to_datetime(['2024-01-01', None, '2024-01-03']),
+    })
+
+
+def _executed(conn):
+    return [c[0][0] for c in conn.cursor.return_value.execute.call_args_list]
+
+
+def test_create_table_sql_postgres(jdbc, scores):
+    sql = jdbc._create_table_sql(scores, 'scores', 'postgresql')
+    
+    assert sql == ('CREATE TABLE IF NOT EXISTS scores (id BIGINT, score DOUBLE PRECISION, '
+                   'label TEXT, flag BOOLEAN, ts TIMESTAMP)')
+
+
+def test_create_table_sql_hive(jdbc, scores):
+    sql = jdbc._create_table_sql(scores, 'scores', 'hive')
+    
+    assert 'label STRING' in sql
+    assert 'score DOUBLE,' in sql
+
+
+def test_write_dataframe_append_batches(jdbc, scores):
+    written = jdbc.write_dataframe(scores, 'scores', batch_size=2)
+    
+    cursor = jdbc._conn.cursor.return_value
+    assert written == 3
+    assert _executed(jdbc._conn) == [jdbc._create_table_sql(scores, 'scores', 'postgresql')]
+    assert cursor.executemany.call_count == 2
+    sql, rows = cursor.executemany.call_args_list[0][0]
+    assert sql == 'INSERT INTO scores (id, score, label, flag, ts) VALUES (?, ?, ?, ?, ?)'
+    assert rows[0][:4] == (1, 0.5, 'a', True)
+    assert rows[1][1] is None and rows[1][2] is None and rows[1][4] is None
+    assert type(rows[0][0]) is int
+    assert jdbc._conn.commit.call_count >= 2
+    jdbc._conn.jconn.setAutoCommit.assert_any_call(False)
+
+
+def test_write_dataframe_hive_uses_multi_row_inserts(jdbc, scores):
+    jdbc._url = 'jdbc:hive2://hive:10000/default'
+    cursor = jdbc._conn.cursor.return_value
+    cursor.executemany.side_effect = Exception(
+        'java.sql.SQLFeatureNotSupportedException: Method not supported')
+    
+    written = jdbc.write_dataframe(scores[['id', 'label']], 'scores', batch_size=2)
+    
+    assert written == 3
+    cursor.executemany.assert_not_called()
+    inserts = [c[0] for c in cursor.execute.call_args_list if c[0][0].startswith('INSERT')]
+    assert inserts[0] == ('INSERT INTO TABLE scores (id, label) VALUES (?, ?), (?, ?)',
+                          [1, 'a', 2, None])
+    assert inserts[1] == ('INSERT INTO TABLE scores (id, label) VALUES (?, ?)', [3, 'c'])
+
+
+def test_write_dataframe_overwrite_drops_table(jdbc, scores):
+    jdbc.write_dataframe(scores, 'scores', mode='overwrite')
+    
+    executed = _executed(jdbc._conn)
+    assert executed[0] == 'DROP TABLE IF EXISTS scores'
+    assert executed[1].startswith('CREATE TABLE IF NOT EXISTS scores')
+
+
+def test_write_dataframe_rolls_back_failed_batch(jdbc, scores):
+    jdbc._conn.cursor.return_value.executemany.side_effect = RuntimeError('constraint')
+    
+    with pytest.raises(RuntimeError):
+        jdbc.write_dataframe(scores, 'scores', create=False)
+    
+    jdbc._conn.rollback.assert_called_once()
+    jdbc._conn.jconn.setAutoCommit.assert_called_with(True)
+
+
+def test_write_dataframe_without_transactions(jdbc, scores):
+    jdbc._conn.jconn.setAutoCommit.side_effect = Exception('not supported')
+    
+    written = jdbc.write_dataframe(scores, 'scores', create=False)
+    
+    assert written == 3
+    jdbc._conn.commit.assert_not_called()
+
+
+def test_write_dataframe_parallel_uses_pool(jdbc):
+    df = pd.DataFrame({'id': range(10)})
+    connections = []
+    
+    def open_conn(*args):
+        conn = Mock()
+        connections.append(conn)
+        return conn
+    
+    with patch.object(jdbc, '_open_connection', side_effect=open_conn):
+        jdbc.add_datasource('pg', 'jdbc:postgresql://localhost/db', max_size=4)
+        written = jdbc.write_dataframe(df, 'ids', batch_size=2, datasource='pg', parallel=3)
+    
+    inserted = sorted(
+        row[0]
+        for conn in connections
+        for call in conn.cursor.return_value.executemany.call_args_list
+        for row in call[0][1]
+    )
+    assert written == 10
+    assert inserted == list(range(10))
+
+
+def test_write_dataframe_invalid_mode(jdbc, scores):
+    with pytest.raises(ValueError, match='mode'):
+        jdbc.write_dataframe(scores, 'scores', mode='upsert')
+
+
+def test_write_dataframe_parallel_requires_datasource(jdbc, scores):
+    with pytest.raises(ValueError, match='datasource'):
+        jdbc.write_dataframe(scores, 'scores', parallel=2)
+
+
+def test_write_dataframe_not_connected(scores):
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    
+    with pytest.raises(ConnectionError):
+        jdbc.write_dataframe(scores, 'scores')
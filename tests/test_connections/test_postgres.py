@@ -0,0 +1,301 @@
+# tests/test_connections/test_postgres.py
+import os
+import threading
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+import pandas as pd
+from yavai.connections.jdbc import JDBC
+from yavai.connections.postgres import OID_ARROW_TYPES, PostgresBackend
+
+COPY_OUTPUT = (
+    b'id,score,label,active,created_at\n'
+    b'1,0.5,a,t,2024-01-01 10:00:00\n'
+    b'2,\\N,"",f,\\N\n'
+    b'3,1.5,\\N,\\N,2024-01-03 12:30:00\n'
+)
+
+DESCRIPTION = [('id', 23), ('score', 701), ('label', 25), ('active', 16), ('created_at', 1114)]
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.conn.executed.append(sql)
+        self.description = DESCRIPTION if 'LIMIT 0' in sql else None
+
+    def copy_expert(self, sql, buf):
+        self.conn.copies.append(sql)
+        if 'TO STDOUT' in sql:
+            buf.write(self.conn.copy_output)
+        else:
+            self.conn.loaded.append(buf.read())
+
+
+@pytest.fixture
+def backend():
+    conn = MagicMock()
+    conn.executed, conn.copies, conn.loaded = [], [], []
+    conn.copy_output = COPY_OUTPUT
+    conn.cursor.side_effect = lambda: FakeCursor(conn)
+    with patch('psycopg2.connect', return_value=conn) as mock_connect:
+        backend = PostgresBackend('jdbc:postgresql://db.example.com:5433/sales?sslmode=require',
+                                  'user', 'secret')
+    backend.mock_connect = mock_connect
+    return backend
+
+
+def test_parse_url():
+    params = PostgresBackend.parse_url(
+        'jdbc:postgresql://db.example.com:5433/sales?sslmode=require&currentSchema=mart'
+        '&ApplicationName=etl&loginTimeout=5'
+    )
+
+    assert params == {
+        'host': 'db.example.com', 'port': '5433', 'dbname': 'sales', 'sslmode': 'require',
+        'options': '-c search_path=mart', 'application_name': 'etl',
+    }
+
+
+def test_connect_passes_credentials(backend):
+    backend.mock_connect.assert_called_once_with(
+        host='db.example.com', port='5433', dbname='sales', sslmode='require',
+        user='user', password='secret'
+    )
+
+
+def test_returns_rows():
+    assert PostgresBackend.returns_rows('  select 1')
+    assert PostgresBackend.returns_rows('-- recent\nWITH t AS (SELECT 1) SELECT * FROM t')
+    assert not PostgresBackend.returns_rows('DELETE FROM t')
+    assert not PostgresBackend.returns_rows('CREATE TABLE t (id INT)')
+
+
+def test_execute_uses_copy_with_typed_columns(backend):
+    df = backend.execute('SELECT * FROM sales;')
+
+    assert backend._conn.copies == [
+        "COPY (SELECT * FROM sales\n) TO STDOUT WITH (FORMAT csv, HEADER true, NULL '\\N')"
+    ]
+    assert list(df.columns) == ['id', 'score', 'label', 'active', 'created_at']
+    assert df['id'].tolist() == [1, 2, 3]
+    assert pd.isna(df['score'][1])
+    assert df['label'][1] == ''
+    assert pd.isna(df['label'][2])
+    assert df['active'].tolist()[:2] == [True, False]
+    assert pd.api.types.is_datetime64_any_dtype(df['created_at'])
+    assert pd.isna(df['created_at'][1])
+
+
+def test_execute_wraps_queries_ending_in_a_comment(backend):
+    backend.execute('SELECT * FROM sales -- all of it')
+
+    assert backend._conn.executed == [
+        'SELECT * FROM (SELECT * FROM sales -- all of it\n) AS _yavai_q LIMIT 0'
+    ]
+    assert backend._conn.copies[0].startswith('COPY (SELECT * FROM sales -- all of it\n) TO')
+
+
+def test_convert_options_for_every_oid_type():
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    names = {f'c{oid}': arrow_type for oid, arrow_type in OID_ARROW_TYPES.items()}
+    options = PostgresBackend._convert_options(pa_csv, names)
+
+    assert options.column_types['c1184'] == pa.timestamp('us', tz='UTC')
+    assert options.column_types['c1082'] == pa.date32()
+    body = ','.join(names) + '\n' + ','.join(['\\N'] * len(names)) + '\n'
+    table = pa_csv.read_csv(pa.py_buffer(body.encode()), convert_options=options)
+    assert table.num_rows == 1
+
+
+def test_execute_non_row_statement(backend):
+    assert backend.execute('DELETE FROM sales WHERE id = 1') is None
+
+    assert backend._conn.executed == ['DELETE FROM sales WHERE id = 1']
+    assert backend._conn.copies == []
+
+
+def test_execute_iter_batches(backend):
+    batches = list(backend.execute_iter('SELECT * FROM sales', batch_size=2))
+
+    assert [len(b) for b in batches] == [2, 1]
+    assert batches[1]['id'].tolist() == [3]
+
+
+def test_execute_iter_yields_before_copy_finishes(backend):
+    finish = threading.Event()
+    header, row = COPY_OUTPUT.splitlines(keepends=True)[:2]
+
+    class StreamingCursor(FakeCursor):
+        def copy_expert(self, sql, buf):
+            buf.write(header + row * 10)
+            assert finish.wait(5)
+            buf.write(row * 10)
+
+    backend._conn.cursor.side_effect = lambda: StreamingCursor(backend._conn)
+
+    with patch('yavai.connections.postgres.STREAM_CHUNK_SIZE', 64):
+        batches = backend.execute_iter('SELECT * FROM sales', batch_size=2, as_arrow=True)
+        first = next(batches)
+        finish.set()
+        rest = list(batches)
+
+    assert first.num_rows == 2
+    assert sum(b.num_rows for b in rest) == 18
+
+
+def test_execute_iter_cancels_copy_when_abandoned(backend):
+    class EndlessCursor(FakeCursor):
+        def copy_expert(self, sql, buf):
+            while not backend._conn.cancel.called:
+                buf.write(b'1,0.5,a,t,2024-01-01 10:00:00\n' * 1000)
+            raise RuntimeError('canceling statement due to user request')
+
+    backend._conn.cursor.side_effect = lambda: EndlessCursor(backend._conn)
+
+    batches = backend.execute_iter('SELECT * FROM sales', batch_size=2, as_arrow=True)
+    next(batches)
+    batches.close()
+
+    backend._conn.cancel.assert_called_once()
+    backend._conn.rollback.assert_called()
+
+
+def test_execute_iter_runs_non_row_statements(backend):
+    assert list(backend.execute_iter('DELETE FROM sales WHERE id = 1')) == []
+
+    assert backend._conn.executed == ['DELETE FROM sales WHERE id = 1']
+    assert backend._conn.copies == []
+
+
+def test_execute_iter_arrow(backend):
+    import pyarrow as pa
+
+    batches = list(backend.execute_iter('SELECT * FROM sales', batch_size=10, as_arrow=True))
+
+    assert len(batches) == 1
+    assert isinstance(batches[0], pa.RecordBatch)
+    assert batches[0].schema.field('id').type == pa.int32()
+
+
+def test_write_dataframe_copies_batches(backend):
+    df = pd.DataFrame({'id': [1, 2, 3], 'label': ['a', None, 'c']})
+
+    create_sql = 'CREATE TABLE IF NOT EXISTS sales (id BIGINT, label TEXT)'
+
+    written = backend.write_dataframe(df, 'sales', mode='overwrite', batch_size=2,
+                                      create_sql=create_sql)
+
+    assert written == 3
+    assert backend._conn.executed == [
+        'DROP TABLE IF EXISTS sales', 'CREATE TABLE IF NOT EXISTS sales (id BIGINT, label TEXT)'
+    ]
+    assert backend._conn.copies == ["COPY sales (id, label) FROM STDIN WITH (FORMAT csv)"] * 2
+    assert backend._conn.loaded == ['"1","a"\n"2",\n', '"3","c"\n']
+
+
+def test_write_dataframe_keeps_marker_strings_and_offsets(backend):
+    df = pd.DataFrame({
+        'label': ['\\N', '', 'say "hi", twice'],
+        'at': pd.to_datetime(['2024-01-01 10:00:00.0', None, '2024-01-01 23:30:00.5'])
+              .tz_localize('Asia/Jakarta'),
+    })
+
+    backend.write_dataframe(df, 'sales')
+
+    assert backend._conn.loaded == [
+        '"\\N","2024-01-01 03:00:00.000000+00"\n'
+        '"",\n'
+        '"say ""hi"", twice","2024-01-01 16:30:00.500000+00"\n'
+    ]
+
+
+def test_execute_matches_jdbc_dtypes(backend):
+    df = backend.execute('SELECT * FROM sales')
+
+    assert str(df['id'].dtype) == 'int64'
+    assert str(df['active'].dtype) == 'boolean'
+    backend._conn.copy_output = COPY_OUTPUT.replace(b'\n2,', b'\n\\N,')
+
+    df = backend.execute('SELECT * FROM sales')
+
+    assert str(df['id'].dtype) == 'Int64'
+    assert df['id'].tolist()[::2] == [1, 3]
+
+
+def test_execute_iter_without_pyarrow(backend):
+    with patch.dict('sys.modules', {'pyarrow': None, 'pyarrow.csv': None}):
+        batches = list(backend.execute_iter('SELECT * FROM sales', batch_size=2))
+
+    assert [len(b) for b in batches] == [2, 1]
+    assert str(batches[0]['id'].dtype) == 'int64'
+    assert batches[0]['active'].tolist() == [True, False]
+    assert pd.api.types.is_datetime64_any_dtype(batches[1]['created_at'])
+
+
+def test_jdbc_auto_selects_native_for_postgres():
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    backend = Mock()
+
+    with patch('yavai.connections.postgres.PostgresBackend',
+               return_value=backend) as mock_backend, \
+            patch.object(jdbc, '_open_connection') as mock_open:
+        jdbc.connect('jdbc:postgresql://localhost/db', 'u', 'p')
+        jdbc.execute('SELECT 1')
+        jdbc.close()
+
+    mock_backend.assert_called_once_with('jdbc:postgresql://localhost/db', 'u', 'p')
+    mock_open.assert_not_called()
+    backend.execute.assert_called_once_with('SELECT 1')
+    backend.close.assert_called_once()
+
+
+def test_jdbc_backend_jdbc_keeps_jvm_path():
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+
+    with patch.object(jdbc, '_open_connection', return_value=Mock()) as mock_open:
+        jdbc.connect('jdbc:postgresql://localhost/db', backend='jdbc')
+
+    mock_open.assert_called_once()
+    assert jdbc._backend is None
+
+
+@pytest.mark.skipif(not os.environ.get('YAVAI_TEST_POSTGRES_URL'),
+                    reason='set YAVAI_TEST_POSTGRES_URL to a jdbc:postgresql:// URL to run')
+def test_round_trip_live_postgres():
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    jdbc.connect(os.environ['YAVAI_TEST_POSTGRES_URL'],
+                 os.environ.get('YAVAI_TEST_POSTGRES_USER'),
+                 os.environ.get('YAVAI_TEST_POSTGRES_PASSWORD'))
+    df = pd.DataFrame({
+        'id': [1, 2, 3],
+        'score': [0.5, None, 1.5],
+        'label': ['a', '', None],
+        'ts': pd.to_datetime(['2024-01-01', None, '2024-01-03']),
+    })
+    try:
+        assert jdbc.write_dataframe(df, 'yavai_copy_test', mode='overwrite') == 3
+        result = jdbc.execute('SELECT * FROM yavai_copy_test ORDER BY id')
+        batches = list(jdbc.execute_iter('SELECT * FROM yavai_copy_test ORDER BY id', batch_size=2))
+    finally:
+        jdbc.execute('DROP TABLE IF EXISTS yavai_copy_test')
+        jdbc.close()
+
+    assert result['id'].tolist() == [1, 2, 3]
+    assert result['label'][1] == ''
+    assert pd.isna(result['label'][2])
+    assert pd.isna(result['ts'][1])
+    assert [len(b) for b in batches] == [2, 1]
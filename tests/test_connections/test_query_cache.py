@@ -0,0 +1,103 @@
+# tests/test_connections/test_query_cache.py
+import os
+import pytest
+from unittest.mock import Mock, patch
+import pandas as pd
+from yavai.connections.jdbc import JDBC
+from yavai.connections.query_cache import QueryCache, normalize_sql
+
+URL = 'jdbc:hive2://localhost:10000/default'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return QueryCache(cache_dir=str(tmp_path))
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', None]})
+
+
+def test_normalize_sql_keeps_literals():
+    sql = "SELECT *\n  FROM t -- all\nWHERE x = 'a  b';"
+
+    assert normalize_sql(sql) == "SELECT * FROM t WHERE x = 'a  b'"
+
+
+def test_key_ignores_formatting_but_not_url(cache):
+    assert cache.key(URL, 'SELECT 1') == cache.key(URL, '  SELECT   1 ;')
+    assert cache.key(URL, 'SELECT 1') != cache.key('jdbc:postgresql://db/x', 'SELECT 1')
+
+
+def test_put_get_round_trip(cache, frame):
+    assert cache.get(URL, 'SELECT * FROM t') is None
+
+    assert cache.put(URL, 'SELECT * FROM t', frame)
+    result = cache.get(URL, 'SELECT  * FROM t')
+
+    assert result['id'].tolist() == [1, 2, 3]
+    assert pd.isna(result['name'][2])
+    assert cache.stats()['entries'] == 1
+
+
+def test_expired_entry_is_removed(cache, frame):
+    cache.put(URL, 'SELECT 1', frame)
+    cache.ttl = 60
+
+    with patch('yavai.connections.query_cache.time.time', return_value=10 ** 12):
+        assert cache.get(URL, 'SELECT 1') is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_evicts_least_recently_used(cache, frame):
+    for i in range(3):
+        cache.put(URL, f'SELECT {i}', frame)
+        data_path = cache.cache_dir / f"{cache.key(URL, f'SELECT {i}')}.parquet"
+        os.utime(data_path, (1000 + i, 1000 + i))
+    cache.get(URL, 'SELECT 0')
+    entry_size = data_path.stat().st_size
+
+    cache.max_bytes = entry_size * 2
+    cache.evict()
+
+    assert cache.get(URL, 'SELECT 1') is None
+    assert cache.get(URL, 'SELECT 0') is not None
+    assert cache.get(URL, 'SELECT 2') is not None
+
+
+def test_invalidate(cache, frame):
+    cache.put(URL, 'SELECT 1', frame)
+    cache.put(URL, 'SELECT 2', frame)
+    cache.put('jdbc:postgresql://db/x', 'SELECT 1', frame)
+
+    assert cache.invalidate(URL, 'SELECT 1') == 1
+    assert cache.invalidate(URL) == 1
+    assert cache.stats()['entries'] == 1
+    assert cache.invalidate() == 1
+
+
+def test_unwritable_frame_is_not_cached(cache):
+    df = pd.DataFrame({'mixed': [1, 'a', object()]})
+
+    assert not cache.put(URL, 'SELECT 1', df)
+    assert cache.stats()['entries'] == 0
+
+
+def test_jdbc_execute_uses_cache(tmp_path, frame):
+    with patch('pathlib.Path.mkdir'):
+        jdbc = JDBC(auto_download=False)
+    jdbc._conn, jdbc._cursor, jdbc._url = Mock(), Mock(), URL
+    jdbc._cursor.fetchall.return_value = [(1, 'a')]
+    jdbc._cursor.description = [('id',), ('name',)]
+    jdbc.enable_cache(cache_dir=str(tmp_path), ttl=3600)
+
+    first = jdbc.execute('SELECT id, name FROM t')
+    second = jdbc.execute('SELECT id, name FROM t')
+    jdbc.execute('SELECT id, name FROM t', use_cache=False)
+
+    assert jdbc._cursor.execute.call_count == 2
+    assert second.equals(first)
+    assert jdbc.invalidate_cache('SELECT id, name FROM t') == 1
+    jdbc.execute('SELECT id, name FROM t')
+    assert jdbc._cursor.execute.call_count == 3
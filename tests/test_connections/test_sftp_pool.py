@@ -0,0 +1,177 @@
+# tests/test_connections/test_sftp_pool.py
+import time
+import pytest
+from unittest.mock import Mock, patch
+from yavai.connections import sftp as sftp_module
+from yavai.connections.sftp import SFTPClient, SSHSessionPool
+
+
+def _ssh(active=True):
+    ssh = Mock()
+    ssh.get_transport.return_value.is_active.return_value = active
+    return ssh
+
+
+@pytest.fixture
+def connect():
+    with patch('yavai.connections.sftp._connect_ssh',
+               side_effect=lambda *a: _ssh()) as mock_connect:
+        yield mock_connect
+
+
+def test_acquire_reuses_transport(connect):
+    pool = SSHSessionPool()
+
+    first = pool.acquire('host', 'user', 'pw')
+    second = pool.acquire('host', 'user', 'pw')
+    other = pool.acquire('host', 'other', 'pw')
+
+    assert first is second
+    assert other is not first
+    assert connect.call_count == 2
+    assert pool.stats() == {'transports': 2, 'in_use': 3, 'idle': 0}
+
+
+def test_max_channels_opens_another_transport(connect):
+    pool = SSHSessionPool(max_channels=2)
+
+    clients = [pool.acquire('host', 'user', 'pw') for _ in range(3)]
+
+    assert clients[0] is clients[1]
+    assert clients[2] is not clients[0]
+
+
+def test_dead_transport_is_replaced(connect):
+    pool = SSHSessionPool()
+    first = pool.acquire('host', 'user', 'pw')
+    pool.release(first)
+    first.get_transport.return_value.is_active.return_value = False
+
+    second = pool.acquire('host', 'user', 'pw')
+
+    assert second is not first
+    first.close.assert_called_once()
+    assert pool.stats()['transports'] == 1
+
+
+def test_idle_transports_are_evicted(connect):
+    pool = SSHSessionPool(idle_timeout=0)
+    first = pool.acquire('host', 'user', 'pw')
+    pool.release(first)
+
+    pool.acquire('other-host', 'user', 'pw')
+
+    first.close.assert_called_once()
+
+
+def test_idle_transports_are_reaped_without_acquire(connect):
+    pool = SSHSessionPool(idle_timeout=0.05)
+    ssh = pool.acquire('host', 'user', 'pw')
+    pool.release(ssh)
+
+    deadline = time.monotonic() + 5
+    while pool.stats()['transports'] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    ssh.close.assert_called_once()
+    assert pool.stats()['transports'] == 0
+    assert pool._reaper is None
+
+
+def test_sftp_context_closes_channel_only(connect):
+    pool = SSHSessionPool()
+
+    with pool.sftp('host', 'user', 'pw') as channel:
+        ssh = pool.acquire('host', 'user', 'pw')
+        assert channel is ssh.open_sftp.return_value
+
+    channel.close.assert_called_once()
+    ssh.close.assert_not_called()
+    assert pool.stats()['in_use'] == 1
+
+
+def test_connect_with_reuse_shares_transport(connect):
+    with patch.object(sftp_module, 'session_pool', SSHSessionPool()) as pool:
+        a = SFTPClient().connect('host', 'user', 'pw', reuse=True)
+        b = SFTPClient().connect('host', 'user', 'pw', reuse=True)
+        shared = a.ssh
+        assert b.ssh is shared
+        a.close()
+        b.close()
+
+        assert connect.call_count == 1
+        assert shared.open_sftp.call_count == 2
+        shared.close.assert_not_called()
+        assert pool.stats() == {'transports': 1, 'in_use': 0, 'idle': 1}
+
+
+def test_connect_enables_keepalive():
+    with patch('paramiko.SSHClient') as mock_ssh_class:
+        client = SFTPClient().connect('host', 'user', 'pw', keepalive=15)
+
+    mock_ssh_class.return_value.get_transport.return_value.set_keepalive.assert_called_once_with(15)
+    assert client._pooled is False
+
+
+def test_operations_reconnect_dropped_session():
+    client = SFTPClient()
+    client.ssh = _ssh(active=False)
+    client._params = {'hostname': 'h', 'port': 22, 'username': 'u', 'password': 'p'}
+    dropped = client.ssh
+    fresh = _ssh()
+
+    with patch('yavai.connections.sftp._connect_ssh', return_value=fresh):
+        client.list_files('/in')
+
+    dropped.close.assert_called_once()
+    assert client.ssh is fresh
+    fresh.open_sftp.return_value.listdir.assert_called_once_with('/in')
+
+
+def test_transports_are_not_shared_across_passwords(connect):
+    pool = SSHSessionPool()
+
+    first = pool.acquire('host', 'user', 'pw')
+    second = pool.acquire('host', 'user', 'wrong')
+
+    assert second is not first
+    assert all('pw' not in key for key in pool._sessions)
+
+
+def test_acquire_reserves_channels(connect):
+    pool = SSHSessionPool(max_channels=10)
+
+    first = pool.acquire('host', 'user', 'pw', channels=8)
+    second = pool.acquire('host', 'user', 'pw', channels=3)
+    pool.release(first, 8)
+    third = pool.acquire('host', 'user', 'pw', channels=9)
+
+    assert second is not first
+    assert third is first
+    with pytest.raises(ValueError):
+        pool.acquire('host', 'user', 'pw', channels=11)
+
+
+def test_pooled_parallel_channels_stay_within_max_channels(connect):
+    with patch.object(sftp_module, 'session_pool', SSHSessionPool(max_channels=10)) as pool:
+        a = SFTPClient().connect('host', 'user', 'pw', reuse=True)
+        b = SFTPClient().connect('host', 'user', 'pw', reuse=True)
+
+        with a._channels(8) as channels_a, b._channels(8) as channels_b:
+            per_transport = {}
+            for channels in (channels_a, channels_b):
+                for ssh, _ in list(channels.queue):
+                    per_transport[ssh] = per_transport.get(ssh, 0) + 1
+            per_transport[a.ssh] += 2
+
+            assert all(count <= 10 for count in per_transport.values())
+            assert sum(entry['refs'] for entries in pool._sessions.values()
+                       for entry in entries) == 18
+
+        a.close()
+        b.close()
+
+        assert pool.stats()['in_use'] == 0
+        for entries in pool._sessions.values():
+            for entry in entries:
+                entry['ssh'].close.assert_not_called()
@@ -0,0 +1,426 @@
+# tests/test_connections/test_sftp_transfer.py
+import hashlib
+import gzip
+import json
+import os
+import shutil
+import pytest
+from unittest.mock import Mock, patch
+import pandas as pd
+import paramiko
+from yavai.connections.sftp import SFTPClient, SFTPStream
+
+
+class FakeSFTPFile:
+    """Local file with the SFTPFile extras used by the large-file paths."""
+
+    def __init__(self, path, mode):
+        self._f = open(path, mode)
+        self.pipelined = False
+        self.readv_calls = 0
+
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(os.fstat(self._f.fileno()))
+
+    def readv(self, chunks, max_concurrent_prefetch_requests=None):
+        self.readv_calls += 1
+        for offset, length in chunks:
+            self._f.seek(offset)
+            yield self._f.read(length)
+
+    def check(self, hash_algorithm, offset=0, length=0, block_size=0):
+        self._f.seek(0)
+        return hashlib.new(hash_algorithm, self._f.read()).digest()
+
+    def set_pipelined(self, pipelined=True):
+        self.pipelined = pipelined
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._f.close()
+
+
+class FakeSFTP:
+    """SFTP session backed by a local directory standing in for the server."""
+
+    def __init__(self, root, fail_times=None):
+        self.root = root
+        self.fail_times = fail_times if fail_times is not None else {}
+        self.closed = False
+
+    def _local(self, path):
+        return os.path.join(self.root, path.lstrip('/'))
+
+    def listdir_attr(self, path):
+        result = []
+        for name in sorted(os.listdir(self._local(path))):
+            attr = paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(self._local(path), name)))
+            attr.filename = name
+            result.append(attr)
+        return result
+
+    def stat(self, path):
+        return paramiko.SFTPAttributes.from_stat(os.stat(self._local(path)))
+
+    def mkdir(self, path):
+        os.mkdir(self._local(path))
+
+    def _maybe_fail(self, path):
+        if self.fail_times.get(path, 0) > 0:
+            self.fail_times[path] -= 1
+            raise EOFError('connection reset')
+
+    def get(self, remote_path, local_path, callback=None):
+        self._maybe_fail(remote_path)
+        shutil.copyfile(self._local(remote_path), local_path)
+
+    def put(self, local_path, remote_path, callback=None):
+        self._maybe_fail(remote_path)
+        shutil.copyfile(local_path, self._local(remote_path))
+
+    def open(self, path, mode='r'):
+        self._maybe_fail(path)
+        return FakeSFTPFile(self._local(path), mode)
+
+    def close(self):
+        self.closed = True
+
+
+def _connected_client(root, fail_times=None):
+    client = SFTPClient()
+    client.ssh = Mock()
+    client.sftp = FakeSFTP(root, fail_times)
+    client._params = {'hostname': 'h', 'port': 22, 'username': 'u', 'password': 'p'}
+    client.ssh.open_sftp.side_effect = lambda: FakeSFTP(root, fail_times)
+    return client
+
+
+@pytest.fixture
+def remote(tmp_path):
+    root = tmp_path / 'remote'
+    (root / 'drop' / 'nested' / 'deeper').mkdir(parents=True)
+    (root / 'drop' / 'a.csv').write_bytes(b'a' * 100)
+    (root / 'drop' / 'nested' / 'b.csv').write_bytes(b'b' * 200)
+    (root / 'drop' / 'nested' / 'deeper' / 'c.csv').write_bytes(b'c' * 300)
+    return root
+
+
+def test_connect_stores_params():
+    with patch('paramiko.SSHClient'):
+        client = SFTPClient().connect('host', 'user', 'pass', port=2222)
+
+    assert client._params == {'hostname': 'host', 'port': 2222, 'username': 'user',
+                              'password': 'pass'}
+
+
+def test_walk_is_recursive(remote):
+    client = _connected_client(str(remote))
+
+    paths = sorted(path for path, _ in client.walk('/drop'))
+
+    assert paths == ['/drop/a.csv', '/drop/nested/b.csv', '/drop/nested/deeper/c.csv']
+
+
+def test_download_dir(remote, tmp_path):
+    client = _connected_client(str(remote))
+    seen = []
+
+    stats = client.download_dir('/drop', str(tmp_path / 'local'), workers=3, progress=seen.append)
+
+    assert (tmp_path / 'local' / 'nested' / 'deeper' / 'c.csv').read_bytes() == b'c' * 300
+    assert stats['files_done'] == 3
+    assert stats['bytes_done'] == 600
+    assert stats['failed'] == []
+    assert len(seen) == 3
+    assert not list((tmp_path / 'local').rglob('*.part'))
+    remote_mtime = os.stat(remote / 'drop' / 'a.csv').st_mtime
+    assert int(os.stat(tmp_path / 'local' / 'a.csv').st_mtime) == int(remote_mtime)
+
+
+def test_download_dir_retries_failed_files(remote, tmp_path):
+    client = _connected_client(str(remote), fail_times={'/drop/a.csv': 1, '/drop/nested/b.csv': 5})
+    client.ssh.get_transport.return_value.is_active.return_value = True
+
+    with patch('yavai.connections.sftp.time.sleep'):
+        stats = client.download_dir('/drop', str(tmp_path / 'local'), workers=2, retries=2)
+
+    assert stats['files_done'] == 2
+    assert stats['retries'] == 3
+    assert [path for path, _ in stats['failed']] == ['/drop/nested/b.csv']
+    assert (tmp_path / 'local' / 'a.csv').exists()
+
+
+def test_download_dir_spreads_over_transports(remote, tmp_path):
+    client = _connected_client(str(remote))
+    extra = Mock()
+    extra.open_sftp.side_effect = lambda: FakeSFTP(str(remote))
+
+    with patch.object(client, '_new_ssh', return_value=extra) as mock_new:
+        stats = client.download_dir('/drop', str(tmp_path / 'local'), workers=2, transports=2)
+
+    assert stats['files_done'] == 3
+    mock_new.assert_called_once()
+    extra.open_sftp.assert_called_once()
+    extra.close.assert_called_once()
+    client.ssh.close.assert_not_called()
+
+
+def test_upload_dir(remote, tmp_path):
+    local = tmp_path / 'outgoing'
+    (local / 'sub').mkdir(parents=True)
+    (local / 'x.txt').write_bytes(b'x' * 10)
+    (local / 'sub' / 'y.txt').write_bytes(b'y' * 20)
+    client = _connected_client(str(remote))
+
+    stats = client.upload_dir(str(local), '/inbox/batch', workers=2)
+
+    assert (remote / 'inbox' / 'batch' / 'sub' / 'y.txt').read_bytes() == b'y' * 20
+    assert stats['files_done'] == 2
+    assert stats['bytes_done'] == 30
+
+
+def test_download_large_in_chunks(remote, tmp_path):
+    payload = os.urandom(10_000)
+    (remote / 'big.bin').write_bytes(payload)
+    client = _connected_client(str(remote))
+    target = tmp_path / 'big.bin'
+
+    with patch('paramiko.SFTPClient.from_transport',
+               side_effect=lambda t, **kw: FakeSFTP(str(remote))) as mock_open:
+        stats = client.download_large('/big.bin', str(target), workers=3, chunk_size=3000,
+                                      window_size=2 ** 24, max_packet_size=2 ** 16)
+
+    assert target.read_bytes() == payload
+    assert not (tmp_path / 'big.bin.part').exists()
+    assert stats['files'] == 4
+    assert stats['bytes_done'] == 10_000
+    assert mock_open.call_count == 3
+    assert mock_open.call_args.kwargs == {'window_size': 2 ** 24, 'max_packet_size': 2 ** 16}
+
+
+def test_download_large_on_paramiko_without_readv_bound(remote, tmp_path):
+    payload = os.urandom(5000)
+    (remote / 'big.bin').write_bytes(payload)
+    client = _connected_client(str(remote))
+
+    calls = []
+
+    def readv(self, chunks):
+        calls.append(list(chunks))
+        for offset, length in chunks:
+            self._f.seek(offset)
+            yield self._f.read(length)
+
+    with patch('yavai.connections.sftp._READV_BOUNDED', False), \
+            patch('yavai.connections.sftp._READV_REQUEST_SIZE', 100), \
+            patch.object(FakeSFTPFile, 'readv', readv), \
+            patch('paramiko.SFTPClient.from_transport',
+                  side_effect=lambda t, **kw: FakeSFTP(str(remote))):
+        client.download_large('/big.bin', str(tmp_path / 'big.bin'), workers=2,
+                              chunk_size=2000, requests=4)
+
+    assert (tmp_path / 'big.bin').read_bytes() == payload
+    assert len(calls) == 13
+    assert all(len(c) <= 4 and all(n <= 100 for _, n in c) for c in calls)
+
+
+def test_readv_windowed_reassembles_chunks():
+    from yavai.connections.sftp import _readv_windowed
+
+    data = bytes(range(256)) * 4
+    remote = Mock()
+    remote.readv.side_effect = lambda chunks: [data[o:o + n] for o, n in chunks]
+
+    with patch('yavai.connections.sftp._READV_REQUEST_SIZE', 64):
+        out = list(_readv_windowed(remote, [(0, 200), (500, 0), (600, 300)], 3))
+
+    assert out == [data[:200], b'', data[600:900]]
+    assert [len(c.args[0]) for c in remote.readv.call_args_list] == [3, 3, 3]
+
+
+def test_download_large_keeps_part_on_failure(remote, tmp_path):
+    (remote / 'big.bin').write_bytes(b'z' * 100)
+    client = _connected_client(str(remote), fail_times={'/big.bin': 10})
+    client.ssh.get_transport.return_value.is_active.return_value = True
+    target = tmp_path / 'big.bin'
+
+    with patch('paramiko.SFTPClient.from_transport',
+               side_effect=lambda t, **kw: FakeSFTP(str(remote), client.sftp.fail_times)), \
+            patch('yavai.connections.sftp.time.sleep'):
+        with pytest.raises(IOError, match='Download of /big.bin failed'):
+            client.download_large('/big.bin', str(target), workers=1, retries=1)
+
+    assert not target.exists()
+    assert (tmp_path / 'big.bin.part').stat().st_size == 100
+
+
+def test_upload_large_in_chunks(remote, tmp_path):
+    payload = os.urandom(10_000)
+    source = tmp_path / 'big.bin'
+    source.write_bytes(payload)
+    client = _connected_client(str(remote))
+
+    with patch('paramiko.SFTPClient.from_transport',
+               side_effect=lambda t, **kw: FakeSFTP(str(remote))):
+        stats = client.upload_large(str(source), '/big.bin', workers=4, chunk_size=1024)
+
+    assert (remote / 'big.bin').read_bytes() == payload
+    assert stats['files'] == 10
+    assert stats['failed'] == []
+
+
+def test_open_sftp_defaults_to_open_sftp():
+    client = SFTPClient()
+    ssh = Mock()
+
+    assert client._open_sftp(ssh) is ssh.open_sftp.return_value
+
+
+def test_sync_transfers_only_changes(remote, tmp_path):
+    client = _connected_client(str(remote))
+    local = tmp_path / 'mirror'
+
+    first = client.sync('/drop', str(local), workers=2)
+    second = client.sync('/drop', str(local), workers=2)
+    (remote / 'drop' / 'nested' / 'b.csv').write_bytes(b'B' * 250)
+    (remote / 'drop' / 'new.csv').write_bytes(b'n' * 5)
+    third = client.sync('/drop', str(local), workers=2)
+
+    assert first['files_done'] == 3
+    assert second['files_done'] == 0
+    assert second['skipped'] == 3
+    assert third['files_done'] == 2
+    assert third['bytes_done'] == 255
+    assert (local / 'nested' / 'b.csv').read_bytes() == b'B' * 250
+    state = json.loads((local / '.yavai_sync.json').read_text())
+    assert set(state['files']) == {'a.csv', 'new.csv', 'nested/b.csv', 'nested/deeper/c.csv'}
+    assert state['partial'] == {}
+
+
+def test_sync_resumes_partial_file(remote, tmp_path):
+    payload = os.urandom(5000)
+    (remote / 'drop' / 'a.csv').write_bytes(payload)
+    attr = os.stat(remote / 'drop' / 'a.csv')
+    local = tmp_path / 'mirror'
+    local.mkdir()
+    (local / 'a.csv.part').write_bytes(payload[:3000])
+    (local / '.yavai_sync.json').write_text(json.dumps({
+        'remote_dir': '/drop', 'files': {},
+        'partial': {'a.csv': [attr.st_size, attr.st_mtime]}}))
+    client = _connected_client(str(remote))
+
+    stats = client.sync('/drop', str(local))
+
+    assert (local / 'a.csv').read_bytes() == payload
+    assert stats['bytes_done'] == 2000 + 200 + 300
+
+
+def test_sync_restarts_partial_of_changed_file(remote, tmp_path):
+    local = tmp_path / 'mirror'
+    local.mkdir()
+    (local / 'a.csv.part').write_bytes(b'stale' * 10)
+    (local / '.yavai_sync.json').write_text(json.dumps({
+        'remote_dir': '/drop', 'files': {}, 'partial': {'a.csv': [999, 1]}}))
+    client = _connected_client(str(remote))
+
+    client.sync('/drop', str(local))
+
+    assert (local / 'a.csv').read_bytes() == b'a' * 100
+
+
+def test_sync_checksum_skips_touched_files(remote, tmp_path):
+    client = _connected_client(str(remote))
+    local = tmp_path / 'mirror'
+    client.sync('/drop', str(local))
+    os.utime(local / 'a.csv', (1, 1))
+
+    plain = client.sync('/drop', str(local))
+    os.utime(local / 'a.csv', (1, 1))
+    checked = client.sync('/drop', str(local), checksum=True)
+
+    assert plain['files_done'] == 1
+    assert checked['files_done'] == 0
+    assert checked['skipped'] == 3
+    remote_mtime = os.stat(remote / 'drop' / 'a.csv').st_mtime
+    assert int(os.stat(local / 'a.csv').st_mtime) == int(remote_mtime)
+    state = json.loads((local / '.yavai_sync.json').read_text())
+    assert state['files']['a.csv']['sha1'] == hashlib.sha1(b'a' * 100).hexdigest()
+
+
+def test_read_csv_streams_from_remote(remote):
+    (remote / 'data.csv').write_text('id,name\n1,a\n2,b\n3,c\n')
+    client = _connected_client(str(remote))
+
+    df = client.read_csv('/data.csv')
+
+    assert df['id'].tolist() == [1, 2, 3]
+    assert df['name'].tolist() == ['a', 'b', 'c']
+
+
+def test_read_csv_chunked_and_compressed(remote):
+    rows = ''.join(f'{i},{i * 2}\n' for i in range(10))
+    (remote / 'data.csv.gz').write_bytes(gzip.compress(('a,b\n' + rows).encode()))
+    client = _connected_client(str(remote))
+
+    chunks = list(client.read_csv('/data.csv.gz', chunksize=4))
+
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert pd.concat(chunks)['b'].sum() == 90
+
+
+def test_read_excel_streams_from_remote(remote, tmp_path):
+    pd.DataFrame({'x': [1, 2], 'y': ['p', 'q']}).to_excel(remote / 'book.xlsx', index=False)
+    client = _connected_client(str(remote))
+
+    df = client.read_excel('/book.xlsx')
+
+    assert df['y'].tolist() == ['p', 'q']
+
+
+def test_read_file_modes(remote):
+    (remote / 'notes.txt').write_bytes('héllo'.encode())
+    client = _connected_client(str(remote))
+
+    assert client.read_file('/notes.txt') == 'héllo'.encode()
+    assert client.read_file('/notes.txt', mode='r') == 'héllo'
+
+
+def test_stream_reads_ahead_in_windows(remote):
+    payload = os.urandom(10_000)
+    (remote / 'blob').write_bytes(payload)
+    remote_file = FakeSFTPFile(str(remote / 'blob'), 'rb')
+    stream = SFTPStream(remote_file, len(payload), read_ahead=4096)
+
+    data = b''.join(iter(lambda: stream.read(1000), b''))
+    stream.seek(100)
+    head = stream.read(10)
+    stream.close()
+
+    assert data == payload
+    assert head == payload[100:110]
+    assert remote_file.readv_calls == 4
+    assert remote_file.closed
+
+
+def test_transfer_to_s3_streams_parts(remote):
+    payload = os.urandom(11 * 2 ** 20)
+    (remote / 'dump.bin').write_bytes(payload)
+    client = _connected_client(str(remote))
+    s3 = Mock()
+    s3.create_multipart_upload.return_value = {'UploadId': 'u'}
+    s3.upload_part.side_effect = lambda **kw: {'ETag': str(kw['PartNumber'])}
+
+    stats = client.transfer_to_s3('/dump.bin', 's3a://bucket/in/dump.bin',
+                                  part_size=5 * 2 ** 20, s3=s3)
+
+    parts = sorted(s3.upload_part.call_args_list, key=lambda c: c.kwargs['PartNumber'])
+    assert b''.join(c.kwargs['Body'] for c in parts) == payload
+    assert parts[0].kwargs['Bucket'] == 'bucket'
+    assert parts[0].kwargs['Key'] == 'in/dump.bin'
+    assert stats['parts'] == 3
+    s3.complete_multipart_upload.assert_called_once()
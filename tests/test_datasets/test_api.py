@@ -1,8 +1,9 @@
 # tests/test_datasets/test_api.py
+import io
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
-from yavai.datasets.api import DatasetAPI
+from yavai.datasets.api import DatasetAPI, DatasetFile
 
 
 @pytest.fixture
@@ -104,4 +105,101 @@ def test_download_dataset(api, mock_client_request):
     assert result == expected_result
     call_args = mock_client_request.call_args
     assert call_args[1]['headers']['Authorization'] == 'Bearer test_token'
-    assert call_args[1]['is_download'] is True
\ No newline at end of file
+    assert call_args[1]['is_download'] is True
+
+def test_iter_dataset_files_paginates(api, mock_client_request):
+    mock_client_request.side_effect = [
+        {'data': {'files': [{'id': 'f1', 'name': 'a.csv', 'size': 10},
+                            {'id': 'f2', 'name': 'b.csv', 'size': 20}]}},
+        {'data': {'files': [{'id': 'f3', 'name': 'c.csv', 'size': 30}]}},
+    ]
+    
+    result = list(api.iter_dataset_files('dataset_123', page_size=2))
+    
+    assert [f.file_id for f in result] == ['f1', 'f2', 'f3']
+    assert result[2].size == 30
+    assert mock_client_request.call_count == 2
+    assert mock_client_request.call_args_list[1][1]['params'] == {'page': 1, 'size': 2}
+
+
+def test_iter_dataset_files_is_lazy(api, mock_client_request):
+    mock_client_request.return_value = {'data': {'files': [{'id': 'f1', 'name': 'a.csv'}]}}
+    
+    iterator = api.iter_dataset_files('dataset_123')
+    
+    mock_client_request.assert_not_called()
+    assert next(iterator) == DatasetFile('f1', 'a.csv')
+
+
+def test_iter_dataset_files_stops_when_paging_ignored(api, mock_client_request):
+    page = {'data': {'files': [{'id': 'f1', 'name': 'a.csv'}, {'id': 'f2', 'name': 'b.csv'}]}}
+    mock_client_request.return_value = page
+    
+    result = list(api.iter_dataset_files('dataset_123', page_size=2))
+    
+    assert len(result) == 2
+    assert mock_client_request.call_count == 2
+
+
+def test_iter_dataset_files_oversized_page_is_the_whole_listing(api, mock_client_request):
+    files = [{'id': f'f{i}', 'name': f'{i}.csv'} for i in range(5)]
+    mock_client_request.return_value = {'data': {'files': files}}
+    
+    result = list(api.iter_dataset_files('dataset_123', page_size=2))
+    
+    assert len(result) == 5
+    assert mock_client_request.call_count == 1
+
+
+def test_iter_dataset_files_invalid_page_size(api):
+    with pytest.raises(ValueError):
+        list(api.iter_dataset_files('dataset_123', page_size=0))
+
+
+class _RawBody(io.BytesIO):
+    decode_content = False
+
+
+def _streamed_response(body):
+    response = Mock()
+    response.raw = _RawBody(body)
+    return response
+
+
+def test_preview_feature_group_streams_csv(api, mock_client_request):
+    response = _streamed_response(b'col1,col2\n1,a\n2,b\n')
+    mock_client_request.return_value = response
+    
+    result = api.preview_feature_group('app', '{"name": "fg"}')
+    
+    assert isinstance(result, pd.DataFrame)
+    assert list(result.columns) == ['col1', 'col2']
+    assert len(result) == 2
+    assert mock_client_request.call_args[1]['stream'] is True
+    response.close.assert_called_once()
+
+
+def test_preview_training_dataset_arrow_with_dtype(api, mock_client_request):
+    pa = pytest.importorskip('pyarrow')
+    mock_client_request.return_value = _streamed_response(b'col1,col2\n1,2\n3,4\n')
+    
+    result = api.preview_training_dataset('app', '{"name": "td"}',
+                                          dtype={'col1': 'int32'}, as_arrow=True)
+    
+    assert isinstance(result, pa.Table)
+    assert result.schema.field('col1').type == pa.int32()
+    assert result.num_rows == 2
+
+
+def test_get_file_path_async(api):
+    import asyncio
+    with patch.object(api._client, '_send', return_value={'data': 's3a://bucket/key'}) as mock_send:
+        with patch.object(api._client, '_build_url', return_value='http://test.com'):
+            async def main():
+                calls = [api.get_file_path_async('file_123') for _ in range(5)]
+                return await asyncio.gather(*calls)
+            
+            result = asyncio.run(main())
+    
+    assert result == ['s3a://bucket/key'] * 5
+    assert mock_send.call_count == 1
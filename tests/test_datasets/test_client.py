@@ -73,8 +73,31 @@ def test_handle_download(mock_getuser, mock_open, client, mock_response):
 
 
 def test_request_non_download(client, mock_response):
+    mock_response.content = b'{"status": 200, "data": "test"}'
     with patch.object(client, '_build_url', return_value='http://test.com'):
         with patch.object(client, '_execute_request', return_value=mock_response):
             result = client.request('GET', ['path'], is_download=False)
             
-            assert result == {'status': 200, 'data': 'test'}
\ No newline at end of file
+            assert result == {'status': 200, 'data': 'test'}
+
+
+@pytest.mark.parametrize('codec', ['json', 'orjson'])
+def test_request_decodes_with_codec(codec, mock_response):
+    if codec == 'orjson':
+        pytest.importorskip('orjson')
+    client = YAVAIClient(codec=codec)
+    mock_response.content = b'{"data": [1, 2, 3]}'
+    with patch.object(client, '_execute_request', return_value=mock_response):
+        result = client.request('GET', ['path'])
+    
+    assert result == {'data': [1, 2, 3]}
+    mock_response.json.assert_not_called()
+
+
+def test_execute_request_encodes_with_codec(client, mock_response):
+    with patch.object(client._session, 'request', return_value=mock_response) as mock_req:
+        client._execute_request('POST', 'http://test.com', None, None, {'key': 'value'})
+        
+        body = mock_req.call_args[1]['data']
+        assert isinstance(body, bytes)
+        assert client._codec.loads(body) == {'key': 'value'}
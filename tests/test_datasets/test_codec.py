@@ -0,0 +1,54 @@
+# tests/test_datasets/test_codec.py
+import pytest
+from yavai.datasets.codec import JSONCodec, get_codec, register_codec
+
+
+def test_get_codec_default_prefers_orjson():
+    pytest.importorskip('orjson')
+    
+    assert get_codec().name == 'orjson'
+
+
+def test_get_codec_by_name():
+    codec = get_codec('json')
+    
+    assert type(codec) is JSONCodec
+
+
+def test_get_codec_passthrough_instance():
+    codec = JSONCodec()
+    
+    assert get_codec(codec) is codec
+
+
+def test_get_codec_unknown():
+    with pytest.raises(ValueError, match='Unknown JSON codec'):
+        get_codec('does-not-exist')
+
+
+@pytest.mark.parametrize('name', ['json', 'orjson'])
+def test_codec_roundtrip_bytes(name):
+    if name == 'orjson':
+        pytest.importorskip('orjson')
+    codec = get_codec(name)
+    payload = {'data': {'files': [{'id': 'f1', 'name': 'ä.csv', 'size': 1}]}}
+    
+    encoded = codec.dumps(payload)
+    
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
+
+
+def test_register_codec_falls_back_when_unavailable():
+    class MissingCodec(JSONCodec):
+        name = 'missing'
+
+        def __init__(self):
+            raise ImportError('not installed')
+
+    register_codec('missing', MissingCodec, preferred=True)
+    try:
+        assert get_codec().name != 'missing'
+    finally:
+        from yavai.datasets import codec as codec_module
+        codec_module._CODECS.pop('missing')
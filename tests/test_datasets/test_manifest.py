@@ -0,0 +1,181 @@
+# tests/test_datasets/test_manifest.py
+import pytest
+from unittest.mock import Mock, patch
+from yavai.datasets.api import DatasetAPI
+from yavai.datasets.manifest import DatasetManifest
+from yavai.datasets.records import DatasetFile
+
+
+@pytest.fixture
+def listing():
+    return [
+        DatasetFile('f1', 'train/a.jpg', 10, 'e1'),
+        DatasetFile('f2', 'train/b.jpg', 20, 'e2'),
+        DatasetFile('f3', 'test/c.jpg', 30, 'e3'),
+    ]
+
+
+@pytest.fixture
+def fake_api(listing):
+    api = Mock()
+    api.iter_dataset_files.side_effect = lambda dataset_id, page_size: iter(listing)
+    api._fetch_file_path.side_effect = lambda file_id: f's3a://bucket/{file_id}'
+    return api
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    m = DatasetManifest('ds1', path=str(tmp_path / 'ds1.sqlite'))
+    yield m
+    m.close()
+
+
+def test_refresh_initial_build(manifest, fake_api):
+    counts = manifest.refresh(fake_api)
+    
+    assert counts == {'added': 3, 'updated': 0, 'removed': 0, 'unchanged': 0}
+    assert len(manifest) == 3
+    assert manifest.get_file_path('f2') == 's3a://bucket/f2'
+    assert manifest.refreshed_at is not None
+
+
+def test_refresh_is_incremental(manifest, fake_api, listing):
+    manifest.refresh(fake_api)
+    fake_api._fetch_file_path.reset_mock()
+    listing[1] = DatasetFile('f2', 'train/b.jpg', 25, 'e2-new')
+    del listing[2]
+    listing.append(DatasetFile('f4', 'train/d.jpg', 40, 'e4'))
+    
+    counts = manifest.refresh(fake_api)
+    
+    assert counts == {'added': 1, 'updated': 1, 'removed': 1, 'unchanged': 1}
+    assert sorted(c[0][0] for c in fake_api._fetch_file_path.call_args_list) == ['f2', 'f4']
+    assert manifest.get_file_path('f3') is None
+
+
+def test_lookups_by_name_and_prefix(manifest, fake_api):
+    manifest.refresh(fake_api)
+    
+    assert [f.file_id for f in manifest.list_prefix('train/')] == ['f1', 'f2']
+    assert manifest.find_by_name('test/c.jpg') == [DatasetFile('f3', 'test/c.jpg', 30, 'e3')]
+    assert len(manifest.list_prefix()) == 3
+
+
+def test_prefix_lookup_at_the_end_of_unicode(manifest):
+    last, before_surrogates = chr(0x10FFFF), chr(0xD7FF)
+    listing = [DatasetFile('f1', f'a{last}', 1, 'e1'), DatasetFile('f2', f'a{last}x', 1, 'e2'),
+               DatasetFile('f3', 'b', 1, 'e3'), DatasetFile('f4', f'{before_surrogates}z', 1, 'e4'),
+               DatasetFile('f5', chr(0xE000), 1, 'e5')]
+    api = Mock()
+    api.iter_dataset_files.return_value = iter(listing)
+    manifest.refresh(api, resolve_paths=False)
+    
+    assert [f.file_id for f in manifest.list_prefix(f'a{last}')] == ['f1', 'f2']
+    assert [f.file_id for f in manifest.list_prefix(last)] == []
+    assert [f.file_id for f in manifest.list_prefix(before_surrogates)] == ['f4']
+
+
+def test_empty_listing_keeps_stored_rows(manifest, fake_api, listing):
+    manifest.refresh(fake_api)
+    listing.clear()
+    
+    counts = manifest.refresh(fake_api)
+    
+    assert counts['removed'] == 0
+    assert len(manifest) == 3
+
+
+def test_failed_listing_keeps_stored_rows(manifest, fake_api, listing):
+    manifest.refresh(fake_api)
+    
+    def broken(dataset_id, page_size):
+        yield listing[0]
+        raise ConnectionError('listing failed')
+    
+    fake_api.iter_dataset_files.side_effect = broken
+    with pytest.raises(ConnectionError):
+        manifest.refresh(fake_api)
+    
+    assert len(manifest) == 3
+
+
+def test_manifest_persists(tmp_path, fake_api):
+    path = str(tmp_path / 'ds1.sqlite')
+    with DatasetManifest('ds1', path=path) as m:
+        m.refresh(fake_api)
+    
+    with DatasetManifest('ds1', path=path) as reopened:
+        assert reopened.get_file_path('f1') == 's3a://bucket/f1'
+
+
+def test_api_get_file_path_uses_manifest(tmp_path, listing):
+    api = DatasetAPI()
+    with patch.object(api, 'iter_dataset_files', return_value=iter(listing)):
+        with patch.object(api, '_fetch_file_path', side_effect=lambda i: f's3a://bucket/{i}'):
+            api.build_manifest('ds1', path=str(tmp_path / 'ds1.sqlite'))
+    
+    with patch.object(api._client, 'request') as mock_request:
+        assert api.get_file_path('f1') == 's3a://bucket/f1'
+        mock_request.assert_not_called()
+    
+    api.detach_manifest('ds1')
+
+
+def test_api_offline_manifest_skips_listing(tmp_path, fake_api):
+    path = str(tmp_path / 'ds1.sqlite')
+    with DatasetManifest('ds1', path=path) as m:
+        m.refresh(fake_api)
+    api = DatasetAPI()
+    
+    with patch.object(api, 'iter_dataset_files') as mock_iter:
+        api.build_manifest('ds1', path=path, refresh=False)
+        mock_iter.assert_not_called()
+    
+    assert api.get_file_path('f3') == 's3a://bucket/f3'
+    api.detach_manifest('ds1')
+
+
+def test_api_resolves_and_stores_unresolved_path(tmp_path, fake_api):
+    path = str(tmp_path / 'ds1.sqlite')
+    api = DatasetAPI()
+    with patch.object(api, 'iter_dataset_files', side_effect=fake_api.iter_dataset_files):
+        manifest = api.build_manifest('ds1', path=path, resolve_paths=False)
+    
+    with patch.object(api, '_fetch_file_path', return_value='s3a://bucket/f1') as mock_fetch:
+        assert api.get_file_path('f1') == 's3a://bucket/f1'
+        assert api.get_file_path('f1') == 's3a://bucket/f1'
+        mock_fetch.assert_called_once_with('f1')
+    
+    assert manifest.get_file_path('f1') == 's3a://bucket/f1'
+    api.detach_manifest('ds1')
+
+
+def test_api_refresh_replaces_stale_paths(tmp_path, listing):
+    api = DatasetAPI()
+    paths = {'f1': 's3a://b/v1/a.csv'}
+    with patch.object(api, 'iter_dataset_files', side_effect=lambda *a, **kw: iter(listing)), \
+            patch.object(api, '_fetch_file_path',
+                         side_effect=lambda i: paths.get(i, f's3a://b/{i}')):
+        manifest = api.build_manifest('ds1', path=str(tmp_path / 'ds1.sqlite'))
+        listing[0] = DatasetFile('f1', 'train/a.jpg', 10, 'e1-new')
+        paths['f1'] = 's3a://b/v2/a.csv'
+        counts = manifest.refresh(api)
+    
+    assert counts['updated'] == 1
+    assert api.get_file_path('f1') == 's3a://b/v2/a.csv'
+    api.detach_manifest('ds1')
+
+
+def test_api_get_file_path_async_uses_manifest(tmp_path, fake_api):
+    import asyncio
+    path = str(tmp_path / 'ds1.sqlite')
+    with DatasetManifest('ds1', path=path) as m:
+        m.refresh(fake_api)
+    api = DatasetAPI()
+    api.build_manifest('ds1', path=path, refresh=False)
+    
+    with patch.object(api._client, 'request_async') as mock_request:
+        assert asyncio.run(api.get_file_path_async('f2')) == 's3a://bucket/f2'
+        mock_request.assert_not_called()
+    
+    api.detach_manifest('ds1')
@@ -0,0 +1,126 @@
+# tests/test_datasets/test_singleflight.py
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+from yavai.datasets.client import YAVAIClient
+from yavai.datasets.singleflight import SingleFlight
+
+
+def _slow(result, calls, delay=0.1):
+    def fn():
+        calls.append(1)
+        time.sleep(delay)
+        return result
+    return fn
+
+
+def test_do_coalesces_concurrent_threads():
+    flight = SingleFlight()
+    calls = []
+    results = []
+    fn = _slow('value', calls)
+    
+    threads = [threading.Thread(target=lambda: results.append(flight.do('k', fn)))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    assert results == ['value'] * 8
+    assert len(calls) == 1
+
+
+def test_do_propagates_errors_to_waiters():
+    flight = SingleFlight()
+    errors = []
+    
+    def failing():
+        time.sleep(0.1)
+        raise RuntimeError('boom')
+    
+    def worker():
+        try:
+            flight.do('k', failing)
+        except RuntimeError as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    assert len(errors) == 4
+
+
+def test_do_runs_again_after_completion():
+    flight = SingleFlight()
+    calls = []
+    fn = _slow('value', calls, delay=0)
+    
+    flight.do('k', fn)
+    flight.do('k', fn)
+    
+    assert len(calls) == 2
+
+
+def test_do_async_coalesces_coroutines():
+    flight = SingleFlight()
+    calls = []
+    fn = _slow('value', calls)
+    
+    async def main():
+        return await asyncio.gather(*[flight.do_async('k', fn) for _ in range(8)])
+    
+    assert asyncio.run(main()) == ['value'] * 8
+    assert len(calls) == 1
+
+
+def test_client_coalesces_identical_gets():
+    client = YAVAIClient(codec='json')
+    response = Mock(content=b'{"data": "s3a://bucket/key"}')
+    
+    def slow_execute(*args, **kwargs):
+        time.sleep(0.1)
+        return response
+    
+    results = []
+    with patch.object(client, '_execute_request', side_effect=slow_execute) as mock_exec:
+        with patch.object(client, '_build_url', return_value='http://test.com/files/1'):
+            def fetch():
+                results.append(client.request('GET', ['files', '1']))
+
+            threads = [threading.Thread(target=fetch) for _ in range(6)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+    
+    assert len(results) == 6
+    assert mock_exec.call_count == 1
+
+
+def test_client_does_not_coalesce_posts():
+    client = YAVAIClient(codec='json')
+    
+    key = client._coalesce_key('POST', 'http://test.com', None, None, None, False, False)
+    
+    assert key is None
+
+
+def test_client_does_not_coalesce_gets_with_a_body():
+    client = YAVAIClient(codec='json')
+    
+    key = client._coalesce_key('GET', 'http://test.com', None, None, {'q': 1}, False, False)
+    
+    assert key is None
+
+
+def test_client_coalesce_disabled():
+    client = YAVAIClient(coalesce=False)
+    
+    key = client._coalesce_key('GET', 'http://test.com', None, None, None, False, False)
+    
+    assert key is None
@@ -1,7 +1,10 @@
 # tests/test_io/test_utils.py
+import io
+import threading
+import time
 import pytest
 from unittest.mock import Mock, patch
-from yavai.io.utils import get_s3_client, extract_bucket_key
+from yavai.io.utils import get_s3_client, extract_bucket_key, upload_stream, MIN_PART_SIZE
 
 
 @patch('yavai.config.S3_ACCESS_KEY', 'test_key')
@@ -49,4 +52,90 @@ def test_extract_bucket_key_nested_path():
     bucket, key = extract_bucket_key(path)
     
     assert bucket == 'bucket'
-    assert key == 'deep/nested/path/file.txt'
\ No newline at end of file
+    assert key == 'deep/nested/path/file.txt'
+
+def test_extract_bucket_key_s3_scheme():
+    assert extract_bucket_key('s3://bucket/a/b.csv') == ('bucket', 'a/b.csv')
+
+
+def _mock_s3():
+    s3 = Mock()
+    s3.create_multipart_upload.return_value = {'UploadId': 'up-1'}
+    s3.upload_part.side_effect = lambda **kw: {'ETag': f"etag-{kw['PartNumber']}"}
+    return s3
+
+
+def test_upload_stream_small_uses_put_object():
+    s3 = _mock_s3()
+
+    stats = upload_stream(io.BytesIO(b'tiny'), 'bucket', 'key', s3=s3, ContentType='text/csv')
+
+    s3.put_object.assert_called_once_with(Bucket='bucket', Key='key', Body=b'tiny',
+                                          ContentType='text/csv')
+    s3.create_multipart_upload.assert_not_called()
+    assert stats['bytes'] == 4
+
+
+def test_upload_stream_multipart():
+    s3 = _mock_s3()
+    payload = b'x' * (2 * MIN_PART_SIZE + 10)
+    seen = []
+
+    stats = upload_stream(io.BytesIO(payload), 'bucket', 'key', part_size=MIN_PART_SIZE,
+                          max_concurrency=2, s3=s3, progress=seen.append)
+
+    assert s3.upload_part.call_count == 3
+    assert sorted(len(c.kwargs['Body']) for c in s3.upload_part.call_args_list) == \
+        [10, MIN_PART_SIZE, MIN_PART_SIZE]
+    s3.complete_multipart_upload.assert_called_once_with(
+        Bucket='bucket', Key='key', UploadId='up-1',
+        MultipartUpload={'Parts': [{'PartNumber': n, 'ETag': f'etag-{n}'} for n in (1, 2, 3)]})
+    assert stats['parts'] == 3
+    assert stats['bytes'] == len(payload)
+    assert len(seen) == 3
+
+
+def test_upload_stream_buffers_at_most_max_concurrency_parts():
+    lock = threading.Lock()
+    state = {'buffered': 0, 'peak': 0}
+
+    class Stream(io.BytesIO):
+        def read(self, n=-1):
+            data = super().read(n)
+            if data:
+                with lock:
+                    state['buffered'] += 1
+                    state['peak'] = max(state['peak'], state['buffered'])
+            return data
+
+    def upload_part(**kwargs):
+        time.sleep(0.01)
+        with lock:
+            state['buffered'] -= 1
+        return {'ETag': f"etag-{kwargs['PartNumber']}"}
+
+    s3 = _mock_s3()
+    s3.upload_part.side_effect = upload_part
+
+    stats = upload_stream(Stream(b'x' * (6 * MIN_PART_SIZE)), 'bucket', 'key',
+                          part_size=MIN_PART_SIZE, max_concurrency=2, s3=s3)
+
+    assert stats['parts'] == 6
+    assert state['peak'] == 2
+
+
+def test_upload_stream_aborts_on_error():
+    s3 = _mock_s3()
+    s3.upload_part.side_effect = RuntimeError('network down')
+
+    with pytest.raises(RuntimeError, match='network down'):
+        upload_stream(io.BytesIO(b'x' * (3 * MIN_PART_SIZE)), 'bucket', 'key',
+                      part_size=MIN_PART_SIZE, s3=s3)
+
+    s3.abort_multipart_upload.assert_called_once_with(Bucket='bucket', Key='key', UploadId='up-1')
+    s3.complete_multipart_upload.assert_not_called()
+
+
+def test_upload_stream_rejects_small_parts():
+    with pytest.raises(ValueError):
+        upload_stream(io.BytesIO(b''), 'bucket', 'key', part_size=1024, s3=Mock())
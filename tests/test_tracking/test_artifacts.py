@@ -0,0 +1,139 @@
+# tests/test_tracking/test_artifacts.py
+import pytest
+from unittest.mock import Mock, patch
+from yavai.tracking.artifacts import ArtifactUploader, is_s3_uri
+from yavai.tracking.mlflow_wrapper import MLflowWrapper
+
+ARTIFACT_URI = 's3://mlflow/3/abc123/artifacts'
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    root = tmp_path / 'ckpt'
+    (root / 'shards').mkdir(parents=True)
+    (root / 'config.json').write_text('{}')
+    for i in range(5):
+        (root / 'shards' / f'part-{i}.bin').write_bytes(b'x' * (i + 1) * 10)
+    return root
+
+
+def _keys(s3):
+    return sorted(c.kwargs['Key'] for c in s3.upload_file.call_args_list)
+
+
+def test_log_artifacts_uses_mlflow_layout(checkpoint):
+    s3 = Mock()
+    seen = []
+    uploader = ArtifactUploader(max_workers=3, s3=s3, progress=seen.append)
+
+    stats = uploader.log_artifacts(str(checkpoint), ARTIFACT_URI, artifact_path='model')
+
+    assert _keys(s3) == ['3/abc123/artifacts/model/config.json'] + [
+        f'3/abc123/artifacts/model/shards/part-{i}.bin' for i in range(5)]
+    assert {c.kwargs['Bucket'] for c in s3.upload_file.call_args_list} == {'mlflow'}
+    assert stats['files_done'] == 6
+    assert stats['bytes_done'] == 2 + 150
+    assert len(seen) == 6
+    assert seen[-1]['files_done'] == 6
+
+
+def test_upload_settings_and_content_type(checkpoint, monkeypatch):
+    monkeypatch.setenv('MLFLOW_S3_UPLOAD_EXTRA_ARGS', '{"ServerSideEncryption": "AES256"}')
+    s3 = Mock()
+    uploader = ArtifactUploader(s3=s3, multipart_threshold=8 * 2 ** 20,
+                                multipart_chunksize=8 * 2 ** 20, max_concurrency=2)
+
+    uploader.log_artifact(str(checkpoint / 'config.json'), ARTIFACT_URI)
+
+    call = s3.upload_file.call_args
+    assert call.kwargs['Key'] == '3/abc123/artifacts/config.json'
+    assert call.kwargs['ExtraArgs'] == {'ContentType': 'application/json',
+                                        'ServerSideEncryption': 'AES256'}
+    assert call.kwargs['Config'].multipart_threshold == 8 * 2 ** 20
+    assert call.kwargs['Config'].max_concurrency == 2
+
+
+def test_failed_uploads_raise_after_all_files(checkpoint):
+    def upload_file(**kwargs):
+        if kwargs['Key'].endswith('part-2.bin'):
+            raise IOError('connection reset')
+
+    s3 = Mock()
+    s3.upload_file.side_effect = upload_file
+
+    with pytest.raises(RuntimeError, match='1 of 6 artifact uploads failed'):
+        ArtifactUploader(s3=s3).log_artifacts(str(checkpoint), ARTIFACT_URI)
+
+    assert s3.upload_file.call_count == 6
+
+
+def test_is_s3_uri():
+    assert is_s3_uri('s3://bucket/path')
+    assert not is_s3_uri('mlflow-artifacts:/3/abc/artifacts')
+    assert not is_s3_uri('file:///tmp/mlruns')
+    assert not is_s3_uri(None)
+
+
+@patch('mlflow.log_artifacts')
+@patch('mlflow.get_artifact_uri', return_value=ARTIFACT_URI)
+def test_wrapper_uses_parallel_upload_for_s3(mock_uri, mock_log, checkpoint):
+    wrapper = MLflowWrapper()
+    wrapper._artifact_uploader = Mock()
+
+    wrapper.log_artifacts(str(checkpoint), 'model')
+
+    wrapper._artifact_uploader.log_artifacts.assert_called_once_with(
+        str(checkpoint), ARTIFACT_URI, 'model')
+    mock_log.assert_not_called()
+
+
+@patch('mlflow.log_artifact')
+@patch('mlflow.get_artifact_uri', return_value='mlflow-artifacts:/3/abc/artifacts')
+def test_wrapper_falls_back_for_other_stores(mock_uri, mock_log):
+    wrapper = MLflowWrapper()
+
+    wrapper.log_artifact('/tmp/report.html', 'reports')
+
+    mock_log.assert_called_once_with('/tmp/report.html', 'reports')
+
+
+@patch('mlflow.log_artifacts')
+@patch('mlflow.log_artifact')
+@patch('mlflow.get_artifact_uri', return_value=ARTIFACT_URI)
+def test_wrapper_parallel_upload_is_opt_in(mock_uri, mock_log, mock_log_dir):
+    wrapper = MLflowWrapper()
+
+    wrapper.log_artifact(file_path='/tmp/report.html', artifact_path='reports')
+    wrapper.log_artifacts(dir_path='/tmp/out')
+
+    assert wrapper._artifact_uploader is None
+    mock_log.assert_called_once_with('/tmp/report.html', 'reports')
+    mock_log_dir.assert_called_once_with('/tmp/out', None)
+
+    wrapper.configure_artifact_upload(max_workers=2)
+    assert wrapper._artifact_uploader.max_workers == 2
+
+
+@patch('mlflow.log_artifact')
+@patch('mlflow.get_artifact_uri')
+def test_wrapper_parallel_upload_can_be_disabled(mock_uri, mock_log):
+    wrapper = MLflowWrapper()
+    wrapper.configure_artifact_upload(enabled=False)
+
+    wrapper.log_artifact('/tmp/report.html')
+
+    mock_uri.assert_not_called()
+    mock_log.assert_called_once_with('/tmp/report.html', None)
+
+
+@patch('mlflow.log_artifacts')
+@patch('mlflow.log_artifact')
+@patch('mlflow.get_artifact_uri', return_value='file:///tmp/mlruns/0/abc/artifacts')
+def test_module_functions_pass_artifact_path(mock_uri, mock_log, mock_log_dir):
+    import yavai
+
+    yavai.log_artifact('/tmp/a.txt', 'docs')
+    yavai.log_artifacts('/tmp/out', 'outputs')
+
+    mock_log.assert_called_once_with('/tmp/a.txt', 'docs')
+    mock_log_dir.assert_called_once_with('/tmp/out', 'outputs')
@@ -0,0 +1,179 @@
+# tests/test_tracking/test_async_logger.py
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from yavai.tracking.async_logger import AsyncBatchLogger
+from yavai.tracking.mlflow_wrapper import MLflowWrapper
+
+
+@pytest.fixture
+def client():
+    return Mock()
+
+
+def _sent(client, field):
+    return [e for c in client.log_batch.call_args_list for e in c.kwargs[field]]
+
+
+def test_flush_sends_one_batch(client):
+    logger = AsyncBatchLogger(client, flush_interval=60)
+    for step in range(5):
+        logger.log_metric('run-1', 'loss', 1.0 / (step + 1), step=step)
+    logger.log_params('run-1', {'lr': 0.1, 'epochs': 3})
+    logger.set_tag('run-1', 'stage', 'train')
+
+    logger.flush()
+
+    client.log_batch.assert_called_once()
+    assert client.log_batch.call_args.args == ('run-1',)
+    assert [m.step for m in _sent(client, 'metrics')] == [0, 1, 2, 3, 4]
+    assert {p.key: p.value for p in _sent(client, 'params')} == {'lr': '0.1', 'epochs': '3'}
+    assert logger.stats()['sent'] == 8
+    logger.close()
+
+
+def test_batches_respect_mlflow_limits(client):
+    logger = AsyncBatchLogger(client, flush_interval=60, batch_size=10_000)
+    for step in range(2500):
+        logger.log_metric('run-1', 'loss', step, step=step)
+    logger.log_params('run-1', {f'p{i}': i for i in range(150)})
+
+    logger.close()
+
+    for call in client.log_batch.call_args_list:
+        assert len(call.kwargs['metrics']) <= 1000
+        assert len(call.kwargs['params']) <= 100
+        assert len(call.kwargs['metrics']) + len(call.kwargs['params']) <= 1000
+    assert len(_sent(client, 'metrics')) == 2500
+    assert len(_sent(client, 'params')) == 150
+
+
+def test_size_triggers_flush(client):
+    sent = threading.Event()
+    client.log_batch.side_effect = lambda *a, **kw: sent.set()
+    logger = AsyncBatchLogger(client, flush_interval=60, batch_size=3)
+
+    for step in range(3):
+        logger.log_metric('run-1', 'acc', 0.5, step=step)
+
+    assert sent.wait(5)
+    logger.close()
+
+
+def test_interval_triggers_flush(client):
+    sent = threading.Event()
+    client.log_batch.side_effect = lambda *a, **kw: sent.set()
+    logger = AsyncBatchLogger(client, flush_interval=0.05)
+
+    logger.log_metric('run-1', 'acc', 0.5)
+
+    assert sent.wait(5)
+    logger.close()
+
+
+def test_runs_are_batched_separately(client):
+    logger = AsyncBatchLogger(client, flush_interval=60)
+    logger.log_metric('run-1', 'a', 1)
+    logger.log_metric('run-2', 'a', 2)
+
+    logger.close()
+
+    assert sorted(c.args[0] for c in client.log_batch.call_args_list) == ['run-1', 'run-2']
+
+
+def test_failed_batch_is_dropped_after_retries(client):
+    client.log_batch.side_effect = ConnectionError('server down')
+    on_error = Mock()
+    logger = AsyncBatchLogger(client, flush_interval=60, retries=1, on_error=on_error)
+    logger.log_metric('run-1', 'loss', 1.0)
+
+    with patch('yavai.tracking.async_logger.time.sleep'):
+        logger.close()
+
+    assert client.log_batch.call_count == 2
+    assert logger.stats()['failed'] == 1
+    on_error.assert_called_once()
+
+
+def test_rejected_batch_drops_only_invalid_entities(client):
+    from mlflow.exceptions import MlflowException
+    from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+    def log_batch(run_id, metrics, params, tags):
+        if any(p.key == 'bad' for p in params):
+            raise MlflowException('param value too long', error_code=INVALID_PARAMETER_VALUE)
+
+    client.log_batch.side_effect = log_batch
+    on_error = Mock()
+    logger = AsyncBatchLogger(client, flush_interval=60, retries=3, on_error=on_error)
+    logger.log_metric('run-1', 'loss', 1.0)
+    logger.log_params('run-1', {'lr': 0.1, 'bad': 'x' * 10_000, 'epochs': 3})
+    logger.set_tag('run-1', 'stage', 'train')
+
+    with patch('yavai.tracking.async_logger.time.sleep') as mock_sleep, \
+            patch('yavai.tracking.async_logger.logger') as mock_log:
+        logger.close()
+
+    mock_sleep.assert_not_called()
+    assert logger.stats()['sent'] == 4
+    assert logger.stats()['failed'] == 1
+    on_error.assert_called_once()
+    assert 'params: bad' in mock_log.error.call_args.args[0]
+
+
+def test_closed_logger_rejects_entities(client):
+    logger = AsyncBatchLogger(client)
+    logger.close()
+
+    with pytest.raises(RuntimeError):
+        logger.log_metric('run-1', 'loss', 1.0)
+
+
+@patch('mlflow.end_run')
+@patch('mlflow.log_metric')
+@patch('mlflow.active_run')
+@patch('mlflow.MlflowClient')
+def test_wrapper_async_mode(mock_client_class, mock_active, mock_log, mock_end):
+    mock_active.return_value.info.run_id = 'run-9'
+    wrapper = MLflowWrapper()
+    wrapper.enable_async_logging(flush_interval=60)
+
+    wrapper.log_metric('loss', 0.3, step=7)
+    wrapper.set_tags({'team': 'ml'})
+    wrapper.end_run()
+
+    mock_log.assert_not_called()
+    client = mock_client_class.return_value
+    assert [m.key for m in _sent(client, 'metrics')] == ['loss']
+    assert [t.key for t in _sent(client, 'tags')] == ['team']
+    mock_end.assert_called_once_with('FINISHED')
+    wrapper.disable_async_logging()
+
+
+@patch('mlflow.log_metric')
+@patch('mlflow.active_run', return_value=None)
+@patch('mlflow.MlflowClient')
+def test_wrapper_async_without_run_logs_synchronously(mock_client_class, mock_active, mock_log):
+    wrapper = MLflowWrapper()
+    wrapper.enable_async_logging()
+
+    wrapper.log_metric('loss', 0.3)
+    wrapper.disable_async_logging()
+
+    mock_log.assert_called_once_with('loss', 0.3, step=None)
+    mock_client_class.return_value.log_batch.assert_not_called()
+
+
+@patch('mlflow.start_run')
+@patch('mlflow.MlflowClient')
+def test_wrapper_run_context_flushes_before_end(mock_client_class, mock_start):
+    wrapper = MLflowWrapper()
+    wrapper.enable_async_logging(flush_interval=60)
+
+    with patch.object(wrapper, 'flush') as mock_flush, \
+            patch('mlflow.tracking.fluent.end_run'):
+        with wrapper.start_run(run_name='r'):
+            pass
+
+    mock_flush.assert_called_once()
+    wrapper.disable_async_logging()
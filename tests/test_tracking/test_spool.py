@@ -0,0 +1,272 @@
+# tests/test_tracking/test_spool.py
+import json
+import pytest
+from unittest.mock import Mock, patch
+from yavai.tracking.spool import TrackingSpool, SPOOL_RUN_TAG, main
+from yavai.tracking.mlflow_wrapper import MLflowWrapper
+
+
+@pytest.fixture
+def spool(tmp_path):
+    spool = TrackingSpool(str(tmp_path / 'tracking.jsonl'))
+    yield spool
+    spool.close()
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.search_runs.return_value = []
+    client.get_experiment_by_name.return_value.experiment_id = '7'
+    client.create_run.side_effect = lambda *a, **kw: Mock(info=Mock(run_id='server-run'))
+    return client
+
+
+def _batched(client, field):
+    return [e for c in client.log_batch.call_args_list for e in c.kwargs[field]]
+
+
+def test_append_writes_jsonl(spool):
+    run = spool.start_run(run_name='r1', experiment_name='exp')
+    spool.log_metric(run.info.run_id, 'loss', 0.5, step=3)
+    spool.end_run()
+
+    records = [json.loads(line) for line in spool.path.read_text().splitlines()]
+    assert [r['op'] for r in records] == ['start_run', 'metric', 'end_run']
+    assert [r['seq'] for r in records] == [1, 2, 3]
+    assert records[1]['step'] == 3
+
+
+def test_sequence_continues_after_reopen(tmp_path, spool):
+    spool.log_param('run-1', 'lr', 0.1)
+    spool.close()
+
+    reopened = TrackingSpool(str(spool.path))
+    seq = reopened.append('tag', 'run-1', key='k', value='v')
+    reopened.close()
+
+    assert seq == 2
+
+
+def test_sync_replays_run_and_batches(spool, client):
+    with spool.start_run(run_name='r1', experiment_name='exp', tags={'team': 'ml'}) as run:
+        for step in range(5):
+            spool.log_metric(run.info.run_id, 'loss', step, step=step)
+        spool.log_param(run.info.run_id, 'lr', 0.1)
+
+    stats = spool.sync(client=client)
+
+    client.create_run.assert_called_once()
+    assert client.create_run.call_args.args == ('7',)
+    assert client.create_run.call_args.kwargs['tags'][SPOOL_RUN_TAG] == run.info.run_id
+    assert client.create_run.call_args.kwargs['run_name'] == 'r1'
+    client.log_batch.assert_called_once()
+    assert client.log_batch.call_args.args == ('server-run',)
+    assert [m.step for m in _batched(client, 'metrics')] == [0, 1, 2, 3, 4]
+    client.set_terminated.assert_called_once()
+    assert client.set_terminated.call_args.kwargs['status'] == 'FINISHED'
+    assert stats['records'] == 8
+    assert stats['runs_created'] == 1
+    assert spool.pending() == 0
+
+
+def test_sync_is_incremental(spool, client):
+    spool.log_metric('remote-run', 'loss', 1.0)
+    spool.sync(client=client)
+    spool.log_metric('remote-run', 'loss', 2.0, step=1)
+
+    stats = spool.sync(client=client)
+
+    assert stats['records'] == 1
+    assert [m.value for m in _batched(client, 'metrics')] == [1.0, 2.0]
+
+
+def test_sync_resumes_after_failure(spool, client):
+    for i in range(3):
+        spool.log_metric('remote-run', 'loss', i, step=i)
+    client.log_batch.side_effect = [None, ConnectionError('down'), None]
+
+    with pytest.raises(ConnectionError):
+        spool.sync(client=client, batch_size=2)
+    stats = spool.sync(client=client, batch_size=2)
+
+    assert stats['records'] == 1
+    assert [m.step for m in _batched(client, 'metrics')] == [0, 1, 2, 2]
+
+
+def test_sync_finds_existing_server_run(spool, client):
+    spool.start_run(run_name='r1')
+    client.search_runs.return_value = [Mock(info=Mock(run_id='already-there'))]
+
+    stats = spool.sync(client=client)
+
+    client.create_run.assert_not_called()
+    assert stats['runs_created'] == 0
+    runs = json.loads(spool.state_path.read_text())['runs']
+    assert runs == {spool.active_run_id: 'already-there'}
+
+
+def test_sync_ignores_partial_trailing_line(spool, client):
+    spool.log_metric('remote-run', 'loss', 1.0)
+    with open(spool.path, 'a') as f:
+        f.write('{"seq": 2, "op": "met')
+
+    stats = spool.sync(client=client)
+
+    assert stats['records'] == 1
+
+
+def _rejected(message='INVALID_PARAMETER_VALUE'):
+    error = Exception(message)
+    error.get_http_status_code = lambda: 400
+    return error
+
+
+def test_sync_dead_letters_rejected_records(spool, client):
+    for i in range(3):
+        spool.log_param('remote-run', f'p{i}', i)
+    client.log_batch.side_effect = lambda run_id, params, **kw: (
+        (_ for _ in ()).throw(_rejected()) if any(p.key == 'p1' for p in params) else None)
+
+    stats = spool.sync(client=client)
+
+    dead = [json.loads(line) for line in spool.dead_letter_path.read_text().splitlines()]
+    assert [r['key'] for r in dead] == ['p1']
+    assert 'INVALID_PARAMETER_VALUE' in dead[0]['error']
+    assert stats['dead_lettered'] == 1
+    assert stats['records'] == 3
+    assert spool.pending() == 0
+
+
+def test_sync_dead_letters_corrupt_lines(spool, client):
+    spool.log_metric('remote-run', 'loss', 1.0)
+    with open(spool.path, 'a') as f:
+        f.write('{"seq": 2, "op": "met\n')
+    spool.log_param('remote-run', 'lr', 0.1)
+    with open(spool.path, 'a') as f:
+        f.write('not json\n')
+
+    assert spool.pending() == 2
+    stats = spool.sync(client=client)
+
+    dead = [json.loads(line) for line in spool.dead_letter_path.read_text().splitlines()]
+    assert [r['line'] for r in dead] == ['{"seq": 2, "op": "met', 'not json']
+    assert stats['dead_lettered'] == 2
+    assert stats['records'] == 2
+    assert spool.path.stat().st_size == 0
+    assert spool.pending() == 0
+
+
+def test_sync_dead_letters_rejected_run_start(spool, client):
+    spool.start_run(run_name='r1', experiment_id='bad')
+    spool.end_run()
+    client.search_runs.side_effect = _rejected('RESOURCE_DOES_NOT_EXIST')
+
+    stats = spool.sync(client=client)
+
+    assert stats['dead_lettered'] == 1
+    client.set_terminated.assert_not_called()
+    assert spool.pending() == 0
+
+
+def test_sync_stops_on_transient_error(spool, client):
+    spool.log_param('remote-run', 'lr', 0.1)
+    error = _rejected()
+    error.get_http_status_code = lambda: 429
+    client.log_batch.side_effect = error
+
+    with pytest.raises(Exception):
+        spool.sync(client=client)
+
+    assert spool.pending() == 1
+    assert not spool.dead_letter_path.exists()
+
+
+def test_sync_compacts_replayed_spool(spool, client):
+    spool.log_metric('remote-run', 'loss', 1.0)
+    spool.sync(client=client)
+
+    assert spool.path.stat().st_size == 0
+    assert json.loads(spool.state_path.read_text())['offset'] == 0
+
+    spool.log_param('remote-run', 'lr', 0.1)
+    stats = spool.sync(client=client)
+
+    assert stats['records'] == 1
+    assert stats['committed_seq'] == 2
+
+
+def test_sync_keeps_partially_replayed_spool(spool, client):
+    spool.log_metric('remote-run', 'loss', 1.0)
+    with open(spool.path, 'a') as f:
+        f.write('{"seq": 2, "op": "met')
+
+    spool.sync(client=client)
+
+    assert spool.path.read_text().endswith('"op": "met')
+
+
+def test_start_run_nested_and_resumed(spool, client):
+    parent = spool.start_run(run_name='parent', description='sweep')
+    child = spool.start_run(run_name='child', nested=True)
+    assert spool.active_run_id == child.info.run_id
+    spool.end_run()
+    assert spool.active_run_id == parent.info.run_id
+    spool.end_run()
+    with pytest.raises(ValueError):
+        with spool.start_run(run_id='server-run'):
+            spool.start_run()
+
+    spool.sync(client=client)
+
+    first, second = client.create_run.call_args_list
+    assert first.kwargs['tags']['mlflow.note.content'] == 'sweep'
+    assert second.kwargs['tags']['mlflow.parentRunId'] == 'server-run'
+    assert client.create_run.call_count == 2
+    assert client.set_terminated.call_args.args == ('server-run',)
+
+
+def test_cli_status_and_sync(spool, client, capsys):
+    spool.log_param('remote-run', 'lr', 0.1)
+
+    main(['status', str(spool.path)])
+    with patch('mlflow.MlflowClient', return_value=client), \
+            patch('mlflow.set_tracking_uri') as mock_uri:
+        main(['sync', str(spool.path), '--tracking-uri', 'http://mlflow:5000'])
+
+    out = capsys.readouterr().out
+    assert '1 pending records' in out
+    assert 'Synced 1 records in 1 batches' in out
+    mock_uri.assert_called_once_with('http://mlflow:5000')
+
+
+@patch('mlflow.active_run', return_value=None)
+@patch('mlflow.log_metric')
+@patch('mlflow.start_run')
+def test_wrapper_spool_mode(mock_start, mock_log, mock_active, tmp_path, client):
+    wrapper = MLflowWrapper()
+    wrapper.enable_spool(str(tmp_path / 'spool.jsonl'))
+
+    with wrapper.start_run(run_name='offline') as run:
+        wrapper.log_metric('loss', 0.1, step=1)
+        wrapper.log_params({'lr': 0.01})
+        assert wrapper.active_run().info.run_id == run.info.run_id
+
+    mock_start.assert_not_called()
+    mock_log.assert_not_called()
+    with patch('mlflow.MlflowClient', return_value=client):
+        stats = wrapper.sync_spool()
+    assert stats['records'] == 4
+    wrapper.disable_spool(sync=False)
+
+
+def test_wrapper_spool_mode_rejects_unsupported_arguments(tmp_path):
+    wrapper = MLflowWrapper()
+    wrapper.enable_spool(str(tmp_path / 'spool.jsonl'))
+
+    with pytest.raises(ValueError, match='log_system_metrics'):
+        wrapper.start_run(run_name='offline', log_system_metrics=True)
+    run = wrapper.start_run(run_name='offline', description='notes', log_system_metrics=None)
+
+    assert wrapper.active_run().info.run_id == run.info.run_id
+    wrapper.disable_spool(sync=False)
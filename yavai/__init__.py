@@ -3,6 +3,8 @@ YAVAI Python Library
 Public API surface
 """
 
+from typing import Optional
+
 # ============================================================
 # Internal shared context (NO io imports here)
 # ============================================================
@@ -26,6 +28,16 @@ def browse_dataset(dataset_id: str):
     return _api.browse_dataset(dataset_id)
 
 
+def iter_dataset_files(dataset_id: str, page_size: int = 1000):
+    """Lazily iterate over dataset files, page by page."""
+    return _api.iter_dataset_files(dataset_id, page_size=page_size)
+
+
+def build_manifest(dataset_id: str, path: Optional[str] = None, refresh: bool = True):
+    """Build a local file manifest for a dataset and use it for path lookups."""
+    return _api.build_manifest(dataset_id, path=path, refresh=refresh)
+
+
 def browse_file(file_id: str):
     """Browse file metadata."""
     return _api.browse_file(file_id)
@@ -102,11 +114,11 @@ def log_text(text: str, artifact_file: str):
     return _tracker.log_text(text, artifact_file)
 
 
-def log_artifact(local_path: str, artifact_path: str = None):
+def log_artifact(local_path: str, artifact_path: Optional[str] = None):
     return _tracker.log_artifact(local_path, artifact_path)
 
 
-def log_artifacts(local_dir: str, artifact_path: str = None):
+def log_artifacts(local_dir: str, artifact_path: Optional[str] = None):
     return _tracker.log_artifacts(local_dir, artifact_path)
 
 
@@ -126,6 +138,37 @@ def log_model(model, artifact_path: str, **kwargs):
     return _tracker.log_model(model, artifact_path, **kwargs)
 
 
+def enable_async_logging(flush_interval: float = 5.0, batch_size: int = 1000,
+                         max_queue: int = 100_000):
+    """Queue metrics/params/tags and send them in background batches."""
+    return _tracker.enable_async_logging(flush_interval=flush_interval, batch_size=batch_size,
+                                         max_queue=max_queue)
+
+
+def disable_async_logging():
+    return _tracker.disable_async_logging()
+
+
+def flush(timeout: Optional[float] = None):
+    """Send queued async tracking data to the server."""
+    return _tracker.flush(timeout)
+
+
+def enable_spool(path: Optional[str] = None, sync_interval: Optional[float] = None,
+                 fsync: bool = False):
+    """Record tracking calls to a local write-ahead spool, replayed to the server later."""
+    return _tracker.enable_spool(path=path, sync_interval=sync_interval, fsync=fsync)
+
+
+def disable_spool(sync: bool = True):
+    return _tracker.disable_spool(sync=sync)
+
+
+def sync_spool(batch_size: int = 1000):
+    """Replay pending spooled tracking records to the server."""
+    return _tracker.sync_spool(batch_size=batch_size)
+
+
 def set_tracking_uri(uri: str):
     return _tracker.set_tracking_uri(uri)
 
@@ -179,6 +222,8 @@ __all__ = [
 
     # Dataset browsing
     "browse_dataset",
+    "iter_dataset_files",
+    "build_manifest",
     "browse_file",
     "browse_modelzoo",
     "get_table_preview",
@@ -204,6 +249,12 @@ __all__ = [
     "log_figure",
     "log_image",
     "log_model",
+    "enable_async_logging",
+    "disable_async_logging",
+    "flush",
+    "enable_spool",
+    "disable_spool",
+    "sync_spool",
     "set_tracking_uri",
     "get_tracking_uri",
     "is_tracking_uri_set",
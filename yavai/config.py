@@ -21,3 +21,6 @@ AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
 MLFLOW_S3_ENDPOINT_URL = os.environ.get("MLFLOW_S3_ENDPOINT_URL")
 
+# JDBC driver provisioning
+JAR_MIRROR_DIR = os.environ.get("YAVAI_JAR_MIRROR")
+MAVEN_REPO_URL = os.environ.get("YAVAI_MAVEN_URL")
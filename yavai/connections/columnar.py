@@ -0,0 +1,197 @@
+# yavai/connections/columnar.py
+
+"""Column-wise conversion of JDBC result sets into pandas/NumPy columns."""
+
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# java.sql.Types constants
+BIT = -7
+TINYINT = -6
+SMALLINT = 5
+INTEGER = 4
+BIGINT = -5
+FLOAT = 6
+REAL = 7
+DOUBLE = 8
+NUMERIC = 2
+DECIMAL = 3
+CHAR = 1
+VARCHAR = 12
+LONGVARCHAR = -1
+NCHAR = -15
+NVARCHAR = -9
+LONGNVARCHAR = -16
+DATE = 91
+TIME = 92
+TIMESTAMP = 93
+TIMESTAMP_WITH_TIMEZONE = 2014
+BOOLEAN = 16
+
+INT_TYPES = {TINYINT, SMALLINT, INTEGER, BIGINT}
+FLOAT_TYPES = {FLOAT, REAL, DOUBLE}
+DECIMAL_TYPES = {NUMERIC, DECIMAL}
+BOOL_TYPES = {BIT, BOOLEAN}
+STRING_TYPES = {CHAR, VARCHAR, LONGVARCHAR, NCHAR, NVARCHAR, LONGNVARCHAR}
+DATETIME_TYPES = {DATE, TIMESTAMP, TIMESTAMP_WITH_TIMEZONE}
+
+
+class _Column:
+    """Growable typed buffer for one result column."""
+
+    __slots__ = ("name", "kind", "values", "mask", "read")
+
+    def __init__(self, name: str, kind: str, capacity: int, read: Callable):
+        self.name = name
+        self.kind = kind
+        self.read = read
+        if kind == "int":
+            self.values = np.zeros(capacity, dtype=np.int64)
+        elif kind == "float":
+            self.values = np.full(capacity, np.nan, dtype=np.float64)
+        elif kind == "bool":
+            self.values = np.zeros(capacity, dtype=bool)
+        else:
+            self.values = np.empty(capacity, dtype=object)
+        self.mask = np.zeros(capacity, dtype=bool) if kind in ("int", "bool") else None
+
+    def grow(self, capacity: int) -> None:
+        extra = capacity - len(self.values)
+        if self.kind == "float":
+            pad = np.full(extra, np.nan, dtype=np.float64)
+        elif self.values.dtype == object:
+            pad = np.empty(extra, dtype=object)
+        else:
+            pad = np.zeros(extra, dtype=self.values.dtype)
+        self.values = np.concatenate([self.values, pad])
+        if self.mask is not None:
+            self.mask = np.concatenate([self.mask, np.zeros(extra, dtype=bool)])
+
+    def to_array(self, n: int):
+        values = self.values[:n]
+        if self.mask is not None:
+            mask = self.mask[:n]
+            if not mask.any():
+                return values
+            if self.kind == "int":
+                return pd.arrays.IntegerArray(values, mask)
+            return pd.arrays.BooleanArray(values, mask)
+        if self.kind == "datetime":
+            return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce").array
+        return values
+
+
+def _column_kind(jdbc_type: int, precision: int, scale: int) -> str:
+    """Pick the NumPy-backed buffer kind for a java.sql.Types code."""
+    if jdbc_type in INT_TYPES:
+        return "int"
+    if jdbc_type in DECIMAL_TYPES:
+        return "int" if scale == 0 and 0 < precision <= 18 else "float"
+    if jdbc_type in FLOAT_TYPES:
+        return "float"
+    if jdbc_type in BOOL_TYPES:
+        return "bool"
+    if jdbc_type in DATETIME_TYPES:
+        return "datetime"
+    if jdbc_type in STRING_TYPES:
+        return "string"
+    return "object"
+
+
+def _reader(rs, kind: str, jdbc_type: int, col: int, converter: Optional[Callable]) -> Callable:
+    """Return a zero-argument callable reading column ``col`` of the current row."""
+    get_object = rs.getObject
+    if kind in ("int", "float"):
+        # getObject is a single JVM call that yields None for SQL NULL
+        cast = int if kind == "int" else float
+        if jdbc_type in DECIMAL_TYPES:
+            method = "longValue" if kind == "int" else "doubleValue"
+
+            def read_decimal():
+                value = get_object(col)
+                if value is None or isinstance(value, (int, float)):
+                    return value
+                return getattr(value, method)()
+            return read_decimal
+
+        def read_number():
+            value = get_object(col)
+            return None if value is None else cast(value)
+        return read_number
+    if kind == "bool":
+        get_boolean, was_null = rs.getBoolean, rs.wasNull
+
+        def read_bool():
+            value = get_boolean(col)
+            return None if was_null() else bool(value)
+        return read_bool
+    if kind in ("string", "datetime"):
+        # Timestamps are parsed in one vectorised pass at the end
+        get_string = rs.getString
+        return lambda: get_string(col)
+    if converter is not None:
+        return lambda: converter(rs, col)
+    return lambda: get_object(col)
+
+
+def fetch_columns(cursor, max_rows: Optional[int] = None, fetch_size: Optional[int] = None,
+                  capacity: int = 4096) -> Optional[pd.DataFrame]:
+    """
+    Read the open result set of a jaydebeapi cursor column-wise.
+
+    Each column is read with a single typed accessor into a preallocated
+    NumPy buffer, skipping jaydebeapi's per-row tuple construction and
+    per-cell type dispatch. Integer and boolean columns containing NULLs
+    become pandas nullable arrays, timestamps become datetime64.
+
+    Args:
+        cursor: jaydebeapi cursor after ``execute``
+        max_rows: Stop after this many rows (None reads to the end)
+        fetch_size: JDBC fetch size hint for the result set
+        capacity: Initial buffer size in rows
+
+    Returns:
+        DataFrame, or None when the cursor has no result set
+    """
+    rs = getattr(cursor, "_rs", None)
+    meta = getattr(cursor, "_meta", None)
+    if rs is None or meta is None:
+        return None
+
+    converters = getattr(cursor, "_converters", None) or {}
+    n_cols = meta.getColumnCount()
+    if max_rows is not None:
+        capacity = max(1, min(capacity, max_rows))
+    if fetch_size:
+        rs.setFetchSize(fetch_size)
+
+    columns: List[_Column] = []
+    for col in range(1, n_cols + 1):
+        jdbc_type = meta.getColumnType(col)
+        kind = _column_kind(jdbc_type, meta.getPrecision(col), meta.getScale(col))
+        read = _reader(rs, kind, jdbc_type, col, converters.get(jdbc_type))
+        columns.append(_Column(meta.getColumnName(col), kind, capacity, read))
+
+    n = 0
+    while (max_rows is None or n < max_rows) and rs.next():
+        if n == capacity:
+            capacity *= 2
+            for column in columns:
+                column.grow(capacity)
+        for column in columns:
+            value = column.read()
+            if value is None:
+                if column.mask is not None:
+                    column.mask[n] = True
+                continue
+            if column.kind == "string":
+                value = str(value)
+            column.values[n] = value
+        n += 1
+
+    # Build positionally so duplicate column names survive
+    df = pd.DataFrame({i: c.to_array(n) for i, c in enumerate(columns)})
+    df.columns = [c.name for c in columns]
+    return df
@@ -0,0 +1,192 @@
+# yavai/connections/dtypes.py
+
+"""Map DB-API result type codes to NumPy/pandas dtypes."""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from yavai.connections.columnar import _column_kind
+
+# String columns with at least this many rows may become categorical
+CATEGORICAL_MIN_ROWS = 1000
+
+# java.sql.Types names, as found in jaydebeapi's DBAPITypeObject.values
+_JDBC_NAME_KINDS = {
+    "BOOLEAN": "int", "BIT": "int", "TINYINT": "int", "SMALLINT": "int",
+    "INTEGER": "int", "BIGINT": "int",
+    "FLOAT": "float", "REAL": "float", "DOUBLE": "float",
+    "DECIMAL": "decimal", "NUMERIC": "decimal",
+    "DATE": "datetime", "TIMESTAMP": "datetime",
+    "CHAR": "string", "NCHAR": "string", "VARCHAR": "string", "NVARCHAR": "string",
+    "CLOB": "string", "LONGVARCHAR": "string", "LONGNVARCHAR": "string", "NCLOB": "string",
+}
+
+# PyHive type codes
+_HIVE_KINDS = {
+    "BOOLEAN_TYPE": "bool",
+    "TINYINT_TYPE": "int", "SMALLINT_TYPE": "int", "INT_TYPE": "int", "BIGINT_TYPE": "int",
+    "FLOAT_TYPE": "float", "DOUBLE_TYPE": "float", "DECIMAL_TYPE": "float",
+    "TIMESTAMP_TYPE": "datetime", "DATE_TYPE": "datetime",
+    "STRING_TYPE": "string", "VARCHAR_TYPE": "string", "CHAR_TYPE": "string",
+}
+
+
+def column_kind(type_code: Any, precision: Optional[int] = None,
+                scale: Optional[int] = None) -> str:
+    """
+    Classify a ``cursor.description`` type code.
+
+    Accepts java.sql.Types integers, jaydebeapi DBAPITypeObjects and PyHive
+    type strings. Returns one of int, float, bool, datetime, string, object.
+    """
+    if type_code is None:
+        return "object"
+    if isinstance(type_code, int):
+        return _column_kind(type_code, precision or 0, scale or 0)
+    if isinstance(type_code, str):
+        return _HIVE_KINDS.get(type_code.upper(), "object")
+
+    kinds = {_JDBC_NAME_KINDS[name] for name in getattr(type_code, "values", ())
+             if name in _JDBC_NAME_KINDS}
+    if len(kinds) != 1:
+        return "object"
+    kind = kinds.pop()
+    if kind == "decimal":
+        return "int" if scale == 0 and precision and 0 < precision <= 18 else "float"
+    return kind
+
+
+def _is_kind(series: pd.Series, kind: str) -> bool:
+    """Whether the column already has the dtype ``kind`` maps to."""
+    dtype = series.dtype
+    if kind == "int":
+        return bool(pd.api.types.is_integer_dtype(dtype))
+    if kind == "float":
+        return bool(pd.api.types.is_float_dtype(dtype))
+    if kind == "bool":
+        return bool(pd.api.types.is_bool_dtype(dtype))
+    return bool(pd.api.types.is_datetime64_any_dtype(dtype))
+
+
+def _set_column(df: pd.DataFrame, i: int, values) -> None:
+    """Replace column ``i`` by position, so duplicate column names are safe."""
+    if hasattr(df, "isetitem"):
+        df.isetitem(i, values)
+    else:
+        # pandas < 1.5, where a full-column iloc assignment replaces the column
+        df.iloc[:, i] = values
+
+
+def _convert(series: pd.Series, kind: str) -> pd.Series:
+    has_nulls = series.isna().any()
+    if kind == "int":
+        if pd.api.types.is_float_dtype(series.dtype):
+            # NULLs made pandas infer float64; restore integers where exact
+            try:
+                return series.astype("Int64")
+            except (TypeError, ValueError):
+                return series
+        # jaydebeapi reports BOOLEAN/BIT in the same type group as integers
+        first = series.dropna().head(1)
+        if len(first) and isinstance(first.iloc[0], bool):
+            kind = "bool"
+        else:
+            try:
+                if has_nulls:
+                    values = pd.array(series.to_numpy(dtype=object), dtype="Int64")
+                    return pd.Series(values, index=series.index, name=series.name)
+                return series.astype("int64")
+            except (TypeError, ValueError, OverflowError):
+                return pd.to_numeric(series, errors="coerce")
+    if kind == "bool":
+        return series.astype("boolean") if has_nulls else series.astype(bool)
+    if kind == "float":
+        # float() per element is much faster than to_numeric on Decimals
+        values = series.to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = np.nan
+        try:
+            return pd.Series(values.astype(np.float64), index=series.index, name=series.name)
+        except (TypeError, ValueError):
+            return pd.to_numeric(series, errors="coerce").astype("float64")
+    if kind == "datetime":
+        return pd.to_datetime(series, errors="coerce")
+    return series
+
+
+def convert_types(df: pd.DataFrame, description: Optional[Sequence]) -> pd.DataFrame:
+    """
+    Convert the columns of a fetched DataFrame using the cursor description:
+    integers become int64 (nullable Int64 when NULLs are present), floats and
+    decimals float64, booleans bool/boolean and dates/timestamps datetime64.
+    Columns that are already typed, or whose type is unknown, are left as is.
+    """
+    if not description or df.empty:
+        return df
+    converted = {}
+    for i, desc in enumerate(description[:df.shape[1]]):
+        if len(desc) < 2:
+            continue
+        precision = desc[4] if len(desc) > 4 else None
+        scale = desc[5] if len(desc) > 5 else None
+        kind = column_kind(desc[1], precision, scale)
+        series = df.iloc[:, i]
+        if kind in ("int", "float", "bool", "datetime") and not _is_kind(series, kind):
+            converted[i] = _convert(series, kind)
+    if not converted:
+        return df
+    df = df.copy(deep=False)
+    for i, series in converted.items():
+        _set_column(df, i, series)
+    return df
+
+
+def rows_to_batch(rows: list, columns: List[str], as_arrow: bool = False,
+                  description: Optional[Sequence] = None):
+    """Convert fetched rows to a typed DataFrame or a pyarrow RecordBatch."""
+    df = convert_types(pd.DataFrame(rows, columns=columns), description)
+    if not as_arrow:
+        return df
+    import pyarrow as pa
+    return pa.RecordBatch.from_pandas(df, preserve_index=False)
+
+
+def categorize(df: pd.DataFrame, threshold: Optional[float] = 0.5,
+               min_rows: int = CATEGORICAL_MIN_ROWS) -> pd.DataFrame:
+    """
+    Convert low-cardinality string columns to ``category``.
+
+    A column qualifies when the frame has at least ``min_rows`` rows and its
+    number of distinct values is at most ``threshold`` times the row count.
+    """
+    if threshold is None or not isinstance(df, pd.DataFrame) or len(df) < min_rows:
+        return df
+    limit = threshold * len(df)
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            continue
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            continue
+        try:
+            if series.nunique(dropna=True) <= limit:
+                _set_column(df, i, series.astype("category"))
+        except TypeError:
+            # Unhashable values (e.g. arrays) cannot be categories
+            continue
+    return df
+
+
+def apply_dtypes(df: pd.DataFrame, dtypes: Optional[Dict[str, Any]]) -> pd.DataFrame:
+    """Apply user dtype overrides (``{column: dtype}``)."""
+    if not dtypes or not isinstance(df, pd.DataFrame):
+        return df
+    for column, dtype in dtypes.items():
+        if column not in df.columns:
+            raise KeyError(f"dtype override for unknown column: {column}")
+        if str(dtype).startswith("datetime64"):
+            df[column] = pd.to_datetime(df[column], errors="coerce")
+        else:
+            df[column] = df[column].astype(dtype)
+    return df
@@ -0,0 +1,131 @@
+# yavai/connections/hive.py
+
+"""Pure-Python HiveServer2 backend for the JDBC facade, built on PyHive."""
+
+import logging
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import unquote
+
+import pandas as pd
+
+from yavai.connections.dtypes import convert_types, rows_to_batch
+
+
+class HiveBackend:
+    """
+    Executes queries against HiveServer2 over Thrift with PyHive.
+
+    No JVM is started and no driver JARs are downloaded. ``arraysize`` is the
+    number of rows requested from the server per fetch round trip.
+    """
+
+    name = "hive"
+
+    def __init__(self, url: str, user: Optional[str] = None, password: Optional[str] = None,
+                 kerberos: bool = False, arraysize: int = 10000,
+                 configuration: Optional[Dict[str, str]] = None):
+        try:
+            from pyhive import hive
+        except ImportError:
+            raise ImportError("PyHive is required. "
+                              "Install it with: pip install 'pyhive[hive-pure-sasl]'")
+
+        if arraysize < 1:
+            raise ValueError("arraysize must be a positive integer")
+        self.arraysize = arraysize
+
+        params = self.parse_url(url)
+        if configuration:
+            params.setdefault("configuration", {}).update(configuration)
+        if user:
+            params["username"] = user
+        if kerberos:
+            params["auth"] = "KERBEROS"
+            params.setdefault("kerberos_service_name", "hive")
+        if password and params.get("auth") != "KERBEROS":
+            params["password"] = password
+            if params.get("scheme"):
+                params.setdefault("auth", "BASIC")
+            elif params.get("auth") not in ("LDAP", "CUSTOM"):
+                params["auth"] = "LDAP"
+        self._conn = hive.Connection(**params)
+        logging.info("Connected via native Hive backend")
+
+    @staticmethod
+    def parse_url(url: str) -> Dict[str, Any]:
+        """
+        Translate a ``jdbc:hive2://host:port/db;key=value?hive_conf`` URL into
+        ``pyhive.hive.Connection`` arguments.
+        """
+        rest = url[len("jdbc:hive2://"):] if url.lower().startswith("jdbc:hive2://") else url
+        rest, _, conf = rest.partition("?")
+        conf = conf.partition("#")[0]
+        location, *session = rest.split(";")
+        hostport, _, database = location.partition("/")
+        host, _, port = hostport.partition(":")
+
+        params: Dict[str, Any] = {"host": host, "port": int(port) if port else 10000,
+                                  "database": unquote(database) or "default"}
+        options = dict(item.split("=", 1) for item in session if "=" in item)
+
+        auth = options.get("auth", "").lower()
+        if auth == "nosasl":
+            params["auth"] = "NOSASL"
+        elif options.get("principal"):
+            params["auth"] = "KERBEROS"
+            params["kerberos_service_name"] = options["principal"].split("/")[0]
+        if options.get("user"):
+            params["username"] = options["user"]
+        if options.get("password"):
+            params["password"] = options["password"]
+
+        if options.get("transportMode", "").lower() == "http":
+            params["scheme"] = "https" if options.get("ssl", "").lower() == "true" else "http"
+            if options.get("httpPath", "cliservice").strip("/") != "cliservice":
+                raise ValueError("PyHive only supports httpPath=cliservice for HTTP transport")
+
+        if conf:
+            params["configuration"] = dict(
+                item.split("=", 1) for item in conf.split(";") if "=" in item
+            )
+        return params
+
+    def _cursor(self):
+        return self._conn.cursor(arraysize=self.arraysize)
+
+    def execute(self, query: str):
+        """Execute a query and return its result as a DataFrame, or None."""
+        cursor = self._cursor()
+        try:
+            cursor.execute(query)
+            if not cursor.description:
+                return None
+            cols = [d[0] for d in cursor.description]
+            rows = []
+            while True:
+                chunk = cursor.fetchmany(self.arraysize)
+                if not chunk:
+                    break
+                rows.extend(chunk)
+            return convert_types(pd.DataFrame(rows, columns=cols), cursor.description)
+        finally:
+            cursor.close()
+
+    def execute_iter(self, query: str, batch_size: int = 10000, as_arrow: bool = False) -> Iterator:
+        """Stream a query result in batches of at most ``batch_size`` rows."""
+        cursor = self._cursor()
+        try:
+            cursor.execute(query)
+            if not cursor.description:
+                return
+            cols = [d[0] for d in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows_to_batch(rows, cols, as_arrow, cursor.description)
+        finally:
+            cursor.close()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,155 @@
+# yavai/connections/instrumentation.py
+
+"""Opt-in per-query timing for the JDBC facade."""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+# Rows sampled when estimating the in-memory size of a result
+_SIZE_SAMPLE_ROWS = 1000
+
+# Phase timings aggregated by QueryProfiler.summary()
+PHASES = ("connect_s", "execute_s", "first_row_s", "fetch_s", "convert_s", "total_s")
+
+
+def estimate_bytes(result) -> Optional[int]:
+    """Approximate size of a result, extrapolated from a sample of its rows."""
+    if isinstance(result, pd.DataFrame):
+        n = len(result)
+        if n == 0:
+            return 0
+        sample = result.iloc[:_SIZE_SAMPLE_ROWS]
+        return int(sample.memory_usage(deep=True, index=False).sum() * n / len(sample))
+    nbytes = getattr(result, "nbytes", None)
+    return int(nbytes) if nbytes is not None else None
+
+
+class QueryProfiler:
+    """
+    Collects timing records for JDBC connects and queries.
+
+    Each query record holds ``connect_s`` (time to obtain a connection),
+    ``execute_s`` (server-side execute), ``first_row_s`` (execute to first
+    row), ``fetch_s`` (execute to last row), ``convert_s`` (DataFrame
+    construction and dtype mapping), ``total_s``, ``rows`` and approximate
+    ``bytes``. Phases that cannot be separated on a given path are None.
+    Hooks are called with every finished record.
+    """
+
+    def __init__(self, max_records: int = 1000):
+        self._records: Deque[Dict] = deque(maxlen=max_records)
+        self._hooks: List[Callable[[Dict], None]] = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[Dict], None]) -> None:
+        """Call ``hook(record)`` for every finished record."""
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[Dict], None]) -> None:
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def start(self, event: str, query: Optional[str] = None,
+              datasource: Optional[str] = None) -> Dict:
+        """Open a record; pass it to ``finish`` when the operation completes."""
+        return {
+            "event": event,
+            "query": query,
+            "datasource": datasource,
+            "started_at": time.time(),
+            "connect_s": None,
+            "execute_s": None,
+            "first_row_s": None,
+            "fetch_s": None,
+            "convert_s": None,
+            "total_s": None,
+            "rows": None,
+            "bytes": None,
+            "cache_hit": False,
+            "error": None,
+            "_t0": time.perf_counter(),
+        }
+
+    def finish(self, record: Dict, result=None, error: Optional[BaseException] = None) -> Dict:
+        """Close a record, derive rows/bytes from ``result`` and notify hooks."""
+        record["total_s"] = time.perf_counter() - record.pop("_t0")
+        if error is not None:
+            record["error"] = f"{type(error).__name__}: {error}"
+        if result is not None and record["rows"] is None:
+            record["rows"] = len(result)
+            record["bytes"] = estimate_bytes(result)
+
+        with self._lock:
+            self._records.append(record)
+            hooks = list(self._hooks)
+        for hook in hooks:
+            try:
+                hook(record)
+            except Exception as e:
+                logging.warning(f"JDBC stats hook failed: {e}")
+        return record
+
+    def wrap_iter(self, iterator: Iterator, record: Dict) -> Iterator:
+        """Time a batch iterator, finishing ``record`` once it is exhausted or closed."""
+        t0 = time.perf_counter()
+        fetch = 0.0
+        rows = 0
+        nbytes = 0
+        error = None
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    batch = next(iterator)
+                except StopIteration:
+                    break
+                fetch += time.perf_counter() - started
+                if record["first_row_s"] is None:
+                    record["first_row_s"] = time.perf_counter() - t0
+                rows += len(batch)
+                nbytes += estimate_bytes(batch) or 0
+                yield batch
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            record["fetch_s"] = fetch
+            record["rows"] = rows
+            record["bytes"] = nbytes
+            self.finish(record, error=error)
+
+    def records(self, event: Optional[str] = None) -> List[Dict]:
+        """Recorded events, oldest first, optionally only ``event`` ('connect', 'query', 'iter')."""
+        with self._lock:
+            records = list(self._records)
+        return [dict(r) for r in records if event is None or r["event"] == event]
+
+    def summary(self) -> Dict:
+        """Totals over the recorded queries, per phase (connect_s includes connect() calls)."""
+        records = self.records()
+        queries = [r for r in records if r["event"] != "connect"]
+        connects = [r for r in records if r["event"] == "connect"]
+        summary = {
+            "queries": len(queries),
+            "errors": sum(1 for r in queries if r["error"]),
+            "cache_hits": sum(1 for r in queries if r["cache_hit"]),
+            "rows": sum(r["rows"] or 0 for r in queries),
+            "bytes": sum(r["bytes"] or 0 for r in queries),
+            "connects": len(connects),
+        }
+        for phase in PHASES:
+            summary[phase] = sum(r[phase] or 0.0 for r in queries)
+        # connect() time is counted alongside per-query pool acquisition
+        summary["connect_s"] += sum(r["connect_s"] or 0.0 for r in connects)
+        return summary
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
@@ -1,19 +1,266 @@
 # yavai/connections/jdbc.py
 
+import datetime
+import hashlib
 import logging
 import os
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import pandas as pd
 import requests
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Callable, Optional, Dict, Iterator, List, Union
+
+from yavai import config
+from yavai.connections.columnar import fetch_columns
+from yavai.connections.dtypes import apply_dtypes, categorize, convert_types, rows_to_batch
+from yavai.connections.instrumentation import QueryProfiler
+from yavai.connections.query_cache import QueryCache
+
+
+def _fetch_batch(cursor, batch_size: int, fetch_size: int) -> list:
+    """Fetch up to batch_size rows, fetch_size rows per round trip."""
+    rows: list = []
+    while len(rows) < batch_size:
+        wanted = min(fetch_size, batch_size - len(rows))
+        chunk = cursor.fetchmany(wanted)
+        if not chunk:
+            break
+        rows.extend(chunk)
+        if len(chunk) < wanted:
+            break
+    return rows
+
+
+def _iter_batches(cursor, batch_size: int, fetch_size: Optional[int] = None,
+                  as_arrow: bool = False) -> Iterator:
+    """Yield the result set of an executed cursor in batches."""
+    columns = [d[0] for d in cursor.description]
+    fetch_size = fetch_size or batch_size
+    while True:
+        rows = _fetch_batch(cursor, batch_size, fetch_size)
+        if not rows:
+            return
+        yield rows_to_batch(rows, columns, as_arrow, cursor.description)
+        if len(rows) < batch_size:
+            return
+
+
+def _iter_column_batches(cursor, batch_size: int, fetch_size: Optional[int] = None,
+                         as_arrow: bool = False) -> Iterator:
+    """Yield the result set of an executed jaydebeapi cursor in columnar batches."""
+    while True:
+        df = fetch_columns(cursor, max_rows=batch_size, fetch_size=fetch_size or batch_size)
+        if df is None or df.empty:
+            return
+        if as_arrow:
+            import pyarrow as pa
+            yield pa.RecordBatch.from_pandas(df, preserve_index=False)
+        else:
+            yield df
+        if len(df) < batch_size:
+            return
+
+
+class JDBCPool:
+    """
+    Thread-safe pool of connections to a single JDBC data source.
+    
+    Connections are validated when borrowed, and idle connections beyond
+    ``min_size`` are closed after ``idle_timeout`` seconds by a background
+    reaper thread, so a pool nobody borrows from still shrinks.
+    """
+
+    def __init__(self, factory: Callable, min_size: int = 0, max_size: int = 8,
+                 idle_timeout: Optional[float] = 300.0, validation_query: Optional[str] = None,
+                 validation_timeout: int = 5):
+        """
+        Args:
+            factory: Zero-argument callable opening a new DB-API connection
+            min_size: Connections opened up front and kept when idle
+            max_size: Upper bound on open connections (idle + borrowed)
+            idle_timeout: Seconds after which idle connections above min_size
+                are closed (None disables eviction)
+            validation_query: Query run to validate a borrowed connection;
+                defaults to the driver's Connection.isValid()
+            validation_timeout: Timeout in seconds for isValid()
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Require 0 <= min_size <= max_size and max_size >= 1")
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.validation_query = validation_query
+        self.validation_timeout = validation_timeout
+
+        self._cond = threading.Condition()
+        self._idle: deque = deque()  # (connection, last_used)
+        self._size = 0
+        self._closed = False
+        self._stop = threading.Event()
+
+        for _ in range(min_size):
+            self._idle.append((factory(), time.monotonic()))
+            self._size += 1
+
+        if idle_timeout is not None:
+            threading.Thread(target=self._reap, name="yavai-jdbc-pool-reaper",
+                             daemon=True).start()
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Borrow a connection, waiting up to ``timeout`` seconds if the pool
+        is exhausted.
+        
+        Raises:
+            TimeoutError: If no connection became available in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            conn, stale = None, []
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+                    stale.extend(self._evict_idle_locked())
+                    if self._idle:
+                        conn, _ = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a pooled JDBC connection")
+                    self._cond.wait(remaining)
+            self._close_quietly(stale)
+
+            if conn is None:
+                try:
+                    return self._factory()
+                except Exception:
+                    self._forget()
+                    raise
+
+            if self._validate(conn):
+                return conn
+            logging.warning("Discarding invalid pooled JDBC connection")
+            self._forget()
+            self._close_quietly([conn])
+
+    def release(self, conn, discard: bool = False) -> None:
+        """Return a borrowed connection, or close it when ``discard`` is True."""
+        with self._cond:
+            if not (discard or self._closed):
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+                return
+        self._forget()
+        self._close_quietly([conn])
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Borrow a connection for the duration of a ``with`` block."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones are closed when released."""
+        self._stop.set()
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        self._close_quietly(idle)
+
+    def stats(self) -> Dict[str, int]:
+        """Current pool occupancy."""
+        with self._cond:
+            return {"size": self._size, "idle": len(self._idle),
+                    "in_use": self._size - len(self._idle)}
+
+    def _evict_idle_locked(self) -> list:
+        """Remove idle connections past idle_timeout; caller holds the lock."""
+        if self.idle_timeout is None:
+            return []
+        now = time.monotonic()
+        stale = []
+        # Oldest connections sit at the left end of the deque
+        while (self._idle and self._size > self.min_size
+               and now - self._idle[0][1] > self.idle_timeout):
+            stale.append(self._idle.popleft()[0])
+            self._size -= 1
+        return stale
+
+    def _reap(self) -> None:
+        """Close idle connections as they expire, without waiting for an acquire."""
+        assert self.idle_timeout is not None
+        delay = self.idle_timeout
+        while not self._stop.wait(delay):
+            with self._cond:
+                stale = self._evict_idle_locked()
+                # Sleep until the oldest evictable connection expires
+                if self._idle and self._size > self.min_size:
+                    expires = self._idle[0][1] + self.idle_timeout
+                    delay = max(0.0, expires - time.monotonic()) + 0.01
+                else:
+                    delay = self.idle_timeout
+            self._close_quietly(stale)
+
+    def _validate(self, conn) -> bool:
+        try:
+            if self.validation_query:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(self.validation_query)
+                finally:
+                    cursor.close()
+                return True
+            jconn = getattr(conn, "jconn", None)
+            if jconn is not None:
+                return bool(jconn.isValid(self.validation_timeout))
+            return True
+        except Exception as e:
+            logging.warning(f"Pooled JDBC connection failed validation: {e}")
+            return False
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(connections) -> None:
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logging.warning(f"Error closing JDBC connection: {e}")
+
+
+MAVEN_CENTRAL = "https://repo1.maven.org/maven2"
+
 
 class JDBC:
-    # Maven Central coordinates for common JDBC drivers
+    # Maven Central coordinates for common JDBC drivers. Optional keys:
+    # "classifier" (e.g. the self-contained "standalone" hive-jdbc build) and
+    # "sha256" (pinned checksum; otherwise the repository's .sha1 is checked)
     JAR_REGISTRY = {
         "hive": {
             "group_id": "org.apache.hive",
             "artifact_id": "hive-jdbc",
             "version": "3.1.3",
+            "classifier": "standalone",
             "driver_class": "org.apache.hive.jdbc.HiveDriver"
         },
         "postgresql": {
@@ -36,10 +283,51 @@ class JDBC:
         }
     }
     
-    def __init__(self, jar_dir: Optional[str] = None, auto_download: bool = True):
+    # Column types used when write_dataframe creates a table
+    SQL_TYPES = {
+        "postgresql": {"int": "BIGINT", "float": "DOUBLE PRECISION", "bool": "BOOLEAN",
+                       "datetime": "TIMESTAMP", "string": "TEXT"},
+        "mysql": {"int": "BIGINT", "float": "DOUBLE", "bool": "BOOLEAN",
+                  "datetime": "DATETIME(6)", "string": "TEXT"},
+        "hive": {"int": "BIGINT", "float": "DOUBLE", "bool": "BOOLEAN",
+                 "datetime": "TIMESTAMP", "string": "STRING"},
+        "default": {"int": "BIGINT", "float": "DOUBLE PRECISION", "bool": "BOOLEAN",
+                    "datetime": "TIMESTAMP", "string": "VARCHAR(4000)"},
+    }
+    
+    def __init__(self, jar_dir: Optional[str] = None, auto_download: bool = True,
+                 mirror_dir: Optional[str] = None, maven_url: Optional[str] = None,
+                 max_workers: int = 4, verify_checksums: bool = True):
+        """
+        Args:
+            jar_dir: Directory holding driver JARs (defaults to ``~/.yavai/jars``)
+            auto_download: Download missing JARs from the Maven repository
+            mirror_dir: Local mirror/wheelhouse searched before downloading,
+                either flat or in Maven layout (defaults to ``YAVAI_JAR_MIRROR``)
+            maven_url: Maven repository base URL (defaults to
+                ``YAVAI_MAVEN_URL`` or Maven Central)
+            max_workers: Concurrent JAR downloads
+            verify_checksums: Refuse to install a downloaded or mirrored JAR
+                with no checksum to verify it against (no pinned SHA-256
+                and no ``.sha1``); when False it is installed with a warning
+        """
         self._conn = None
         self._cursor = None
+        self._pools: Dict[str, JDBCPool] = {}
+        self._backend = None
+        self._cache: Optional[QueryCache] = None
+        self._profiler: Optional[QueryProfiler] = None
+        self._url: Optional[str] = None
+        self._datasource_urls: Dict[str, str] = {}
         self.auto_download = auto_download
+        self.max_workers = max_workers
+        self.verify_checksums = verify_checksums
+        # Max distinct/rows ratio for turning string columns into categoricals
+        # (None, the default, keeps them as strings)
+        self.categorical_threshold: Optional[float] = None
+        mirror_dir = mirror_dir or config.JAR_MIRROR_DIR
+        self.mirror_dir = Path(mirror_dir) if mirror_dir else None
+        self.maven_url = (maven_url or config.MAVEN_REPO_URL or MAVEN_CENTRAL).rstrip("/")
         
         # Set JAR directory
         if jar_dir:
@@ -51,7 +339,78 @@ class JDBC:
         self.jar_dir.mkdir(parents=True, exist_ok=True)
         logging.info(f"JAR directory: {self.jar_dir}")
 
-    def connect(self, url: str, user: str = None, password: str = None, kerberos: bool = False):
+    def connect(self, url: str, user: str = None, password: str = None, kerberos: bool = False,
+                backend: str = "auto", backend_options: Optional[Dict[str, Any]] = None):
+        """
+        Open the connection used by ``execute``/``execute_iter``/``write_dataframe``.
+        
+        Args:
+            url: JDBC URL
+            user: Database user
+            password: Database password
+            kerberos: Use Kerberos authentication
+            backend: 'jdbc' always goes through jaydebeapi; 'native' uses a
+                pure-Python driver for the URL's database (psycopg2 for
+                PostgreSQL, PyHive for Hive); 'auto' uses the native backend
+                where it is the better default (PostgreSQL without Kerberos)
+            backend_options: Extra keyword arguments for the native backend,
+                e.g. ``{"arraysize": 50000}`` for Hive
+        """
+        if backend not in ("auto", "jdbc", "native"):
+            raise ValueError("backend must be 'auto', 'jdbc' or 'native'")
+
+        # Replacing a live connection used to leak it
+        if self._conn is not None or self._backend is not None:
+            logging.warning("Closing existing JDBC connection before reconnecting")
+            self._close_connection()
+
+        profiler = self._profiler
+        record = profiler.start("connect") if profiler else None
+        started = time.perf_counter()
+        try:
+            if self._use_native(url, backend, kerberos):
+                self._backend = self._open_backend(url, user, password, kerberos,
+                                                   backend_options or {})
+            else:
+                self._conn = self._open_connection(url, user, password, kerberos)
+                self._cursor = self._conn.cursor()
+                logging.info("Connected via JDBC")
+            self._url = url
+            if profiler is not None and record is not None:
+                record["connect_s"] = time.perf_counter() - started
+                profiler.finish(record)
+            return True
+        except Exception as e:
+            logging.error(f"JDBC Connection failed: {e}")
+            if profiler is not None and record is not None:
+                profiler.finish(record, error=e)
+            raise
+
+    @staticmethod
+    def _use_native(url: str, backend: str, kerberos: bool) -> bool:
+        """Decide whether ``connect`` should bypass the JVM."""
+        if backend == "jdbc":
+            return False
+        if backend == "native":
+            return True
+        return not kerberos and url.lower().startswith("jdbc:postgresql:")
+
+    @staticmethod
+    def _open_backend(url: str, user: Optional[str] = None, password: Optional[str] = None,
+                      kerberos: bool = False, options: Optional[Dict[str, Any]] = None):
+        """Open the native backend matching the URL's database."""
+        url_lower = url.lower()
+        if url_lower.startswith("jdbc:postgresql:"):
+            from yavai.connections.postgres import PostgresBackend
+            return PostgresBackend(url, user, password, **(options or {}))
+        if url_lower.startswith("jdbc:hive2:"):
+            from yavai.connections.hive import HiveBackend
+            return HiveBackend(url, user, password, kerberos=kerberos, **(options or {}))
+        raise ValueError(f"No native backend for URL: {url}")
+
+    def _open_connection(self, url: str, user: Optional[str] = None,
+                         password: Optional[str] = None, kerberos: bool = False):
+        """Resolve driver JARs and open a new jaydebeapi connection."""
         # Lazy import
         try:
             import jaydebeapi
@@ -61,12 +420,8 @@ class JDBC:
         # Determine required JARs based on URL
         required_jars = self._identify_required_jars(url)
         
-        # Check and download missing JARs
-        jar_paths = []
-        for jar_type, jar_info in required_jars.items():
-            jar_path = self._ensure_jar_exists(jar_type, jar_info)
-            if jar_path:
-                jar_paths.append(jar_path)
+        # Check and fetch missing JARs concurrently
+        jar_paths = self.provision_jars(url)
         
         if required_jars and not jar_paths:
             raise RuntimeError("No valid JARs found or downloaded")
@@ -80,20 +435,95 @@ class JDBC:
         if not driver_name:
             raise ValueError(f"Could not determine driver for URL: {url}")
         
-        # Connect
+        if kerberos:
+            return jaydebeapi.connect(driver_name, url, [], classpath)
+        auth = [user, password] if user else []
+        return jaydebeapi.connect(driver_name, url, auth, classpath)
+
+    def add_datasource(self, name: str, url: str, user: Optional[str] = None,
+                       password: Optional[str] = None, kerberos: bool = False,
+                       min_size: int = 0, max_size: int = 8,
+                       idle_timeout: Optional[float] = 300.0,
+                       validation_query: Optional[str] = None) -> JDBCPool:
+        """
+        Register a named data source backed by a connection pool.
+        
+        Args:
+            name: Data source name used with ``connection``/``execute``
+            url: JDBC connection URL
+            user: Database user
+            password: Database password
+            kerberos: Authenticate with Kerberos instead of user/password
+            min_size: Connections kept open when idle
+            max_size: Maximum concurrent connections
+            idle_timeout: Seconds before surplus idle connections are closed
+            validation_query: Query used to validate borrowed connections
+            
+        Returns:
+            The data source's JDBCPool
+        """
+        if name in self._pools:
+            self._pools.pop(name).close()
+        pool = JDBCPool(
+            lambda: self._open_connection(url, user, password, kerberos),
+            min_size=min_size,
+            max_size=max_size,
+            idle_timeout=idle_timeout,
+            validation_query=validation_query
+        )
+        self._pools[name] = pool
+        self._datasource_urls[name] = url
+        logging.info(f"Registered JDBC data source: {name}")
+        return pool
+
+    def remove_datasource(self, name: str) -> None:
+        """Close and unregister a named data source."""
+        pool = self._pools.pop(name, None)
+        self._datasource_urls.pop(name, None)
+        if pool is not None:
+            pool.close()
+
+    def connection(self, name: str, timeout: Optional[float] = None):
+        """
+        Borrow a pooled connection from a named data source.
+        
+        Usage:
+            with yavai.jdbc.connection("warehouse") as conn:
+                cursor = conn.cursor()
+        """
+        return self._get_pool(name).connection(timeout)
+
+    def _get_pool(self, name: str) -> JDBCPool:
         try:
-            if kerberos:
-                self._conn = jaydebeapi.connect(driver_name, url, [], classpath)
-            else:
-                auth = [user, password] if user else []
-                self._conn = jaydebeapi.connect(driver_name, url, auth, classpath)
-                
-            self._cursor = self._conn.cursor()
-            logging.info("Connected via JDBC")
-            return True
-        except Exception as e:
-            logging.error(f"JDBC Connection failed: {e}")
-            raise
+            return self._pools[name]
+        except KeyError:
+            raise ValueError(f"Unknown data source: {name}. Register it with add_datasource().")
+
+    @contextmanager
+    def _connection_scope(self, datasource: Optional[str] = None):
+        """Yield the ``connect()`` connection, or a pooled connection."""
+        if datasource is None:
+            if not self._conn:
+                raise ConnectionError("Not connected. Call connect() first.")
+            yield self._conn
+            return
+        with self.connection(datasource) as conn:
+            yield conn
+
+    @contextmanager
+    def _cursor_scope(self, datasource: Optional[str] = None):
+        """Yield the singleton cursor, or a cursor on a pooled connection."""
+        if datasource is None:
+            if not self._cursor:
+                raise ConnectionError("Not connected. Call connect() first.")
+            yield self._cursor
+            return
+        with self.connection(datasource) as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
 
     def _identify_required_jars(self, url: str) -> Dict[str, dict]:
         """Identify which JARs are needed based on the connection URL."""
@@ -111,9 +541,39 @@ class JDBC:
         
         return required
 
+    def provision_jars(self, url: str) -> List[Path]:
+        """
+        Make sure every JAR needed for ``url`` is present in ``jar_dir``.
+        
+        Missing JARs are fetched concurrently, from ``mirror_dir`` when it
+        holds them and from the Maven repository otherwise. Each one is
+        written to a temporary ``.part`` file, checked against its checksum,
+        and renamed into place, so an interrupted download never leaves a
+        truncated JAR behind.
+        
+        Args:
+            url: JDBC URL
+            
+        Returns:
+            Paths of the available JARs, in registry order
+        """
+        required = self._identify_required_jars(url)
+        if not required:
+            return []
+        workers = max(1, min(self.max_workers, len(required)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yavai-jars") as pool:
+            paths = list(pool.map(lambda item: self._ensure_jar_exists(*item), required.items()))
+        return [p for p in paths if p]
+
+    @staticmethod
+    def _jar_filename(jar_info: dict) -> str:
+        classifier = jar_info.get("classifier")
+        suffix = f"-{classifier}" if classifier else ""
+        return f"{jar_info['artifact_id']}-{jar_info['version']}{suffix}.jar"
+
     def _ensure_jar_exists(self, jar_type: str, jar_info: dict) -> Optional[Path]:
         """
-        Check if JAR exists, download if missing and auto_download is True.
+        Check if JAR exists, fetch it if missing and auto_download is True.
         
         Args:
             jar_type: Type of JAR (e.g., 'hive', 'postgresql')
@@ -123,14 +583,21 @@ class JDBC:
             Path to the JAR file or None if unavailable
         """
         # Construct expected JAR filename
-        jar_filename = f"{jar_info['artifact_id']}-{jar_info['version']}.jar"
-        jar_path = self.jar_dir / jar_filename
+        jar_path = self.jar_dir / self._jar_filename(jar_info)
         
         # Check if JAR exists
-        if jar_path.exists():
-            logging.info(f"Found {jar_type} JAR: {jar_path}")
-            return jar_path
+        installed = self._installed_jar(jar_info)
+        if installed is not None:
+            logging.info(f"Found {jar_type} JAR: {installed}")
+            return installed
         
+        mirrored = self._find_in_mirror(jar_info)
+        if mirrored is not None:
+            if self._copy_from_mirror(jar_info, mirrored, jar_path):
+                return jar_path
+            logging.error(f"Failed to copy {jar_type} JAR from mirror {mirrored}")
+            return None
+
         # If not found and auto_download is enabled, download it
         if self.auto_download:
             logging.warning(f"{jar_type} JAR not found at {jar_path}")
@@ -145,17 +612,64 @@ class JDBC:
             logging.error(f"{jar_type} JAR not found and auto_download is disabled")
             return None
 
+    def _installed_jar(self, jar_info: dict) -> Optional[Path]:
+        """
+        The JAR in ``jar_dir`` for ``jar_info``. A classified JAR (e.g. the
+        standalone hive-jdbc build) is also found under its plain
+        ``artifact-version.jar`` name, which is how it is usually placed by
+        hand and how earlier releases installed it.
+        """
+        names = [self._jar_filename(jar_info)]
+        if jar_info.get("classifier"):
+            names.append(f"{jar_info['artifact_id']}-{jar_info['version']}.jar")
+        for name in names:
+            if (self.jar_dir / name).exists():
+                return self.jar_dir / name
+        return None
+
+    def _find_in_mirror(self, jar_info: dict) -> Optional[Path]:
+        """Locate a JAR in ``mirror_dir``, flat or in Maven repository layout."""
+        if not self.mirror_dir:
+            return None
+        filename = self._jar_filename(jar_info)
+        group_path = jar_info["group_id"].replace(".", "/")
+        for candidate in (
+            self.mirror_dir / filename,
+            self.mirror_dir / group_path / jar_info["artifact_id"] / jar_info["version"] / filename,
+        ):
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def _copy_from_mirror(self, jar_info: dict, source: Path, destination: Path) -> bool:
+        sha1_file = source.with_name(source.name + ".sha1")
+        part = self._part_path(destination)
+        try:
+            expected_sha1 = None
+            if sha1_file.is_file():
+                expected_sha1 = next(iter(sha1_file.read_text().split()), None)
+            shutil.copyfile(source, part)
+            self._verify_and_install(jar_info, part, destination, expected_sha1,
+                                     require_checksum=self.verify_checksums)
+        except (OSError, ValueError) as e:
+            logging.error(f"Mirror copy failed: {e}")
+            part.unlink(missing_ok=True)
+            return False
+        logging.info(f"Copied {source} to {destination}")
+        return True
+
     def _download_jar(self, jar_info: dict, destination: Path) -> bool:
-        # Construct Maven Central URL
+        # Construct Maven repository URL
         group_path = jar_info['group_id'].replace('.', '/')
         artifact_id = jar_info['artifact_id']
         version = jar_info['version']
         
         url = (
-            f"https://repo1.maven.org/maven2/"
+            f"{self.maven_url}/"
             f"{group_path}/{artifact_id}/{version}/"
-            f"{artifact_id}-{version}.jar"
+            f"{self._jar_filename(jar_info)}"
         )
+        part = self._part_path(destination)
         
         try:
             logging.info(f"Downloading from: {url}")
@@ -169,51 +683,677 @@ class JDBC:
             
             total_size = int(response.headers.get('content-length', 0))
             
-            with open(destination, 'wb') as f:
+            with open(part, 'wb') as f:
                 if total_size == 0:
                     f.write(response.content)
                 else:
                     downloaded = 0
-                    chunk_size = 8192
+                    chunk_size = 1024 * 1024
                     for chunk in response.iter_content(chunk_size=chunk_size):
                         downloaded += len(chunk)
                         f.write(chunk)
                         
                         # Simple progress indicator
                         percent = (downloaded / total_size) * 100
-                        if downloaded % (chunk_size * 100) == 0:
+                        if downloaded % (chunk_size * 10) == 0:
                             logging.info(f"Download progress: {percent:.1f}%")
             
+            expected_sha1 = None
+            if not jar_info.get("sha256"):
+                expected_sha1 = self._fetch_sha1(url)
+            self._verify_and_install(jar_info, part, destination, expected_sha1,
+                                     require_checksum=self.verify_checksums)
             logging.info(f"Successfully downloaded to {destination}")
             return True
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, OSError, ValueError) as e:
             logging.error(f"Download failed: {e}")
-            # Clean up partial download
-            if destination.exists():
-                destination.unlink()
+            # Clean up partial download; the final path is never written
+            part.unlink(missing_ok=True)
             return False
 
-    def execute(self, query: str):
-        """Execute a SQL query and return results as a DataFrame."""
-        if not self._cursor:
+    @staticmethod
+    def _fetch_sha1(jar_url: str) -> Optional[str]:
+        """Fetch the ``.sha1`` published next to a JAR, or None if unavailable."""
+        try:
+            response = requests.get(f"{jar_url}.sha1", timeout=30)
+            response.raise_for_status()
+            return response.text.split()[0]
+        except (requests.exceptions.RequestException, IndexError) as e:
+            logging.warning(f"No checksum available for {jar_url}: {e}")
+            return None
+
+    @staticmethod
+    def _part_path(destination: Path) -> Path:
+        suffix = f"{os.getpid()}.{threading.get_ident()}.part"
+        return destination.with_name(f"{destination.name}.{suffix}")
+
+    @staticmethod
+    def _verify_and_install(jar_info: dict, part: Path, destination: Path,
+                            expected_sha1: Optional[str] = None,
+                            require_checksum: bool = False) -> None:
+        """
+        Check ``part`` against the pinned SHA-256 or published SHA-1 and
+        atomically rename it to ``destination``. Raises ValueError on mismatch,
+        or when no checksum is known and ``require_checksum`` is set.
+        """
+        expected = jar_info.get("sha256") or expected_sha1
+        if not expected:
+            if require_checksum:
+                part.unlink(missing_ok=True)
+                raise ValueError(f"No checksum to verify {destination.name} against "
+                                 f"(pass verify_checksums=False to install it unverified)")
+            logging.warning(f"Installing {destination.name} without checksum verification")
+            os.replace(part, destination)
+            return
+
+        algorithm = "sha256" if jar_info.get("sha256") else "sha1"
+        digest = hashlib.new(algorithm)
+        with open(part, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        if digest.hexdigest().lower() != expected.strip().lower():
+            part.unlink(missing_ok=True)
+            raise ValueError(f"{algorithm} mismatch for {destination.name}")
+        os.replace(part, destination)
+
+    def execute(self, query: str, columnar: bool = False, datasource: Optional[str] = None,
+                use_cache: bool = True, dtypes: Optional[Dict[str, Any]] = None):
+        """
+        Execute a SQL query and return results as a DataFrame.
+        
+        Column dtypes follow the result's type codes: integers become int64
+        (nullable Int64 with NULLs), decimals and floats float64 and
+        timestamps datetime64. Setting ``categorical_threshold`` (e.g. 0.5)
+        also turns low-cardinality string columns into ``category``.
+        
+        Args:
+            query: SQL query
+            columnar: Read the result set column-wise into typed NumPy
+                buffers instead of converting it row by row
+            datasource: Run on a pooled connection of this named data
+                source instead of the ``connect()`` connection
+            use_cache: Serve/store the result from the query cache when one
+                is enabled (see ``enable_cache``)
+            dtypes: Per-column dtype overrides, e.g. ``{"id": "int32"}``
+        """
+        profiler = self._profiler
+        record = profiler.start("query", query, datasource) if profiler else None
+        try:
+            result = self._execute_cached(query, columnar, datasource, use_cache, record)
+        except Exception as e:
+            if profiler is not None and record is not None:
+                profiler.finish(record, error=e)
+            raise
+        if profiler is not None and record is not None:
+            profiler.finish(record, result=result)
+        return apply_dtypes(result, dtypes)
+
+    def _execute_cached(self, query: str, columnar: bool, datasource: Optional[str],
+                        use_cache: bool, record: Optional[dict] = None):
+        cache = self._cache if use_cache else None
+        if cache is not None:
+            url = self._url if datasource is None else self._datasource_urls.get(datasource)
+            cached = cache.get(url, query)
+            if cached is not None:
+                logging.info("Query result served from cache")
+                if record is not None:
+                    record["cache_hit"] = True
+                return cached
+
+        result = self._execute(query, columnar, datasource, record)
+        started = time.perf_counter()
+        result = categorize(result, self.categorical_threshold)
+        if record is not None and record["convert_s"] is not None:
+            record["convert_s"] += time.perf_counter() - started
+        if cache is not None and result is not None:
+            cache.put(url, query, result)
+        return result
+
+    def _execute(self, query: str, columnar: bool = False, datasource: Optional[str] = None,
+                 record: Optional[dict] = None):
+        """Run a query; when ``record`` is given, fill in its phase timings."""
+        t0 = time.perf_counter()
+        if datasource is None and self._backend is not None:
+            result = self._backend.execute(query)
+            if record is not None:
+                # Native backends fetch and convert inside execute
+                record["connect_s"] = 0.0
+                record["execute_s"] = time.perf_counter() - t0
+            return result
+        with self._cursor_scope(datasource) as cursor:
+            started = time.perf_counter()
+            cursor.execute(query)
+            executed = time.perf_counter()
+            if record is not None:
+                record["connect_s"] = started - t0
+                record["execute_s"] = executed - started
+            if columnar:
+                # Fetch and conversion are interleaved on the columnar path
+                df = fetch_columns(cursor)
+                if record is not None:
+                    record["fetch_s"] = time.perf_counter() - executed
+                return df
+            if record is not None and cursor.description:
+                first = cursor.fetchone()
+                record["first_row_s"] = time.perf_counter() - executed
+                results = [first] + cursor.fetchall() if first is not None else []
+            else:
+                results = cursor.fetchall()
+            fetched = time.perf_counter()
+            
+            if cursor.description:
+                cols = [d[0] for d in cursor.description]
+                df = convert_types(pd.DataFrame(results, columns=cols), cursor.description)
+                if record is not None:
+                    record["fetch_s"] = fetched - executed
+                    record["convert_s"] = time.perf_counter() - fetched
+                return df
+            return None
+
+    def enable_stats(self, max_records: int = 1000,
+                     hooks: Optional[List[Callable[[dict], None]]] = None) -> QueryProfiler:
+        """
+        Record per-query timings (connect, execute, first row, fetch,
+        conversion), row counts and approximate result sizes.
+        
+        Args:
+            max_records: Most recent records kept in memory
+            hooks: Callables invoked with each finished record
+            
+        Returns:
+            The QueryProfiler collecting the records
+        """
+        self._profiler = QueryProfiler(max_records=max_records)
+        for hook in hooks or []:
+            self._profiler.add_hook(hook)
+        return self._profiler
+
+    def disable_stats(self) -> None:
+        """Stop recording timings (recorded stats are discarded)."""
+        self._profiler = None
+
+    def add_stats_hook(self, hook: Callable[[dict], None]) -> None:
+        """Call ``hook(record)`` after every query, enabling stats if needed."""
+        profiler = self._profiler or self.enable_stats()
+        profiler.add_hook(hook)
+
+    def get_stats(self, event: Optional[str] = None) -> List[dict]:
+        """
+        Recorded timings, oldest first.
+        
+        Args:
+            event: Only 'connect', 'query' or 'iter' (``execute_iter``) records
+        """
+        return self._profiler.records(event) if self._profiler else []
+
+    def stats_summary(self) -> dict:
+        """Per-phase totals over the recorded queries."""
+        return self._profiler.summary() if self._profiler else {}
+
+    def enable_cache(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None,
+                     max_bytes: int = 2 * 1024 ** 3) -> QueryCache:
+        """
+        Cache ``execute`` results as Parquet files keyed by URL and normalized SQL.
+        
+        Args:
+            cache_dir: Cache directory (defaults to ``~/.yavai/cache/jdbc``)
+            ttl: Seconds before an entry expires (None never expires)
+            max_bytes: Size bound; least recently used entries are evicted
+            
+        Returns:
+            The QueryCache in use
+        """
+        cache = self._cache = QueryCache(cache_dir=cache_dir, ttl=ttl, max_bytes=max_bytes)
+        return cache
+
+    def disable_cache(self) -> None:
+        """Stop using the query cache (cached files are kept)."""
+        self._cache = None
+
+    def invalidate_cache(self, query: Optional[str] = None,
+                         datasource: Optional[str] = None) -> int:
+        """
+        Remove cached results.
+        
+        Args:
+            query: Remove only this query's result; otherwise every result
+                for the connection (or data source) is removed
+            datasource: Named data source the results belong to
+            
+        Returns:
+            Number of entries removed
+        """
+        if self._cache is None:
+            return 0
+        url = self._url if datasource is None else self._datasource_urls.get(datasource)
+        return self._cache.invalidate(url, query)
+
+    def execute_iter(self, query: str, batch_size: int = 10000,
+                     fetch_size: Optional[int] = None, as_arrow: bool = False,
+                     columnar: bool = False, datasource: Optional[str] = None) -> Iterator:
+        """
+        Execute a SQL query and stream the results in batches.
+        
+        Rows are pulled with ``fetchmany`` so peak memory scales with the
+        batch size rather than the size of the result.
+        
+        Args:
+            query: SQL query
+            batch_size: Number of rows per yielded batch
+            fetch_size: Rows requested from the driver per round trip (JDBC
+                fetch size); defaults to batch_size
+            as_arrow: Yield pyarrow RecordBatches instead of DataFrames
+            columnar: Convert each batch column-wise (see ``execute``)
+            datasource: Stream from a pooled connection of this named data
+                source; the connection is returned once iteration finishes
+            
+        Yields:
+            DataFrames (or RecordBatches) of at most batch_size rows
+        """
+        if datasource is None and not self._cursor and self._backend is None:
             raise ConnectionError("Not connected. Call connect() first.")
+        if datasource is not None:
+            self._get_pool(datasource)
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if as_arrow:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise ImportError("pyarrow is required for as_arrow=True. "
+                                  "Install it with: pip install pyarrow")
         
-        self._cursor.execute(query)
-        results = self._cursor.fetchall()
+        profiler = self._profiler
+        record = profiler.start("iter", query, datasource) if profiler else None
+        batches = _iter_column_batches if columnar else _iter_batches
+        if datasource is None and self._backend is not None:
+            iterator = self._backend.execute_iter(query, batch_size=batch_size, as_arrow=as_arrow)
+        elif datasource is not None:
+            iterator = self._iter_pooled(datasource, query, batches, batch_size, fetch_size,
+                                         as_arrow)
+        else:
+            started = time.perf_counter()
+            try:
+                self._cursor.execute(query)
+            except Exception as e:
+                if profiler is not None and record is not None:
+                    profiler.finish(record, error=e)
+                raise
+            if record is not None:
+                record["connect_s"] = 0.0
+                record["execute_s"] = time.perf_counter() - started
+            if not self._cursor.description:
+                iterator = iter(())
+            else:
+                iterator = batches(self._cursor, batch_size, fetch_size, as_arrow)
+
+        if profiler is not None and record is not None:
+            return profiler.wrap_iter(iterator, record)
+        return iterator
+
+    def _iter_pooled(self, datasource: str, query: str, batches: Callable,
+                     batch_size: int, fetch_size: Optional[int], as_arrow: bool) -> Iterator:
+        """Stream a query on a pooled connection, holding it until exhausted."""
+        with self._cursor_scope(datasource) as cursor:
+            cursor.execute(query)
+            if cursor.description:
+                yield from batches(cursor, batch_size, fetch_size, as_arrow)
+
+    def read_table(self, table: str, partition_column: str, lower: Any, upper: Any,
+                   num_partitions: int, datasource: Optional[str] = None,
+                   columns: Union[str, List[str]] = "*", where: Optional[str] = None,
+                   as_iterator: bool = False, max_workers: Optional[int] = None,
+                   columnar: bool = False):
+        """
+        Read a table in parallel by splitting it into ranges of a column.
         
-        if self._cursor.description:
-            cols = [d[0] for d in self._cursor.description]
-            return pd.DataFrame(results, columns=cols)
-        return None
+        Like Spark's JDBC source, ``lower``/``upper`` only decide the
+        partition stride; every row is read. The first partition also picks
+        up NULLs and values below ``lower``, the last everything from the
+        final bound upward.
+        
+        Args:
+            table: Table name
+            partition_column: Numeric or date/timestamp column to split on
+            lower: Lower bound of the stride range
+            upper: Upper bound of the stride range
+            num_partitions: Number of range queries
+            datasource: Named data source whose pooled connections run the
+                partitions concurrently; None reads them one after another
+                on the ``connect()`` connection
+            columns: Column list or "*"
+            where: Optional extra filter ANDed into every partition
+            as_iterator: Yield one DataFrame per partition instead of
+                returning the concatenated result
+            max_workers: Concurrent partitions (defaults to the pool's max_size)
+            columnar: Use columnar result conversion (see ``execute``)
+            
+        Returns:
+            Combined DataFrame, or an iterator of per-partition DataFrames
+        """
+        if datasource is None and not self._cursor and self._backend is None:
+            raise ConnectionError("Not connected. Call connect() first.")
+        select = columns if isinstance(columns, str) else ", ".join(columns)
+        queries = []
+        for predicate in self._partition_predicates(partition_column, lower, upper, num_partitions):
+            condition = f"({predicate}) AND ({where})" if where else predicate
+            queries.append(f"SELECT {select} FROM {table} WHERE {condition}")
+
+        if datasource is None:
+            workers = 1
+        else:
+            workers = max_workers or self._get_pool(datasource).max_size
+        workers = max(1, min(workers, len(queries)))
+
+        partitions = self._run_partitions(queries, datasource, workers, columnar)
+        if as_iterator:
+            return partitions
+        frames = [df for df in partitions if df is not None]
+        if not frames:
+            return None
+        # Partitions get their own categories, which concat turns back into
+        # strings; categorize the combined frame instead
+        return categorize(pd.concat(frames, ignore_index=True), self.categorical_threshold)
+
+    def _run_partitions(self, queries: List[str], datasource: Optional[str],
+                        workers: int, columnar: bool) -> Iterator:
+        """
+        Run partition queries and yield their DataFrames in partition order.
+
+        At most ``workers`` partitions are in flight; the next one is
+        submitted as each result is handed out, so a slow consumer does not
+        let finished partitions pile up in memory.
+        """
+        if workers == 1:
+            for query in queries:
+                yield self.execute(query, columnar=columnar, datasource=datasource)
+            return
+        pending = iter(queries)
+        in_flight: deque = deque()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yavai-jdbc") as pool:
+            try:
+                for query in pending:
+                    in_flight.append(pool.submit(self.execute, query, columnar, datasource))
+                    if len(in_flight) == workers:
+                        break
+                while in_flight:
+                    df = in_flight.popleft().result()
+                    query = next(pending, None)
+                    if query is not None:
+                        in_flight.append(pool.submit(self.execute, query, columnar, datasource))
+                    yield df
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    @staticmethod
+    def _partition_predicates(column: str, lower: Any, upper: Any,
+                              num_partitions: int) -> List[str]:
+        """Build range predicates covering every row of ``column``."""
+        if num_partitions < 1:
+            raise ValueError("num_partitions must be a positive integer")
+        if lower > upper:
+            raise ValueError("lower must not be greater than upper")
+
+        if isinstance(lower, datetime.date):
+            span = upper - lower
+            bounds = [lower + span * i / num_partitions for i in range(1, num_partitions)]
+        else:
+            if isinstance(lower, int) and isinstance(upper, int):
+                num_partitions = max(1, min(num_partitions, upper - lower))
+                stride = (upper - lower) // num_partitions
+            else:
+                stride = (upper - lower) / num_partitions
+            bounds = [lower + stride * i for i in range(1, num_partitions)]
+
+        if not bounds:
+            return ["1=1"]
+
+        literals = [JDBC._sql_literal(b) for b in bounds]
+        predicates = [f"{column} < {literals[0]} OR {column} IS NULL"]
+        for low, high in zip(literals, literals[1:]):
+            predicates.append(f"{column} >= {low} AND {column} < {high}")
+        predicates.append(f"{column} >= {literals[-1]}")
+        return predicates
+
+    @staticmethod
+    def _sql_literal(value: Any) -> str:
+        """Render a partition bound as a SQL literal."""
+        if isinstance(value, datetime.datetime):
+            return f"'{value:%Y-%m-%d %H:%M:%S}'"
+        if isinstance(value, datetime.date):
+            return f"'{value:%Y-%m-%d}'"
+        return repr(value) if isinstance(value, float) else str(value)
+
+    def write_dataframe(self, df: pd.DataFrame, table: str, mode: str = "append",
+                        batch_size: int = 10000, datasource: Optional[str] = None,
+                        parallel: int = 1, create: bool = True) -> int:
+        """
+        Write a DataFrame to a table with batched prepared statements.
+        
+        Rows are sent with JDBC addBatch/executeBatch (``executemany``), and
+        each batch is committed in its own transaction where the driver
+        supports disabling auto-commit. Hive's driver has no addBatch, so
+        for Hive each batch is one multi-row ``INSERT ... VALUES`` statement.
+        
+        Args:
+            df: DataFrame to write
+            table: Target table name
+            mode: 'append' adds rows (creating the table if missing);
+                'overwrite' drops and recreates the table first
+            batch_size: Rows per executeBatch/commit
+            datasource: Write through a named pooled data source instead of
+                the ``connect()`` connection
+            parallel: Write this many contiguous slices of ``df`` concurrently
+                on separate pooled connections (requires ``datasource``)
+            create: Create the table from the DataFrame's dtypes if needed
+            
+        Returns:
+            Number of rows written
+        """
+        if mode not in ("append", "overwrite"):
+            raise ValueError("mode must be 'append' or 'overwrite'")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if parallel > 1 and datasource is None:
+            raise ValueError("parallel writes require a datasource registered "
+                             "with add_datasource()")
+
+        url = self._url if datasource is None else self._datasource_urls.get(datasource)
+        dialect = self._dialect(url)
+
+        if datasource is None and self._backend is not None:
+            if not hasattr(self._backend, "write_dataframe"):
+                raise NotImplementedError(
+                    f"The native {self._backend.name} backend cannot write DataFrames; "
+                    f"connect with backend='jdbc'"
+                )
+            create_sql = None
+            if create or mode == "overwrite":
+                create_sql = self._create_table_sql(df, table, dialect)
+            written = self._backend.write_dataframe(df, table, mode=mode, batch_size=batch_size,
+                                                    create_sql=create_sql)
+            logging.info(f"Wrote {written} rows to {table}")
+            return written
+
+        with self._connection_scope(datasource) as conn:
+            self._prepare_table(conn, df, table, mode, dialect, create)
+            if parallel <= 1 or len(df) <= batch_size:
+                written = self._insert_rows(conn, df, table, batch_size, dialect)
+                logging.info(f"Wrote {written} rows to {table}")
+                return written
+
+        assert datasource is not None  # parallel writes require one (checked above)
+        bounds = [len(df) * i // parallel for i in range(parallel + 1)]
+        slices = [df.iloc[lo:hi] for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+        def write_slice(part: pd.DataFrame) -> int:
+            with self.connection(datasource) as conn:
+                return self._insert_rows(conn, part, table, batch_size, dialect)
+
+        with ThreadPoolExecutor(max_workers=len(slices), thread_name_prefix="yavai-jdbc") as pool:
+            written = sum(pool.map(write_slice, slices))
+        logging.info(f"Wrote {written} rows to {table} using {len(slices)} connections")
+        return written
+
+    def _prepare_table(self, conn, df: pd.DataFrame, table: str, mode: str,
+                       dialect: str, create: bool) -> None:
+        """Drop/create the target table as required by ``mode``."""
+        statements = []
+        if mode == "overwrite":
+            statements.append(f"DROP TABLE IF EXISTS {table}")
+        if create or mode == "overwrite":
+            statements.append(self._create_table_sql(df, table, dialect))
+        if not statements:
+            return
+        cursor = conn.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+        self._commit_quietly(conn)
+
+    def _create_table_sql(self, df: pd.DataFrame, table: str, dialect: str) -> str:
+        """CREATE TABLE IF NOT EXISTS statement with SQL types mapped from dtypes."""
+        types = self.SQL_TYPES.get(dialect, self.SQL_TYPES["default"])
+        columns = ", ".join(
+            f"{name} {types[self._dtype_kind(dtype)]}" for name, dtype in df.dtypes.items()
+        )
+        return f"CREATE TABLE IF NOT EXISTS {table} ({columns})"
+
+    @staticmethod
+    def _dtype_kind(dtype) -> str:
+        """Classify a pandas dtype into a SQL_TYPES key."""
+        if pd.api.types.is_bool_dtype(dtype):
+            return "bool"
+        if pd.api.types.is_integer_dtype(dtype):
+            return "int"
+        if pd.api.types.is_float_dtype(dtype):
+            return "float"
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return "datetime"
+        return "string"
+
+    @staticmethod
+    def _dialect(url: Optional[str]) -> str:
+        url_lower = (url or "").lower()
+        for dialect in ("hive", "postgresql", "mysql"):
+            if dialect in url_lower:
+                return dialect
+        return "default"
+
+    def _insert_rows(self, conn, df: pd.DataFrame, table: str, batch_size: int,
+                     dialect: str = "default") -> int:
+        """Insert ``df`` in batches, one transaction per batch when supported."""
+        if df.empty:
+            return 0
+        columns = ", ".join(str(c) for c in df.columns)
+        placeholders = ", ".join("?" * len(df.columns))
+        if dialect == "hive":
+            return self._insert_rows_multi_value(conn, df, table, batch_size, columns,
+                                                 f"({placeholders})")
+        sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+        transactional = self._set_autocommit(conn, False)
+        cursor = conn.cursor()
+        written = 0
+        try:
+            for start in range(0, len(df), batch_size):
+                rows = self._jdbc_rows(df.iloc[start:start + batch_size])
+                try:
+                    cursor.executemany(sql, rows)
+                    if transactional:
+                        conn.commit()
+                except Exception:
+                    if transactional:
+                        conn.rollback()
+                    raise
+                written += len(rows)
+        finally:
+            cursor.close()
+            if transactional:
+                self._set_autocommit(conn, True)
+        return written
+
+    def _insert_rows_multi_value(self, conn, df: pd.DataFrame, table: str, batch_size: int,
+                                 columns: str, row: str) -> int:
+        """Insert each batch as one ``INSERT ... VALUES (...), (...)`` statement."""
+        cursor = conn.cursor()
+        written = 0
+        try:
+            for start in range(0, len(df), batch_size):
+                rows = self._jdbc_rows(df.iloc[start:start + batch_size])
+                values = ", ".join([row] * len(rows))
+                cursor.execute(f"INSERT INTO TABLE {table} ({columns}) VALUES {values}",
+                               [value for r in rows for value in r])
+                written += len(rows)
+        finally:
+            cursor.close()
+        return written
+
+    @staticmethod
+    def _jdbc_rows(df: pd.DataFrame) -> list:
+        """Convert a DataFrame slice to parameter tuples of JDBC-bindable values."""
+        df = df.copy()
+        for name in df.columns:
+            if pd.api.types.is_datetime64_any_dtype(df[name].dtype):
+                df[name] = JDBC._java_timestamps(df[name])
+        values = df.astype(object).where(df.notna(), None)
+        return list(values.itertuples(index=False, name=None))
+
+    @staticmethod
+    def _java_timestamps(series: pd.Series) -> pd.Series:
+        """Convert datetimes to java.sql.Timestamp (or strings without a JVM)."""
+        text = series.dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+        try:
+            import jpype
+            if jpype.isJVMStarted():
+                value_of = jpype.JClass("java.sql.Timestamp").valueOf
+                return text.map(lambda v: value_of(v) if isinstance(v, str) else None)
+        except ImportError:
+            pass
+        return text
+
+    @staticmethod
+    def _set_autocommit(conn, enabled: bool) -> bool:
+        """Toggle auto-commit; returns False if the driver does not support it."""
+        jconn = getattr(conn, "jconn", None)
+        if jconn is None:
+            return False
+        try:
+            jconn.setAutoCommit(enabled)
+            return True
+        except Exception as e:
+            logging.debug(f"Driver does not support toggling auto-commit: {e}")
+            return False
+
+    @staticmethod
+    def _commit_quietly(conn) -> None:
+        try:
+            conn.commit()
+        except Exception:
+            # Auto-commit connections (and Hive) reject explicit commits
+            pass
 
     def close(self):
-        """Close the database connection."""
+        """Close the database connection and all pooled data sources."""
+        self._close_connection()
+        for name in list(self._pools):
+            self.remove_datasource(name)
+        logging.info("JDBC connection closed")
+
+    def _close_connection(self):
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
         if self._cursor:
             self._cursor.close()
         if self._conn:
             self._conn.close()
-        logging.info("JDBC connection closed")
+        self._cursor = None
+        self._conn = None
 
     @staticmethod
     def _get_driver_name(url: str) -> Optional[str]:
@@ -234,7 +1374,8 @@ class JDBC:
         return {k: v['driver_class'] for k, v in self.JAR_REGISTRY.items() if v['driver_class']}
 
     def add_custom_driver(self, name: str, group_id: str, artifact_id: str, 
-                         version: str, driver_class: str):
+                         version: str, driver_class: str, classifier: Optional[str] = None,
+                         sha256: Optional[str] = None):
         """
         Add a custom driver configuration.
         
@@ -244,11 +1385,18 @@ class JDBC:
             artifact_id: Maven artifact ID
             version: Driver version
             driver_class: Fully qualified driver class name
+            classifier: Maven classifier of the JAR (e.g. 'standalone')
+            sha256: Expected SHA-256 of the JAR
         """
-        self.JAR_REGISTRY[name] = {
+        jar_info: Dict[str, Any] = {
             "group_id": group_id,
             "artifact_id": artifact_id,
             "version": version,
             "driver_class": driver_class
         }
+        if classifier:
+            jar_info["classifier"] = classifier
+        if sha256:
+            jar_info["sha256"] = sha256
+        self.JAR_REGISTRY[name] = jar_info
         logging.info(f"Added custom driver: {name}")
\ No newline at end of file
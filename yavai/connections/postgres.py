@@ -0,0 +1,498 @@
+# yavai/connections/postgres.py
+
+"""Native PostgreSQL backend for the JDBC facade, built on psycopg2 and COPY."""
+
+import io
+import logging
+import queue
+import re
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import pandas as pd
+
+# Spill COPY output to disk beyond this many bytes
+SPOOL_SIZE = 64 * 1024 * 1024
+
+# execute_iter hands COPY output to the reader in chunks of this many bytes,
+# holding at most STREAM_CHUNKS of them at a time
+STREAM_CHUNK_SIZE = 1 << 20
+STREAM_CHUNKS = 4
+
+# NULL marker for COPY TO; the server quotes real "\N" strings, which the
+# pyarrow reader keeps (quoted_strings_can_be_null=False)
+NULL_MARKER = "\\N"
+
+# PostgreSQL type OIDs -> Arrow type names
+OID_ARROW_TYPES = {
+    16: "bool",
+    20: "int64",
+    21: "int16",
+    23: "int32",
+    26: "int64",
+    700: "float32",
+    701: "float64",
+    1700: "float64",
+    18: "string",
+    19: "string",
+    25: "string",
+    1042: "string",
+    1043: "string",
+    2950: "string",
+    114: "string",
+    3802: "string",
+    1082: "date32",
+    1114: "timestamp[us]",
+    1184: "timestamp[us, tz=UTC]",
+}
+
+# Arrow type names above -> pyarrow types (resolved lazily, pyarrow is optional)
+_ARROW_TYPES = {
+    "bool": lambda pa: pa.bool_(),
+    "int16": lambda pa: pa.int16(),
+    "int32": lambda pa: pa.int32(),
+    "int64": lambda pa: pa.int64(),
+    "float32": lambda pa: pa.float32(),
+    "float64": lambda pa: pa.float64(),
+    "string": lambda pa: pa.string(),
+    "date32": lambda pa: pa.date32(),
+    "timestamp[us]": lambda pa: pa.timestamp("us"),
+    "timestamp[us, tz=UTC]": lambda pa: pa.timestamp("us", tz="UTC"),
+}
+
+# JDBC URL parameters with a libpq equivalent
+_JDBC_PARAMS = {
+    "user": "user",
+    "password": "password",
+    "sslmode": "sslmode",
+    "connectTimeout": "connect_timeout",
+    "ApplicationName": "application_name",
+    "applicationName": "application_name",
+}
+
+# Arrow types JDBC.execute returns as int64/bool (nullable Int64/boolean
+# with NULLs) and as datetime64
+_INT_TYPES = {"int16", "int32", "int64"}
+_DATETIME_TYPES = {"date32", "timestamp[us]", "timestamp[us, tz=UTC]"}
+
+_ROW_QUERY = re.compile(r"^\s*(\(\s*)*(select|with|values|table)\b", re.IGNORECASE)
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+class PostgresBackend:
+    """
+    Executes queries over a native psycopg2 connection.
+
+    Result sets are transferred with ``COPY (query) TO STDOUT`` and parsed by
+    pyarrow's multithreaded CSV reader, with column types taken from the
+    query's result description. DataFrames are written with ``COPY FROM STDIN``.
+    """
+
+    name = "postgresql"
+
+    def __init__(self, url: str, user: Optional[str] = None, password: Optional[str] = None):
+        try:
+            import psycopg2
+        except ImportError:
+            raise ImportError("psycopg2 is required. Install it with: pip install psycopg2-binary")
+
+        params = self.parse_url(url)
+        if user:
+            params["user"] = user
+        if password:
+            params["password"] = password
+        self._conn = psycopg2.connect(**params)
+        logging.info("Connected via native PostgreSQL backend")
+
+    @staticmethod
+    def parse_url(url: str) -> Dict[str, str]:
+        """Translate a ``jdbc:postgresql://host:port/db?...`` URL into libpq parameters."""
+        if url.lower().startswith("jdbc:"):
+            url = url[5:]
+        parts = urlsplit(url)
+        params = {}
+        if parts.hostname:
+            params["host"] = parts.hostname
+        if parts.port:
+            params["port"] = str(parts.port)
+        database = unquote(parts.path.lstrip("/"))
+        if database:
+            params["dbname"] = database
+        if parts.username:
+            params["user"] = unquote(parts.username)
+        if parts.password:
+            params["password"] = unquote(parts.password)
+        for key, value in parse_qsl(parts.query):
+            if key in _JDBC_PARAMS:
+                params[_JDBC_PARAMS[key]] = value
+            elif key == "currentSchema":
+                params["options"] = f"-c search_path={value}"
+        return params
+
+    @staticmethod
+    def returns_rows(query: str) -> bool:
+        """Whether ``query`` is a row-returning statement that COPY can wrap."""
+        return bool(_ROW_QUERY.match(_COMMENTS.sub(" ", query)))
+
+    def execute(self, query: str, dtype: Optional[Dict] = None, as_arrow: bool = False):
+        """
+        Execute a query and return its result as a DataFrame (or Arrow Table).
+
+        Args:
+            query: SQL query
+            dtype: Optional mapping of column name to Arrow type overriding
+                the types derived from the result description
+            as_arrow: Return a pyarrow Table
+
+        Returns:
+            DataFrame/Table for row-returning queries, otherwise None
+        """
+        if not self.returns_rows(query):
+            with self._conn.cursor() as cursor:
+                cursor.execute(query)
+                result = None
+                if cursor.description:
+                    cols = [d[0] for d in cursor.description]
+                    result = pd.DataFrame(cursor.fetchall(), columns=cols)
+            self._conn.commit()
+            return result
+
+        query = _subquery(query)
+        column_types = self._column_types(query)
+        if dtype:
+            column_types.update(dtype)
+        with self._copy_out(query) as body:
+            try:
+                from pyarrow import csv as pa_csv
+            except ImportError:
+                if as_arrow:
+                    raise ImportError("pyarrow is required for as_arrow=True. "
+                                      "Install it with: pip install pyarrow")
+                df = pd.read_csv(body, **_read_csv_options(column_types))
+                return _match_jdbc_dtypes(df, column_types)
+            table = pa_csv.read_csv(
+                body,
+                read_options=pa_csv.ReadOptions(use_threads=True),
+                convert_options=self._convert_options(pa_csv, column_types),
+            )
+        return table if as_arrow else _match_jdbc_dtypes(table.to_pandas(), column_types)
+
+    def execute_iter(self, query: str, batch_size: int = 10000, as_arrow: bool = False,
+                     dtype: Optional[Dict] = None) -> Iterator:
+        """
+        Stream a query result in batches.
+
+        COPY runs on a background thread and its output is parsed as it
+        arrives, so the first batch is yielded before the whole result has
+        been transferred and Python-side memory scales with the batch size.
+        Without pyarrow, DataFrame batches are parsed with pandas instead.
+        Statements that return no rows are executed and yield nothing.
+        """
+        if not self.returns_rows(query):
+            self.execute(query)
+            return
+
+        query = _subquery(query)
+        column_types = self._column_types(query)
+        if dtype:
+            column_types.update(dtype)
+
+        try:
+            from pyarrow import csv as pa_csv
+            import pyarrow as pa
+        except ImportError:
+            if as_arrow:
+                raise ImportError("pyarrow is required for as_arrow=True. "
+                                  "Install it with: pip install pyarrow")
+            with self._copy_stream(query) as body:
+                options = _read_csv_options(column_types)
+                for df in pd.read_csv(body, chunksize=batch_size, **options):
+                    yield _match_jdbc_dtypes(df, column_types)
+            return
+
+        with self._copy_stream(query) as body:
+            reader = pa_csv.open_csv(
+                body,
+                read_options=pa_csv.ReadOptions(block_size=STREAM_CHUNK_SIZE),
+                convert_options=self._convert_options(pa_csv, column_types),
+            )
+            pending = []
+            pending_rows = 0
+            for batch in reader:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                while pending_rows >= batch_size:
+                    table = pa.Table.from_batches(pending)
+                    head, rest = table.slice(0, batch_size), table.slice(batch_size)
+                    yield self._emit(head, as_arrow, column_types)
+                    pending = rest.to_batches()
+                    pending_rows = rest.num_rows
+            if pending_rows:
+                yield self._emit(pa.Table.from_batches(pending), as_arrow, column_types)
+
+    def write_dataframe(self, df: pd.DataFrame, table: str, mode: str = "append",
+                        batch_size: int = 100000, create_sql: Optional[str] = None) -> int:
+        """
+        Load a DataFrame with ``COPY ... FROM STDIN``, one transaction per batch.
+
+        Args:
+            df: DataFrame to write
+            table: Target table
+            mode: 'append' or 'overwrite' (drop before creating)
+            batch_size: Rows per COPY/commit
+            create_sql: CREATE TABLE statement to run first, if any
+
+        Returns:
+            Number of rows written
+        """
+        with self._conn.cursor() as cursor:
+            if mode == "overwrite":
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            if create_sql:
+                cursor.execute(create_sql)
+        self._conn.commit()
+
+        columns = ", ".join(str(c) for c in df.columns)
+        sql = f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        written = 0
+        for start in range(0, len(df), batch_size):
+            part = df.iloc[start:start + batch_size]
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE, mode="w+") as buf:
+                buf.write(_to_copy_csv(part))
+                buf.seek(0)
+                try:
+                    with self._conn.cursor() as cursor:
+                        cursor.copy_expert(sql, buf)
+                    self._conn.commit()
+                except Exception:
+                    self._conn.rollback()
+                    raise
+            written += len(part)
+        return written
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _column_types(self, query: str) -> Dict[str, str]:
+        """Arrow types for the result columns, from a zero-row execution."""
+        with self._conn.cursor() as cursor:
+            cursor.execute(f"SELECT * FROM ({query}\n) AS _yavai_q LIMIT 0")
+            description = cursor.description or []
+        self._conn.rollback()
+        return {
+            d[0]: OID_ARROW_TYPES[d[1]] for d in description if d[1] in OID_ARROW_TYPES
+        }
+
+    def _copy_out(self, query: str):
+        """Run COPY (query) TO STDOUT into a spooled binary buffer positioned at 0."""
+        buf = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE, mode="w+b")
+        try:
+            with self._conn.cursor() as cursor:
+                cursor.copy_expert(_copy_sql(query), buf)
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            buf.close()
+            raise
+        buf.seek(0)
+        return buf
+
+    def _copy_stream(self, query: str) -> "_CopyStream":
+        """Run COPY (query) TO STDOUT in the background and return its readable end."""
+        return _CopyStream(self._conn, _copy_sql(query))
+
+    @staticmethod
+    def _convert_options(pa_csv, column_types: Dict[str, Any]):
+        import pyarrow as pa
+
+        return pa_csv.ConvertOptions(
+            column_types={name: _arrow_type(pa, t) for name, t in column_types.items()},
+            null_values=[NULL_MARKER],
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=False,
+            true_values=["t", "true"],
+            false_values=["f", "false"],
+        )
+
+    @staticmethod
+    def _emit(table, as_arrow: bool, column_types: Dict[str, str]):
+        if as_arrow:
+            return table.combine_chunks().to_batches()[0]
+        return _match_jdbc_dtypes(table.to_pandas(), column_types)
+
+
+class _CopyStream(io.RawIOBase):
+    """
+    Binary reader over a ``COPY ... TO STDOUT`` running on a background thread.
+
+    Output reaches the reader through a bounded queue of STREAM_CHUNK_SIZE
+    chunks. Closing the stream before the end cancels the query and rolls
+    back, leaving the connection usable.
+    """
+
+    def __init__(self, conn, sql: str):
+        super().__init__()
+        self._conn = conn
+        self._queue: queue.Queue = queue.Queue(maxsize=STREAM_CHUNKS)
+        self._pending = bytearray()
+        self._chunk = b""
+        self._eof = False
+        self._abandoned = threading.Event()
+        self._thread = threading.Thread(
+            target=self._copy, args=(sql,), name="yavai-postgres-copy", daemon=True
+        )
+        self._thread.start()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._chunk and not self._eof:
+            try:
+                item = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._abandoned.is_set():
+                    return 0
+                continue
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            if item is None:
+                self._eof = True
+            else:
+                self._chunk = item
+        n = min(len(b), len(self._chunk))
+        b[:n] = self._chunk[:n]
+        self._chunk = self._chunk[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed and self._thread.is_alive():
+            self._abandoned.set()
+            self._conn.cancel()
+            while self._thread.is_alive():
+                try:
+                    self._queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            self._thread.join()
+        super().close()
+
+    def write(self, data) -> int:  # type: ignore[override]
+        """Called by ``copy_expert`` on the COPY thread for each row."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._pending += data
+        if len(self._pending) >= STREAM_CHUNK_SIZE:
+            self._put(bytes(self._pending))
+            self._pending.clear()
+        return len(data)
+
+    def _put(self, item) -> None:
+        # Once the reader has gone, drop output until the cancel takes effect
+        if not self._abandoned.is_set():
+            self._queue.put(item)
+
+    def _copy(self, sql: str) -> None:
+        try:
+            with self._conn.cursor() as cursor:
+                cursor.copy_expert(sql, self)
+            self._conn.commit()
+        except Exception as e:
+            self._conn.rollback()
+            self._put(e)
+            return
+        if self._pending:
+            self._put(bytes(self._pending))
+        self._put(None)
+
+
+def _subquery(query: str) -> str:
+    """``query`` without surrounding whitespace and trailing semicolons, ready to wrap."""
+    return query.strip().rstrip(";").rstrip()
+
+
+def _copy_sql(query: str) -> str:
+    """
+    The COPY statement for ``query``. The closing parenthesis goes on its own
+    line so that a trailing ``-- comment`` cannot swallow it.
+    """
+    return f"COPY ({query}\n) TO STDOUT WITH (FORMAT csv, HEADER true, NULL '{NULL_MARKER}')"
+
+
+def _arrow_type(pa, arrow_type: Any):
+    """The pyarrow type for a name from OID_ARROW_TYPES; other values are passed through."""
+    if isinstance(arrow_type, str) and arrow_type in _ARROW_TYPES:
+        return _ARROW_TYPES[arrow_type](pa)
+    return arrow_type
+
+
+def _read_csv_options(column_types: Dict[str, str]) -> Dict[str, Any]:
+    """pandas.read_csv arguments for COPY output (used when pyarrow is missing)."""
+    dtype: Dict[str, Any] = {}
+    for name, arrow_type in column_types.items():
+        if arrow_type in _INT_TYPES:
+            dtype[name] = "Int64"
+        elif arrow_type.startswith("float"):
+            dtype[name] = "float64"
+        elif arrow_type == "bool":
+            dtype[name] = "boolean"
+        elif arrow_type == "string":
+            dtype[name] = str
+    return {"dtype": dtype, "na_values": [NULL_MARKER], "keep_default_na": False,
+            "true_values": ["t"], "false_values": ["f"]}
+
+
+def _match_jdbc_dtypes(df: pd.DataFrame, column_types: Dict[str, str]) -> pd.DataFrame:
+    """
+    Give the result the dtypes JDBC.execute returns for the same data:
+    int64/bool, nullable Int64/boolean when a column has NULLs, and
+    datetime64 for dates and timestamps.
+    """
+    for name, arrow_type in column_types.items():
+        if name not in df.columns:
+            continue
+        series = df[name]
+        if arrow_type in _INT_TYPES or arrow_type == "bool":
+            if arrow_type in _INT_TYPES:
+                nullable, plain = "Int64", "int64"
+            else:
+                nullable, plain = "boolean", "bool"
+            target = nullable if series.isna().any() else plain
+            if str(series.dtype) != target:
+                df[name] = series.astype(target)
+        elif arrow_type in _DATETIME_TYPES:
+            if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+                utc = arrow_type.endswith("tz=UTC]")
+                df[name] = pd.to_datetime(series, errors="coerce", utc=utc)
+    return df
+
+
+def _copy_field(series: pd.Series) -> pd.Series:
+    """
+    Render a column as COPY CSV fields: non-NULL values are always quoted
+    and NULL is an unquoted empty field, so no string value can be read
+    back as NULL. Timezone-aware timestamps are written in UTC with an
+    explicit offset.
+    """
+    nulls = series.isna()
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if getattr(series.dt, "tz", None) is not None:
+            text = series.dt.tz_convert("UTC").dt.strftime("%Y-%m-%d %H:%M:%S.%f+00")
+        else:
+            text = series.dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+    else:
+        text = series.astype(object).map(str)
+    text = '"' + text.astype(object).str.replace('"', '""', regex=False) + '"'
+    return text.where(~nulls, "")
+
+
+def _to_copy_csv(df: pd.DataFrame) -> str:
+    """Render a DataFrame as COPY CSV rows (see ``_copy_field``)."""
+    if df.empty:
+        return ""
+    fields = [_copy_field(df.iloc[:, i]) for i in range(df.shape[1])]
+    lines = fields[0].str.cat(fields[1:], sep=",") if len(fields) > 1 else fields[0]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,171 @@
+# yavai/connections/query_cache.py
+
+"""On-disk Parquet cache for JDBC query results."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+# Quoted literals/identifiers are kept verbatim when normalizing SQL
+_SQL_TOKENS = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+def normalize_sql(query: str) -> str:
+    """Strip comments, collapse whitespace outside literals and drop a trailing ';'."""
+    parts = _SQL_TOKENS.split(query)
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r"\s+", " ", _COMMENTS.sub(" ", parts[i]))
+    return "".join(parts).strip().rstrip(";").rstrip()
+
+
+class QueryCache:
+    """
+    Stores query results as Parquet files keyed by connection URL and SQL.
+
+    Each entry is ``<key>.parquet`` plus a ``<key>.json`` sidecar with its
+    creation time. Entries older than ``ttl`` seconds are ignored and
+    removed on access; once the cache exceeds ``max_bytes`` the least
+    recently used entries (by file mtime, refreshed on every hit) are evicted.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None,
+                 max_bytes: int = 2 * 1024 ** 3):
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = Path.home() / ".yavai" / "cache" / "jdbc"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _url_hash(url: Optional[str]) -> str:
+        # URLs may carry credentials, so only their hash is written to disk
+        return hashlib.sha256((url or "").encode("utf-8")).hexdigest()
+
+    def key(self, url: Optional[str], query: str) -> str:
+        """Cache key for a query on a connection URL."""
+        text = f"{self._url_hash(url)}\n{normalize_sql(query)}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.parquet", self.cache_dir / f"{key}.json"
+
+    def get(self, url: Optional[str], query: str) -> Optional[pd.DataFrame]:
+        """Return the cached result, or None on a miss or expired entry."""
+        data_path, meta_path = self._paths(self.key(url, query))
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if self.ttl is not None and time.time() - meta.get("created_at", 0) > self.ttl:
+            self._remove(data_path, meta_path)
+            return None
+        try:
+            df = pd.read_parquet(data_path)
+        except Exception as e:
+            logging.warning(f"Dropping unreadable cache entry {data_path.name}: {e}")
+            self._remove(data_path, meta_path)
+            return None
+        os.utime(data_path)
+        return df
+
+    def put(self, url: Optional[str], query: str, df: pd.DataFrame) -> bool:
+        """
+        Store a result. Returns False if the DataFrame cannot be written as
+        Parquet (e.g. mixed-type object columns); the query still succeeds.
+        """
+        key = self.key(url, query)
+        data_path, meta_path = self._paths(key)
+        tmp_path = data_path.with_suffix(f".parquet.{os.getpid()}.tmp")
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, data_path)
+        except Exception as e:
+            logging.warning(f"Query result not cached: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        meta = {
+            "url_hash": self._url_hash(url),
+            "query": normalize_sql(query),
+            "created_at": time.time(),
+            "rows": len(df),
+            "bytes": data_path.stat().st_size,
+        }
+        tmp_meta = meta_path.with_suffix(f".json.{os.getpid()}.tmp")
+        tmp_meta.write_text(json.dumps(meta))
+        os.replace(tmp_meta, meta_path)
+        self.evict()
+        return True
+
+    def invalidate(self, url: Optional[str] = None, query: Optional[str] = None) -> int:
+        """
+        Remove cache entries.
+
+        Args:
+            url: Only remove entries for this connection URL
+            query: Only remove this query (requires ``url`` to match its key)
+
+        Returns:
+            Number of entries removed
+        """
+        if query is not None:
+            data_path, meta_path = self._paths(self.key(url, query))
+            existed = data_path.exists()
+            self._remove(data_path, meta_path)
+            return int(existed)
+
+        url_hash = self._url_hash(url) if url is not None else None
+        removed = 0
+        for meta_path in self.cache_dir.glob("*.json"):
+            if url_hash is not None:
+                try:
+                    if json.loads(meta_path.read_text()).get("url_hash") != url_hash:
+                        continue
+                except (OSError, ValueError):
+                    pass
+            self._remove(meta_path.with_suffix(".parquet"), meta_path)
+            removed += 1
+        return removed
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        for data_path in self.cache_dir.glob("*.parquet"):
+            try:
+                stat = data_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, data_path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, data_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(data_path, data_path.with_suffix(".json"))
+            total -= size
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Number of entries and total bytes on disk."""
+        sizes = [p.stat().st_size for p in self.cache_dir.glob("*.parquet")]
+        return {"entries": len(sizes), "bytes": sum(sizes)}
+
+    @staticmethod
+    def _remove(*paths: Path) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
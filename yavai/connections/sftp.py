@@ -1,24 +1,406 @@
 # yavai/connections/sftp.py
 
+import hashlib
+import inspect
+import io
+import json
+import logging
 import os
+import posixpath
+import queue
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
 import paramiko
 
+# Errors after which a transfer is retried on a fresh channel
+RETRYABLE_ERRORS = (IOError, EOFError, paramiko.SSHException)
+
+# Channel tuning for large-file mode. A 128 MiB window keeps many read
+# requests in flight on high-latency links; a 64 KiB packet fits a full
+# 32 KiB SFTP data reply in one channel packet instead of two.
+LARGE_WINDOW_SIZE = 2 ** 27
+LARGE_MAX_PACKET_SIZE = 2 ** 16
+
+# Bytes handed to each worker and read/written per call in large-file mode
+LARGE_CHUNK_SIZE = 64 * 2 ** 20
+_BLOCK_SIZE = 2 ** 20
+
+# Local bookkeeping for sync(), kept in the target directory by default
+SYNC_STATE_FILE = ".yavai_sync.json"
+_STATE_SAVE_INTERVAL = 2.0
+
+# Read-ahead window of open_stream(); one round of concurrent requests per window
+STREAM_READ_AHEAD = 8 * 2 ** 20
+
+# Seconds between SSH keepalive packets, so idle sessions are not dropped by firewalls
+DEFAULT_KEEPALIVE = 30
+
+# SFTPFile.readv only takes a bound on outstanding requests from paramiko 3.3;
+# older versions prefetch every requested range at once, so there reads are
+# issued in windows of that many requests of paramiko's maximum request size
+_READV_BOUNDED = "max_concurrent_prefetch_requests" in inspect.signature(
+    paramiko.SFTPFile.readv).parameters
+_READV_REQUEST_SIZE = 32768
+
+# pandas only infers compression from paths, not from open streams
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".zip": "zip", ".xz": "xz", ".zst": "zstd"}
+
+
+class TransferStats:
+    """Thread-safe progress counters for a multi-file transfer."""
+
+    def __init__(self, files: int = 0, total_bytes: int = 0):
+        self.files = files
+        self.bytes = total_bytes
+        self.files_done = 0
+        self.bytes_done = 0
+        self.skipped = 0
+        self.retries = 0
+        self.failed: List[Tuple[str, str]] = []
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, files: int = 0, nbytes: int = 0):
+        with self._lock:
+            self.files += files
+            self.bytes += nbytes
+
+    def done(self, nbytes: int):
+        with self._lock:
+            self.files_done += 1
+            self.bytes_done += nbytes
+
+    def fail(self, path: str, error: Exception):
+        with self._lock:
+            self.failed.append((path, f"{type(error).__name__}: {error}"))
+
+    def retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def skip(self):
+        with self._lock:
+            self.skipped += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            return {
+                "files": self.files,
+                "bytes": self.bytes,
+                "files_done": self.files_done,
+                "bytes_done": self.bytes_done,
+                "skipped": self.skipped,
+                "retries": self.retries,
+                "failed": list(self.failed),
+                "seconds": elapsed,
+                "mb_per_s": self.bytes_done / 1e6 / elapsed if elapsed > 0 else 0.0,
+            }
+
+
+class SFTPStream(io.RawIOBase):
+    """
+    Read-only, seekable stream over a remote file.
+
+    Data is fetched in windows of ``read_ahead`` bytes, each window issued
+    as up to ``requests`` concurrent SFTP reads, so sequential parsing pays
+    one round-trip per window instead of one per 32 KiB and memory stays
+    bounded by the window.
+    """
+
+    def __init__(self, remote_file, size: int, read_ahead: int = STREAM_READ_AHEAD,
+                 requests: int = 64):
+        self._file = remote_file
+        self._size = size
+        self._read_ahead = max(1, read_ahead)
+        self._requests = requests
+        self._pos = 0
+        self._buffer = b""
+        self._buffer_start = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return self._pos
+
+    def readinto(self, b) -> int:
+        if self._pos >= self._size:
+            return 0
+        index = self._pos - self._buffer_start
+        if not 0 <= index < len(self._buffer):
+            length = min(self._read_ahead, self._size - self._pos)
+            self._buffer = next(iter(_readv(self._file, [(self._pos, length)], self._requests)))
+            self._buffer_start = self._pos
+            index = 0
+            if not self._buffer:
+                raise IOError(f"Unexpected end of remote file at offset {self._pos}")
+        n = min(len(b), len(self._buffer) - index)
+        b[:n] = self._buffer[index:index + n]
+        self._pos += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+            self._buffer = b""
+        super().close()
+
+
+def _connect_ssh(hostname: str, port: int, username: str, password: str,
+                 keepalive: Optional[int] = DEFAULT_KEEPALIVE) -> paramiko.SSHClient:
+    """Open an authenticated SSH connection, enabling keepalive packets if requested."""
+    ssh = paramiko.SSHClient()
+    ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    ssh.connect(hostname, port=port, username=username, password=password)
+    transport = ssh.get_transport()
+    if keepalive and transport is not None:
+        transport.set_keepalive(keepalive)
+    return ssh
+
+
+def _is_active(ssh) -> bool:
+    transport = ssh.get_transport()
+    return transport is not None and transport.is_active()
+
+
+class SSHSessionPool:
+    """
+    Thread-safe pool of authenticated SSH transports keyed by host, port,
+    user and a fingerprint of the password.
+
+    Borrowers share a transport and open their own SFTP channels on it, so
+    only the first connection to a host pays for the key exchange. Each
+    borrower reserves the number of channels it will open, and at most
+    ``max_channels`` channels share one transport (OpenSSH allows 10
+    sessions per connection by default); beyond that another transport is
+    opened. Dead transports are replaced on the next acquire, and unused
+    ones are closed after ``idle_timeout`` seconds by a background reaper
+    thread, which runs while the pool holds transports.
+    """
+
+    def __init__(self, keepalive: Optional[int] = DEFAULT_KEEPALIVE,
+                 idle_timeout: Optional[float] = 300.0, max_channels: int = 10):
+        """
+        Args:
+            keepalive: Seconds between keepalive packets (None disables them)
+            idle_timeout: Seconds after which unused transports are closed
+                (None keeps them until close_all)
+            max_channels: SFTP channels sharing one transport
+        """
+        self.keepalive = keepalive
+        self.idle_timeout = idle_timeout
+        self.max_channels = max_channels
+        self._lock = threading.Lock()
+        self._sessions: Dict[tuple, List[dict]] = {}
+        self._reaper: Optional[threading.Thread] = None
+
+    def acquire(self, hostname: str, username: str, password: str, port: int = 22,
+                channels: int = 1):
+        """
+        Borrow a connected SSHClient for ``username@hostname:port`` with room
+        for ``channels`` SFTP channels; release it with the same count.
+
+        Transports are only shared between callers with the same password.
+        """
+        if not 1 <= channels <= self.max_channels:
+            raise ValueError(f"channels must be between 1 and {self.max_channels}")
+        key = (hostname, port, username, _fingerprint(password))
+        with self._lock:
+            stale = self._evict_locked()
+            session = None
+            for entry in self._sessions.get(key, []):
+                if entry["refs"] + channels <= self.max_channels and _is_active(entry["ssh"]):
+                    session = entry
+                    session["refs"] += channels
+                    break
+        _close_quietly(stale)
+        if session is not None:
+            return session["ssh"]
+
+        ssh = _connect_ssh(hostname, port, username, password, self.keepalive)
+        with self._lock:
+            self._sessions.setdefault(key, []).append(
+                {"ssh": ssh, "refs": channels, "last_used": time.monotonic()})
+            if self.idle_timeout is not None and self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap, name="yavai-ssh-pool-reaper",
+                                                daemon=True)
+                self._reaper.start()
+        return ssh
+
+    def release(self, ssh, channels: int = 1) -> None:
+        """Return a borrowed SSHClient and its ``channels``; it stays open for reuse."""
+        with self._lock:
+            for entries in self._sessions.values():
+                for entry in entries:
+                    if entry["ssh"] is ssh:
+                        entry["refs"] = max(0, entry["refs"] - channels)
+                        entry["last_used"] = time.monotonic()
+                        return
+        ssh.close()
+
+    def discard(self, ssh) -> None:
+        """Drop a (broken) SSHClient from the pool and close it."""
+        with self._lock:
+            for entries in self._sessions.values():
+                if any(entry["ssh"] is ssh for entry in entries):
+                    entries[:] = [entry for entry in entries if entry["ssh"] is not ssh]
+        _close_quietly([ssh])
+
+    @contextmanager
+    def sftp(self, hostname: str, username: str, password: str, port: int = 22):
+        """Yield an SFTP channel on a pooled transport, closing the channel afterwards."""
+        ssh = self.acquire(hostname, username, password, port)
+        try:
+            sftp = ssh.open_sftp()
+            try:
+                yield sftp
+            finally:
+                sftp.close()
+        finally:
+            self.release(ssh)
+
+    def close_all(self) -> None:
+        """Close every pooled transport."""
+        with self._lock:
+            clients = [entry["ssh"] for entries in self._sessions.values() for entry in entries]
+            self._sessions.clear()
+        _close_quietly(clients)
+
+    def stats(self) -> Dict[str, int]:
+        """Open transports, reserved channels and idle transports."""
+        with self._lock:
+            entries = [entry for entries in self._sessions.values() for entry in entries]
+            return {"transports": len(entries),
+                    "in_use": sum(entry["refs"] for entry in entries),
+                    "idle": sum(1 for entry in entries if entry["refs"] == 0)}
+
+    def _evict_locked(self) -> list:
+        """Remove dead transports and idle ones past idle_timeout; caller holds the lock."""
+        now = time.monotonic()
+        stale: List[dict] = []
+        for key in list(self._sessions):
+            keep: List[dict] = []
+            for entry in self._sessions[key]:
+                idle = entry["refs"] == 0 and self.idle_timeout is not None \
+                    and now - entry["last_used"] > self.idle_timeout
+                dead = entry["refs"] == 0 and not _is_active(entry["ssh"])
+                (stale if idle or dead else keep).append(entry)
+            if keep:
+                self._sessions[key] = keep
+            else:
+                del self._sessions[key]
+        return [entry["ssh"] for entry in stale]
+
+    def _reap(self) -> None:
+        """Close idle and dead transports as they expire; exits once the pool is empty."""
+        assert self.idle_timeout is not None
+        delay = max(self.idle_timeout, 0.01)
+        while True:
+            time.sleep(delay)
+            with self._lock:
+                stale = self._evict_locked()
+                idle = [entry["last_used"] for entries in self._sessions.values()
+                        for entry in entries if entry["refs"] == 0]
+                done = not self._sessions
+                if done:
+                    self._reaper = None
+            _close_quietly(stale)
+            if done:
+                return
+            # Sleep until the longest-idle transport expires
+            if idle:
+                delay = max(0.0, min(idle) + self.idle_timeout - time.monotonic()) + 0.01
+            else:
+                delay = max(self.idle_timeout, 0.01)
+
+
+def _fingerprint(password: Optional[str]) -> str:
+    """Digest identifying a credential without keeping it in the pool key."""
+    return hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+
+
+def _close_quietly(clients):
+    for ssh in clients:
+        try:
+            ssh.close()
+        except Exception:
+            pass
+
+
+# Shared by every SFTPClient connected with reuse=True
+session_pool = SSHSessionPool()
+
+
 class SFTPClient:
     def __init__(self):
         self.ssh = None
         self.sftp = None
+        self._params = None
+        self._keepalive = DEFAULT_KEEPALIVE
+        self._pooled = False
+        self._reconnect_lock = threading.Lock()
+
+    def connect(self, hostname, username, password, port=22, reuse=False,
+                keepalive=DEFAULT_KEEPALIVE):
+        """
+        Connect and open the SFTP session.
 
-    def connect(self, hostname, username, password, port=22):
-        self.ssh = paramiko.SSHClient()
-        self.ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        self.ssh.connect(hostname, port=port, username=username, password=password)
+        With ``reuse=True`` the SSH transport is borrowed from the shared
+        ``session_pool``, so repeated connects to the same host, user and
+        password open only a new SFTP channel instead of a new handshake;
+        parallel transfers reserve their extra channels from the pool too.
+        ``keepalive`` sends a keepalive packet every that many seconds
+        (pooled transports use ``session_pool.keepalive``).
+        """
+        if reuse:
+            self.ssh = session_pool.acquire(hostname, username, password, port)
+        else:
+            self.ssh = _connect_ssh(hostname, port, username, password, keepalive)
+        self._pooled = reuse
+        self._keepalive = keepalive
         self.sftp = self.ssh.open_sftp()
+        # Kept so extra transports can be opened for parallel transfers
+        self._params = {"hostname": hostname, "port": port, "username": username,
+                        "password": password}
         print(f"Connected to {hostname}")
         return self
 
     def close(self):
         if self.sftp: self.sftp.close()
-        if self.ssh: self.ssh.close()
+        if self.ssh and self._pooled:
+            session_pool.release(self.ssh)
+            self.ssh = None
+            self._pooled = False
+        elif self.ssh: self.ssh.close()
+
+    def ensure_connected(self):
+        """Reconnect the session if its SSH transport has dropped."""
+        if self._params is None or self.ssh is None or _is_active(self.ssh):
+            return
+        with self._reconnect_lock:
+            if not _is_active(self.ssh):
+                logging.warning(f"SSH connection to {self._params['hostname']} lost, reconnecting")
+                self._reconnect()
 
     # Allow usage: "with yavai.SFTP() as sftp:"
     def __enter__(self):
@@ -27,11 +409,629 @@ class SFTPClient:
         self.close()
 
     def list_files(self, remote_path="."):
+        self.ensure_connected()
         return self.sftp.listdir(remote_path)
 
     def download(self, remote_path, local_path=None):
+        self.ensure_connected()
         local_path = local_path or os.path.basename(remote_path)
         self.sftp.get(remote_path, local_path)
 
     def upload(self, local_path, remote_path):
-        self.sftp.put(local_path, remote_path)
\ No newline at end of file
+        self.ensure_connected()
+        self.sftp.put(local_path, remote_path)
+
+    def open_stream(self, remote_path: str, read_ahead: int = STREAM_READ_AHEAD,
+                    requests: int = 64,
+                    buffer_size: int = io.DEFAULT_BUFFER_SIZE) -> io.BufferedReader:
+        """
+        Open a remote file as a buffered binary stream with windowed read-ahead.
+
+        The stream is seekable and can be passed to any reader accepting a
+        file object; use it as a context manager to close the remote handle.
+
+        Args:
+            remote_path: Remote file
+            read_ahead: Bytes fetched per round of concurrent requests
+            requests: Outstanding read requests per window
+            buffer_size: Size of the BufferedReader buffer
+
+        Returns:
+            io.BufferedReader over an ``SFTPStream``
+        """
+        if self.sftp is None:
+            raise ConnectionError("Not connected. Call connect() first.")
+        self.ensure_connected()
+        remote = self.sftp.open(remote_path, "rb")
+        try:
+            size = remote.stat().st_size or 0
+        except Exception:
+            remote.close()
+            raise
+        return io.BufferedReader(SFTPStream(remote, size, read_ahead, requests), buffer_size)
+
+    def read_csv(self, remote_path: str, chunksize: Optional[int] = None, **kwargs):
+        """
+        Parse a remote CSV straight from the SFTP stream.
+
+        Compression is inferred from the file suffix unless given.
+
+        Args:
+            remote_path: Remote file
+            chunksize: If set, return an iterator of DataFrames with this many rows
+            **kwargs: Passed to ``pandas.read_csv``
+
+        Returns:
+            DataFrame, or an iterator of DataFrames when ``chunksize`` is set
+        """
+        kwargs.setdefault("compression", _compression(remote_path))
+        if chunksize:
+            return self._iter_csv(remote_path, chunksize, kwargs)
+        with self.open_stream(remote_path) as stream:
+            return pd.read_csv(stream, **kwargs)
+
+    def _iter_csv(self, remote_path: str, chunksize: int, kwargs: dict) -> Iterator[pd.DataFrame]:
+        with self.open_stream(remote_path) as stream:
+            with pd.read_csv(stream, chunksize=chunksize, **kwargs) as reader:
+                yield from reader
+
+    def read_excel(self, remote_path: str, **kwargs) -> pd.DataFrame:
+        """Parse a remote Excel workbook (xlsx or xls) straight from the SFTP stream."""
+        with self.open_stream(remote_path) as stream:
+            engine = 'openpyxl' if stream.peek(4)[:4] == b'\x50\x4b\x03\x04' else 'xlrd'
+            return pd.read_excel(stream, engine=kwargs.pop("engine", engine), **kwargs)
+
+    def read_file(self, remote_path: str, mode: str = 'rb'):
+        """Reads raw remote file data. Supports 'rb' for bytes or 'r' for text."""
+        with self.open_stream(remote_path) as stream:
+            data = stream.read()
+        if mode == 'r':
+            return data.decode('utf-8')
+        return data
+
+    def transfer_to_s3(self, remote_path: str, s3_path: str, part_size: int = 64 * 2 ** 20,
+                       max_concurrency: int = 4, s3=None,
+                       progress: Optional[Callable[[dict], None]] = None, **extra_args) -> dict:
+        """
+        Stream a remote file into S3 without touching local disk.
+
+        The file is read through ``open_stream`` in ``part_size`` chunks that
+        are uploaded as concurrent multipart parts; memory is bounded by
+        ``max_concurrency`` parts plus the read-ahead window. The part size is
+        raised automatically if the file would need more than 10,000 parts.
+
+        Args:
+            remote_path: Remote file
+            s3_path: Target as ``s3a://bucket/key``, ``s3://bucket/key`` or ``bucket/key``
+            part_size: Bytes per multipart part
+            max_concurrency: Parts uploaded in parallel
+            s3: boto3 S3 client (defaults to ``yavai.io.utils.get_s3_client()``)
+            progress: Called with the stats dict after each part
+            **extra_args: Passed to the S3 upload call (e.g. ContentType)
+
+        Returns:
+            Upload stats (bucket, key, parts, bytes, seconds, mb_per_s)
+        """
+        from yavai.io.utils import MAX_PARTS, extract_bucket_key, upload_stream
+
+        bucket, key = extract_bucket_key(s3_path)
+        size = self.sftp.stat(remote_path).st_size or 0
+        part_size = max(part_size, -(-size // MAX_PARTS))
+        with self.open_stream(remote_path) as stream:
+            stats: dict = upload_stream(stream, bucket, key, part_size=part_size,
+                                        max_concurrency=max_concurrency, s3=s3,
+                                        progress=progress, **extra_args)
+        return stats
+
+    def walk(self, remote_dir: str) -> Iterator[Tuple[str, paramiko.SFTPAttributes]]:
+        """Yield (path, attributes) for every file below ``remote_dir``, recursively."""
+        self.ensure_connected()
+        pending = [remote_dir]
+        while pending:
+            current = pending.pop()
+            for attr in self.sftp.listdir_attr(current):
+                path = posixpath.join(current, attr.filename)
+                if stat.S_ISDIR(attr.st_mode or 0):
+                    pending.append(path)
+                else:
+                    yield path, attr
+
+    def download_dir(self, remote_dir: str, local_dir: str, workers: int = 8, transports: int = 1,
+                     retries: int = 3, progress: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Recursively download a remote directory over several SFTP channels.
+
+        Args:
+            remote_dir: Remote directory
+            local_dir: Local target directory (created as needed)
+            workers: Concurrent file transfers, one SFTP channel each
+            transports: SSH connections the channels are spread across
+            retries: Attempts per file after the first failure
+            progress: Called with the stats dict after each file
+
+        Returns:
+            Transfer stats (files, bytes, files_done, bytes_done, retries,
+            failed, seconds, mb_per_s)
+        """
+        files = list(self.walk(remote_dir))
+        stats = TransferStats(len(files), sum(attr.st_size or 0 for _, attr in files))
+
+        def transfer(sftp, item):
+            remote_path, attr = item
+            rel = posixpath.relpath(remote_path, remote_dir)
+            local_path = os.path.join(local_dir, *rel.split("/"))
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            part = f"{local_path}.part"
+            sftp.get(remote_path, part)
+            os.replace(part, local_path)
+            if attr.st_mtime is not None:
+                os.utime(local_path, (attr.st_atime or attr.st_mtime, attr.st_mtime))
+            return attr.st_size or 0
+
+        self._run_transfers(files, transfer, lambda item: item[0], workers, transports,
+                            retries, stats, progress)
+        return stats.as_dict()
+
+    def upload_dir(self, local_dir: str, remote_dir: str, workers: int = 8, transports: int = 1,
+                   retries: int = 3, progress: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Recursively upload a local directory over several SFTP channels.
+
+        Takes the same options and returns the same stats as ``download_dir``.
+        """
+        files = []
+        for root, _, names in os.walk(local_dir):
+            rel_root = os.path.relpath(root, local_dir)
+            remote_root = remote_dir if rel_root == "." else posixpath.join(
+                remote_dir, *rel_root.split(os.sep))
+            self._makedirs(remote_root)
+            for name in names:
+                files.append((os.path.join(root, name), posixpath.join(remote_root, name)))
+        stats = TransferStats(len(files), sum(os.path.getsize(p) for p, _ in files))
+
+        def transfer(sftp, item):
+            local_path, remote_path = item
+            sftp.put(local_path, remote_path)
+            return os.path.getsize(local_path)
+
+        self._run_transfers(files, transfer, lambda item: item[0], workers, transports,
+                            retries, stats, progress)
+        return stats.as_dict()
+
+    def download_large(self, remote_path: str, local_path: Optional[str] = None,
+                       workers: int = 8, transports: int = 1, chunk_size: int = LARGE_CHUNK_SIZE,
+                       requests: int = 64, window_size: int = LARGE_WINDOW_SIZE,
+                       max_packet_size: int = LARGE_MAX_PACKET_SIZE, retries: int = 3,
+                       progress: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Download a single large file as concurrent offset-based chunks.
+
+        The local file is preallocated as ``<local_path>.part``; each worker
+        reads its chunks over its own SFTP channel with up to ``requests``
+        read-ahead requests outstanding and writes them in place. The part
+        file is renamed once every chunk has arrived.
+
+        Args:
+            remote_path: Remote file
+            local_path: Local target (defaults to the remote basename)
+            workers: Chunks transferred concurrently, one SFTP channel each
+            transports: SSH connections the channels are spread across
+            chunk_size: Bytes per chunk
+            requests: Outstanding read requests per channel
+            window_size: SSH channel window size
+            max_packet_size: SSH channel max packet size
+            retries: Attempts per chunk after the first failure
+            progress: Called with the stats dict after each chunk
+
+        Returns:
+            Transfer stats as in ``download_dir``, with ``files`` counting chunks
+
+        Raises:
+            IOError: If a chunk still fails after all retries; the part file is kept
+        """
+        local_path = local_path or posixpath.basename(remote_path)
+        attr = self.sftp.stat(remote_path)
+        size = attr.st_size or 0
+        part = f"{local_path}.part"
+        with open(part, "wb") as f:
+            f.truncate(size)
+
+        chunks = _chunks(size, chunk_size)
+        stats = TransferStats(len(chunks), size)
+
+        def transfer(sftp, chunk):
+            offset, length = chunk
+            with sftp.open(remote_path, "rb") as remote, open(part, "r+b") as local:
+                local.seek(offset)
+                _copy_range(remote, local, offset, length, requests, remote_path)
+            return length
+
+        self._run_transfers(chunks, transfer, lambda c: f"{remote_path}@{c[0]}", workers,
+                            transports, retries, stats, progress,
+                            {"window_size": window_size, "max_packet_size": max_packet_size})
+        result = stats.as_dict()
+        if result["failed"]:
+            raise IOError(f"Download of {remote_path} failed: {result['failed'][0][1]}")
+
+        os.replace(part, local_path)
+        if attr.st_mtime is not None:
+            os.utime(local_path, (attr.st_atime or attr.st_mtime, attr.st_mtime))
+        return result
+
+    def upload_large(self, local_path: str, remote_path: str, workers: int = 8,
+                     transports: int = 1, chunk_size: int = LARGE_CHUNK_SIZE,
+                     window_size: int = LARGE_WINDOW_SIZE,
+                     max_packet_size: int = LARGE_MAX_PACKET_SIZE, retries: int = 3,
+                     progress: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Upload a single large file as concurrent offset-based chunks.
+
+        The remote file is created at its final size, then each worker writes
+        its chunks in place over its own pipelined SFTP channel. Takes the
+        same tuning options and returns the same stats as ``download_large``.
+        """
+        size = os.path.getsize(local_path)
+        with self.sftp.open(remote_path, "wb") as remote:
+            remote.truncate(size)
+
+        chunks = _chunks(size, chunk_size)
+        stats = TransferStats(len(chunks), size)
+
+        def transfer(sftp, chunk):
+            offset, length = chunk
+            with open(local_path, "rb") as local, sftp.open(remote_path, "r+b") as remote:
+                remote.set_pipelined(True)
+                local.seek(offset)
+                remote.seek(offset)
+                remaining = length
+                while remaining:
+                    data = local.read(min(_BLOCK_SIZE, remaining))
+                    if not data:
+                        raise IOError(f"{local_path} shrank during upload")
+                    remote.write(data)
+                    remaining -= len(data)
+            return length
+
+        self._run_transfers(chunks, transfer, lambda c: f"{local_path}@{c[0]}", workers,
+                            transports, retries, stats, progress,
+                            {"window_size": window_size, "max_packet_size": max_packet_size})
+        result = stats.as_dict()
+        if result["failed"]:
+            raise IOError(f"Upload of {local_path} failed: {result['failed'][0][1]}")
+        return result
+
+    def sync(self, remote_dir: str, local_dir: str, checksum: bool = False, workers: int = 8,
+             transports: int = 1, retries: int = 3, requests: int = 64,
+             state_file: Optional[str] = None,
+             progress: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Incrementally mirror a remote directory, transferring only new or changed files.
+
+        A file is up to date when the local copy has the remote size and
+        mtime (transfers preserve the remote mtime). With ``checksum=True``
+        a same-size file whose mtime differs is compared by SHA-1 through
+        the server's check-file extension before being re-downloaded.
+        Interrupted downloads continue from the end of their ``.part`` file
+        if the remote file is unchanged, including across runs via a small
+        JSON state file.
+
+        Args:
+            remote_dir: Remote directory
+            local_dir: Local mirror directory
+            checksum: Compare checksums when only the mtime differs
+            workers: Concurrent file transfers, one SFTP channel each
+            transports: SSH connections the channels are spread across
+            retries: Attempts per file after the first failure
+            requests: Outstanding read requests per channel
+            state_file: State path (defaults to ``<local_dir>/.yavai_sync.json``)
+            progress: Called with the stats dict after each file
+
+        Returns:
+            Transfer stats as in ``download_dir``; ``skipped`` counts up-to-date files
+        """
+        state_path = state_file or os.path.join(local_dir, SYNC_STATE_FILE)
+        previous = _load_sync_state(state_path, remote_dir)
+        state = {"remote_dir": remote_dir, "files": {}, "partial": previous["partial"]}
+        lock = threading.Lock()
+        last_save = [time.monotonic()]
+
+        def save(force=False):
+            with lock:
+                if not force and time.monotonic() - last_save[0] < _STATE_SAVE_INTERVAL:
+                    return
+                _save_sync_state(state_path, state)
+                last_save[0] = time.monotonic()
+
+        files = list(self.walk(remote_dir))
+        stats = TransferStats(len(files))
+        pending = []
+        for remote_path, attr in files:
+            rel = posixpath.relpath(remote_path, remote_dir)
+            local_path = os.path.join(local_dir, *rel.split("/"))
+            entry = {"size": attr.st_size, "mtime": attr.st_mtime}
+            known = previous["files"].get(rel)
+            if known and known.get("sha1") and known["size"] == attr.st_size \
+                    and known["mtime"] == attr.st_mtime:
+                entry["sha1"] = known["sha1"]
+            if self._is_synced(remote_path, attr, local_path, entry, checksum):
+                state["files"][rel] = entry
+                stats.skip()
+            else:
+                pending.append((rel, remote_path, attr, local_path))
+                stats.add(nbytes=attr.st_size or 0)
+
+        def transfer(sftp, item):
+            rel, remote_path, attr, local_path = item
+            size = attr.st_size or 0
+            part = f"{local_path}.part"
+            source = [attr.st_size, attr.st_mtime]
+            with lock:
+                resumable = state["partial"].get(rel) == source
+                state["partial"][rel] = source
+            offset = os.path.getsize(part) if resumable and os.path.exists(part) else 0
+            if offset > size:
+                offset = 0
+            save()
+
+            os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
+            with sftp.open(remote_path, "rb") as remote, \
+                    open(part, "r+b" if offset else "wb") as local:
+                local.truncate(offset)
+                local.seek(offset)
+                _copy_range(remote, local, offset, size - offset, requests, remote_path)
+            os.replace(part, local_path)
+            if attr.st_mtime is not None:
+                os.utime(local_path, (attr.st_atime or attr.st_mtime, attr.st_mtime))
+
+            with lock:
+                state["partial"].pop(rel, None)
+                state["files"][rel] = {"size": attr.st_size, "mtime": attr.st_mtime}
+            save()
+            return size - offset
+
+        try:
+            self._run_transfers(pending, transfer, lambda item: item[1], workers, transports,
+                                retries, stats, progress)
+        finally:
+            save(force=True)
+        return stats.as_dict()
+
+    def _is_synced(self, remote_path: str, attr: paramiko.SFTPAttributes, local_path: str,
+                   entry: dict, checksum: bool) -> bool:
+        """Whether ``local_path`` already matches the remote file; may fill ``entry['sha1']``."""
+        try:
+            st = os.stat(local_path)
+        except FileNotFoundError:
+            return False
+        if st.st_size != attr.st_size:
+            return False
+        if attr.st_mtime is None or int(st.st_mtime) == int(attr.st_mtime):
+            return True
+        if not checksum:
+            return False
+
+        if "sha1" not in entry:
+            try:
+                with self.sftp.open(remote_path, "rb") as remote:
+                    entry["sha1"] = remote.check("sha1", block_size=0).hex()
+            except IOError as e:
+                logging.warning(f"Server cannot checksum {remote_path}, re-downloading: {e}")
+                return False
+        if entry["sha1"] != _local_sha1(local_path):
+            entry.pop("sha1")
+            return False
+        os.utime(local_path, (attr.st_atime or attr.st_mtime, attr.st_mtime))
+        return True
+
+    def _makedirs(self, remote_dir: str):
+        """Create a remote directory and its parents if missing."""
+        parts = [p for p in remote_dir.split("/") if p]
+        path = "/" if remote_dir.startswith("/") else ""
+        for part in parts:
+            path = posixpath.join(path, part) if path else part
+            try:
+                self.sftp.stat(path)
+            except IOError:
+                self.sftp.mkdir(path)
+
+    def _new_ssh(self):
+        """Open an additional SSH connection with the ``connect()`` parameters."""
+        if not self._params:
+            raise ConnectionError("Not connected. Call connect() first.")
+        return _connect_ssh(self._params["hostname"], self._params["port"],
+                            self._params["username"], self._params["password"], self._keepalive)
+
+    def _reconnect(self):
+        """Replace the main SSH connection and SFTP session; caller holds _reconnect_lock."""
+        old = self.ssh
+        if self._pooled:
+            session_pool.discard(old)
+            self.ssh = session_pool.acquire(self._params["hostname"], self._params["username"],
+                                            self._params["password"], self._params["port"])
+        else:
+            self.ssh = self._new_ssh()
+            _close_quietly([old])
+        self.sftp = self._open_sftp(self.ssh)
+
+    def _open_sftp(self, ssh, window_size: Optional[int] = None,
+                   max_packet_size: Optional[int] = None):
+        """Open an SFTP channel, with custom window/packet sizes if given."""
+        if window_size is None and max_packet_size is None:
+            return ssh.open_sftp()
+        return paramiko.SFTPClient.from_transport(
+            ssh.get_transport(), window_size=window_size, max_packet_size=max_packet_size)
+
+    @contextmanager
+    def _channels(self, count: int, transports: int = 1, **sftp_options):
+        """
+        Yield a queue of ``count`` SFTP channels spread over ``transports`` SSH connections.
+
+        A pooled client reserves the channels on ``session_pool`` transports,
+        so clients sharing a transport stay within its ``max_channels``.
+        """
+        if self.ssh is None:
+            raise ConnectionError("Not connected. Call connect() first.")
+        channels: queue.Queue = queue.Queue()
+        borrowed: Dict[paramiko.SSHClient, int] = {}
+        clients = []
+        try:
+            if self._pooled:
+                per_transport = min(session_pool.max_channels, -(-count // max(1, transports)))
+                remaining = count
+                while remaining > 0:
+                    n = min(per_transport, remaining)
+                    ssh = session_pool.acquire(self._params["hostname"], self._params["username"],
+                                               self._params["password"], self._params["port"], n)
+                    borrowed[ssh] = borrowed.get(ssh, 0) + n
+                    clients.extend([ssh] * n)
+                    remaining -= n
+            else:
+                opened = [self.ssh] + [self._new_ssh() for _ in range(max(1, transports) - 1)]
+                clients = [opened[i % len(opened)] for i in range(count)]
+            for ssh in clients:
+                channels.put((ssh, self._open_sftp(ssh, **sftp_options)))
+            yield channels
+        finally:
+            used = set(clients)
+            while not channels.empty():
+                ssh, sftp = channels.get_nowait()
+                sftp.close()
+                used.add(ssh)
+            for ssh in used:
+                if ssh not in borrowed and ssh is not self.ssh:
+                    ssh.close()
+            for ssh, n in borrowed.items():
+                session_pool.release(ssh, n)
+
+    def _run_transfers(self, items: list, transfer: Callable, label: Callable, workers: int,
+                       transports: int, retries: int, stats: TransferStats,
+                       progress: Optional[Callable[[dict], None]],
+                       sftp_options: Optional[dict] = None):
+        """Run ``transfer(sftp, item)`` for every item on a pool of channels, with retries."""
+        if not items:
+            return
+        workers = max(1, min(workers, len(items)))
+        sftp_options = sftp_options or {}
+
+        with self._channels(workers, transports, **sftp_options) as channels:
+            def run(item):
+                ssh, sftp = channels.get()
+                try:
+                    for attempt in range(retries + 1):
+                        try:
+                            nbytes = transfer(sftp, item)
+                            stats.done(nbytes)
+                            break
+                        except RETRYABLE_ERRORS as e:
+                            if attempt == retries:
+                                logging.error(f"SFTP transfer failed for {label(item)}: {e}")
+                                stats.fail(label(item), e)
+                                break
+                            stats.retry()
+                            logging.warning(f"Retrying {label(item)} after error: {e}")
+                            time.sleep(min(2 ** attempt * 0.5, 10))
+                            ssh, sftp = self._reopen_channel(ssh, sftp, **sftp_options)
+                finally:
+                    channels.put((ssh, sftp))
+                if progress:
+                    progress(stats.as_dict())
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yavai-sftp") as pool:
+                list(pool.map(run, items))
+
+    def _reopen_channel(self, ssh, sftp, **sftp_options):
+        """Replace a possibly broken channel, reconnecting its transport if it died."""
+        try:
+            sftp.close()
+        except Exception:
+            pass
+        if not _is_active(ssh):
+            with self._reconnect_lock:
+                if ssh is self.ssh:
+                    self._reconnect()
+                    ssh = self.ssh
+                else:
+                    ssh.close()
+                    ssh = self._new_ssh()
+        return ssh, self._open_sftp(ssh, **sftp_options)
+
+
+def _readv(remote, chunks: List[Tuple[int, int]], requests: int):
+    """``remote.readv(chunks)`` with at most ``requests`` reads in flight."""
+    if _READV_BOUNDED:
+        return remote.readv(chunks, max_concurrent_prefetch_requests=requests)
+    return _readv_windowed(remote, chunks, requests)
+
+
+def _readv_windowed(remote, chunks: List[Tuple[int, int]], requests: int) -> Iterator[bytes]:
+    """
+    ``remote.readv(chunks)`` for paramiko < 3.3: the chunks are split into
+    _READV_REQUEST_SIZE reads and each readv call gets ``requests`` of them,
+    so no more than that is ever prefetched.
+    """
+    pieces = [(index, o, min(_READV_REQUEST_SIZE, offset + length - o))
+              for index, (offset, length) in enumerate(chunks)
+              for o in range(offset, offset + length, _READV_REQUEST_SIZE)]
+    current, parts = 0, []  # type: Tuple[int, List[bytes]]
+    for start in range(0, len(pieces), max(1, requests)):
+        window = pieces[start:start + max(1, requests)]
+        reads = remote.readv([(o, n) for _, o, n in window])
+        for (index, _, _), data in zip(window, reads):
+            while current < index:
+                yield b"".join(parts)
+                current, parts = current + 1, []
+            parts.append(data)
+    while current < len(chunks):
+        yield b"".join(parts)
+        current, parts = current + 1, []
+
+
+def _copy_range(remote, local, offset: int, length: int, requests: int, label: str):
+    """Copy ``length`` bytes at ``offset`` of an SFTP file to the current position of ``local``."""
+    blocks = [(o, min(_BLOCK_SIZE, offset + length - o))
+              for o in range(offset, offset + length, _BLOCK_SIZE)]
+    for (block_offset, block_length), data in zip(blocks, _readv(remote, blocks, requests)):
+        if len(data) != block_length:
+            raise IOError(f"Short read at offset {block_offset} of {label}")
+        local.write(data)
+
+
+def _local_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_sync_state(path: str, remote_dir: str) -> dict:
+    """Read sync state, starting fresh if it is missing, unreadable or for another directory."""
+    empty = {"remote_dir": remote_dir, "files": {}, "partial": {}}
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(state, dict) or state.get("remote_dir") != remote_dir:
+        return empty
+    return {"remote_dir": remote_dir, "files": state.get("files") or {},
+            "partial": state.get("partial") or {}}
+
+
+def _save_sync_state(path: str, state: dict):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def _compression(path: str) -> Optional[str]:
+    return _COMPRESSION_SUFFIXES.get(posixpath.splitext(path)[1].lower())
+
+
+def _chunks(size: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Split ``size`` bytes into (offset, length) chunks; an empty file is one empty chunk."""
+    if size == 0:
+        return [(0, 0)]
+    return [(offset, min(chunk_size, size - offset)) for offset in range(0, size, chunk_size)]
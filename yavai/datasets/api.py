@@ -1,10 +1,13 @@
 """Dataset Management API for YAVAI platform."""
 
-from typing import Dict
+from typing import Dict, Iterator, Optional, Tuple
 import pandas as pd
+import requests
 
 from yavai import config
 from yavai.datasets.client import YAVAIClient
+from yavai.datasets.manifest import DatasetManifest
+from yavai.datasets.records import DatasetFile
 
 
 class DatasetAPI:
@@ -16,25 +19,74 @@ class DatasetAPI:
     V2 = ["dataset-management", "api", "v2"]
     V1_API = ["api", "v1"]
     
-    def __init__(self):
-        self._client = YAVAIClient()
+    def __init__(self, codec=None):
+        self._client = YAVAIClient(codec=codec)
+        self._manifests: Dict[str, DatasetManifest] = {}
 
     def get_file_path(self, file_id: str) -> str:
         """
         Get S3A path for a file.
         
+        Attached dataset manifests are consulted first; the API is only
+        called for files they do not know about.
+        
         Args:
             file_id: Unique file identifier
             
         Returns:
             S3A path string
         """
+        manifest, path = self._manifest_lookup(file_id)
+        if path:
+            return path
+        path = self._fetch_file_path(file_id)
+        if manifest is not None and path:
+            manifest.set_file_path(file_id, path)
+        return path
+
+    def _manifest_lookup(self, file_id: str) -> Tuple[Optional[DatasetManifest], Optional[str]]:
+        """Return the attached manifest listing a file and its stored path, if any."""
+        for manifest in list(self._manifests.values()):
+            path = manifest.get_file_path(file_id)
+            if path or manifest.contains(file_id):
+                return manifest, path
+        return None, None
+
+    def _fetch_file_path(self, file_id: str) -> str:
+        """Resolve the S3A path of a file through the API."""
         response = self._client.request(
             "GET", 
             ["files", file_id, "s3a-path"], 
             base_paths=self.V1_LIB
         )
-        return response.get("data")
+        path: str = response.get("data")
+        return path
+
+    async def get_file_path_async(self, file_id: str) -> str:
+        """
+        Asyncio variant of ``get_file_path``.
+        
+        Attached manifests are consulted first, as in ``get_file_path``;
+        concurrent API lookups of the same file share one request.
+        
+        Args:
+            file_id: Unique file identifier
+            
+        Returns:
+            S3A path string
+        """
+        manifest, path = self._manifest_lookup(file_id)
+        if path:
+            return path
+        response = await self._client.request_async(
+            "GET",
+            ["files", file_id, "s3a-path"],
+            base_paths=self.V1_LIB
+        )
+        fetched: str = response.get("data")
+        if manifest is not None and fetched:
+            manifest.set_file_path(file_id, fetched)
+        return fetched
 
     def browse_dataset(self, dataset_id: str) -> Dict:
         """
@@ -53,6 +105,95 @@ class DatasetAPI:
         )
         return response.get("data")
 
+    def iter_dataset_files(self, dataset_id: str, page_size: int = 1000) -> Iterator[DatasetFile]:
+        """
+        Lazily iterate over the files of a dataset, one page at a time.
+        
+        Only a single page of the listing is held in memory, so iteration
+        starts as soon as the first page arrives.
+        
+        Args:
+            dataset_id: Unique dataset identifier
+            page_size: Number of files requested per page
+            
+        Yields:
+            DatasetFile records
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+
+        page = 0
+        previous_first = None
+        while True:
+            response = self._client.request(
+                "GET",
+                ["datasets", dataset_id, "browse"],
+                base_paths=self.V1_LIB,
+                params={"page": page, "size": page_size}
+            )
+            items = self._extract_files(response.get("data"))
+            if not items:
+                return
+
+            # Servers without paging support return the full listing every time
+            first = items[0].get("id", items[0].get("fileId"))
+            if page > 0 and first == previous_first:
+                return
+            previous_first = first
+
+            for item in items:
+                yield DatasetFile.from_payload(item)
+
+            # A short page is the last one; a page longer than requested
+            # means the server ignored paging and already sent everything
+            if len(items) != page_size:
+                return
+            page += 1
+
+    @staticmethod
+    def _extract_files(data) -> list:
+        """Pull the list of file entries out of a browse payload."""
+        if not data:
+            return []
+        if isinstance(data, list):
+            return data
+        return data.get("files") or data.get("content") or []
+
+    def build_manifest(self, dataset_id: str, path: Optional[str] = None,
+                       refresh: bool = True, resolve_paths: bool = True) -> DatasetManifest:
+        """
+        Build (or open) the local manifest of a dataset and attach it, so
+        that file path lookups are served from it.
+        
+        Args:
+            dataset_id: Unique dataset identifier
+            path: SQLite file location (defaults to ~/.yavai/manifests/<dataset_id>.sqlite)
+            refresh: Sync the manifest with the current listing; when False an
+                existing manifest is used as-is without calling the API
+            resolve_paths: Resolve s3a paths of new/changed files during refresh
+            
+        Returns:
+            The attached DatasetManifest
+        """
+        manifest = DatasetManifest(dataset_id, path=path)
+        if refresh or manifest.refreshed_at is None:
+            manifest.refresh(self, resolve_paths=resolve_paths)
+        self.attach_manifest(manifest)
+        return manifest
+
+    def attach_manifest(self, manifest: DatasetManifest) -> None:
+        """Consult ``manifest`` before the API when resolving file paths."""
+        previous = self._manifests.get(manifest.dataset_id)
+        if previous is not None and previous is not manifest:
+            previous.close()
+        self._manifests[manifest.dataset_id] = manifest
+
+    def detach_manifest(self, dataset_id: str) -> None:
+        """Stop consulting (and close) the manifest of a dataset."""
+        manifest = self._manifests.pop(dataset_id, None)
+        if manifest is not None:
+            manifest.close()
+
     def browse_file(self, file_id: str) -> Dict:
         """
         Browse file metadata.
@@ -70,6 +211,25 @@ class DatasetAPI:
         )
         return response.get("data")
 
+    async def browse_file_async(self, file_id: str) -> Dict:
+        """
+        Asyncio variant of ``browse_file``.
+        
+        Concurrent lookups of the same file share one request.
+        
+        Args:
+            file_id: Unique file identifier
+            
+        Returns:
+            File metadata
+        """
+        response = await self._client.request_async(
+            "GET",
+            ["files", file_id, "browse"],
+            base_paths=self.V1_LIB
+        )
+        return response.get("data")
+
     def download_dataset(self, dataset_id: str) -> Dict:
         """
         Download complete dataset as ZIP.
@@ -169,16 +329,19 @@ class DatasetAPI:
         )
         return response
 
-    def preview_feature_group(self, app_name: str, feature_group: str) -> pd.DataFrame:
+    def preview_feature_group(self, app_name: str, feature_group: str,
+                              dtype: Optional[Dict] = None, as_arrow: bool = False):
         """
         Preview feature group data.
         
         Args:
             app_name: Application name
             feature_group: Feature group configuration as JSON string
+            dtype: Optional mapping of column name to type
+            as_arrow: Return a pyarrow Table instead of a DataFrame
             
         Returns:
-            DataFrame containing feature group preview
+            DataFrame (or pyarrow Table) containing feature group preview
         """
         data = {
             "app_name": app_name,
@@ -189,9 +352,9 @@ class DatasetAPI:
             ["feature-groups", "preview"],
             base_paths=self.V1_API,
             data=data,
-            return_raw=True
+            stream=True
         )
-        return pd.read_csv(StringIO(response))
+        return self._read_csv_response(response, dtype=dtype, as_arrow=as_arrow)
 
     def delete_feature_group(self, app_name: str, app_token: str, feature_group: str) -> Dict:
         """
@@ -247,16 +410,19 @@ class DatasetAPI:
         )
         return response
 
-    def preview_training_dataset(self, app_name: str, training_dataset: str) -> pd.DataFrame:
+    def preview_training_dataset(self, app_name: str, training_dataset: str,
+                                 dtype: Optional[Dict] = None, as_arrow: bool = False):
         """
         Preview training dataset data.
         
         Args:
             app_name: Application name
             training_dataset: Training dataset configuration as JSON string
+            dtype: Optional mapping of column name to type
+            as_arrow: Return a pyarrow Table instead of a DataFrame
             
         Returns:
-            DataFrame containing training dataset preview
+            DataFrame (or pyarrow Table) containing training dataset preview
         """
         data = {
             "app_name": app_name,
@@ -267,9 +433,47 @@ class DatasetAPI:
             ["training-datasets", "preview"],
             base_paths=self.V1_API,
             data=data,
-            return_raw=True
+            stream=True
         )
-        return pd.read_csv(StringIO(response))
+        return self._read_csv_response(response, dtype=dtype, as_arrow=as_arrow)
+
+    @staticmethod
+    def _read_csv_response(response: requests.Response, dtype: Optional[Dict] = None,
+                           as_arrow: bool = False):
+        """
+        Parse a streamed CSV response body without materialising it as text.
+        
+        Uses pyarrow's multithreaded CSV reader when available and falls back
+        to pandas reading from the same byte stream.
+        
+        Args:
+            response: Streamed response returned by ``request(..., stream=True)``
+            dtype: Optional mapping of column name to type (pyarrow type names or
+                DataTypes for the Arrow reader, pandas dtypes for the fallback)
+            as_arrow: Return a pyarrow Table instead of a DataFrame
+        """
+        try:
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            pa_csv = None
+            if as_arrow:
+                raise ImportError("pyarrow is required for as_arrow=True. "
+                                  "Install it with: pip install pyarrow")
+
+        body = response.raw
+        body.decode_content = True
+        try:
+            if pa_csv is None:
+                return pd.read_csv(body, dtype=dtype)
+            table = pa_csv.read_csv(
+                body,
+                read_options=pa_csv.ReadOptions(use_threads=True),
+                convert_options=pa_csv.ConvertOptions(column_types=dtype or {})
+            )
+        finally:
+            response.close()
+
+        return table if as_arrow else table.to_pandas()
 
     def delete_training_dataset(self, app_name: str, app_token: str, 
                                 training_dataset: str) -> Dict:
@@ -1,16 +1,18 @@
 """YAVAI API Client for making HTTP requests to YAVAI services."""
 
 import getpass
-import json
 import os
 import warnings
-from typing import Dict, List, Optional
+import functools
+from typing import Any, Dict, Hashable, List, Optional, Union
 
 import furl
 import requests
 from urllib3.exceptions import InsecureRequestWarning
 
 from yavai import config
+from yavai.datasets.codec import JSONCodec, get_codec
+from yavai.datasets.singleflight import SingleFlight
 
 warnings.filterwarnings("ignore", category=InsecureRequestWarning)
 
@@ -18,9 +20,19 @@ warnings.filterwarnings("ignore", category=InsecureRequestWarning)
 class YAVAIClient:
     """Client for interacting with YAVAI API endpoints."""
     
-    def __init__(self):
+    def __init__(self, codec: Optional[Union[str, JSONCodec]] = None, coalesce: bool = True):
+        """
+        Args:
+            codec: JSON codec instance or name; defaults to the fastest
+                installed codec (orjson if available, else stdlib json)
+            coalesce: Share one in-flight request between concurrent
+                identical GET requests
+        """
         self._session = requests.Session()
         self._username = getpass.getuser()
+        self._codec = get_codec(codec)
+        self._coalesce = coalesce
+        self._single_flight = SingleFlight()
 
     def request(
         self,
@@ -32,8 +44,9 @@ class YAVAIClient:
         data: Optional[Dict] = None,
         is_download: bool = False,
         use_alt_base_url: bool = False,
-        return_raw: bool = False  # Add this parameter
-    ) -> Dict:
+        return_raw: bool = False,  # Add this parameter
+        stream: bool = False
+    ) -> Any:
         """
         Make an HTTP request to YAVAI API.
         
@@ -46,23 +59,109 @@ class YAVAIClient:
             data: Request body data
             is_download: Whether this is a file download request
             use_alt_base_url: Use alternate base URL
+            return_raw: Return the response body as text
+            stream: Return the unread response so the body can be consumed
+                incrementally; the caller is responsible for closing it
             
         Returns:
-            Response data as dictionary or download info
+            Response data as dictionary, download info, the raw text
+            (``return_raw``) or the unread response (``stream``)
             
         Raises:
             requests.HTTPError: If request fails
         """
         url = self._build_url(paths, base_paths, use_alt_base_url)
-        response = self._execute_request(method, url, headers, params, data)
+
+        if stream:
+            return self._execute_request(method, url, headers, params, data, stream=True)
+
+        send = functools.partial(
+            self._send, method, url, headers, params, data, is_download, return_raw
+        )
+        key = self._coalesce_key(method, url, params, headers, data, is_download, return_raw)
+        if key is None:
+            return send()
+        return self._single_flight.do(key, send)
+
+    async def request_async(self, method: str, paths: List[str], **kwargs) -> Dict:
+        """
+        Asyncio variant of ``request``.
+        
+        The blocking request runs in the event loop's default executor.
+        Concurrent identical GET requests from coroutines and threads share
+        a single request in flight.
         
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            paths: URL path segments
+            **kwargs: Same keyword arguments as ``request`` (except ``stream``)
+            
+        Returns:
+            Response data as dictionary or download info
+        """
+        url = self._build_url(paths, kwargs.get("base_paths"),
+                              kwargs.get("use_alt_base_url", False))
+        send = functools.partial(
+            self._send, method, url,
+            kwargs.get("headers"), kwargs.get("params"), kwargs.get("data"),
+            kwargs.get("is_download", False), kwargs.get("return_raw", False)
+        )
+        key = self._coalesce_key(
+            method, url, kwargs.get("params"), kwargs.get("headers"), kwargs.get("data"),
+            kwargs.get("is_download", False), kwargs.get("return_raw", False)
+        )
+        if key is None:
+            key = object()  # unique key: run in the executor without sharing
+        result: Dict = await self._single_flight.do_async(key, send)
+        return result
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict],
+        params: Optional[Dict],
+        data: Optional[Dict],
+        is_download: bool,
+        return_raw: bool
+    ) -> Any:
+        """Execute a request and decode its response."""
+        response = self._execute_request(method, url, headers, params, data)
+
         if is_download:
             return self._handle_download(response)
 
         if return_raw:  # Add this handling
             return response.text
         
-        return response.json()
+        return self._codec.loads(response.content)
+
+    def _coalesce_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        data: Optional[Dict],
+        is_download: bool,
+        return_raw: bool
+    ) -> Optional[Hashable]:
+        """Key identifying a coalescable request, or None if it must not be shared."""
+        # Requests with a body are never shared: the key does not cover it
+        if not self._coalesce or method.upper() != "GET" or is_download or data is not None:
+            return None
+        try:
+            key = (
+                url,
+                tuple(sorted((params or {}).items())),
+                tuple(sorted((headers or {}).items())),
+                return_raw,
+            )
+            hash(key)
+            return key
+        except TypeError:
+            # Unhashable or unorderable parameter values
+            return None
 
     def _build_url(
         self, 
@@ -82,7 +181,8 @@ class YAVAIClient:
         url: str,
         headers: Optional[Dict],
         params: Optional[Dict],
-        data: Optional[Dict]
+        data: Optional[Dict],
+        stream: bool = False
     ) -> requests.Response:
         """Execute HTTP request with error handling."""
         response = self._session.request(
@@ -90,8 +190,9 @@ class YAVAIClient:
             url=url,
             headers=headers,
             params=params,
-            data=json.dumps(data) if data else None,
-            verify=False
+            data=self._codec.dumps(data) if data else None,
+            verify=False,
+            stream=stream
         )
         response.raise_for_status()
         return response
@@ -0,0 +1,86 @@
+"""JSON codecs for YAVAI API request and response bodies."""
+
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+
+class JSONCodec:
+    """Standard library JSON codec, always available."""
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a response body (bytes) into Python objects."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a request body as UTF-8 JSON bytes."""
+        return json.dumps(obj).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by orjson, which decodes straight from bytes."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._options)
+
+
+# Codecs in order of preference; the first importable one is the default
+_CODECS: Dict[str, Type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "json": JSONCodec,
+}
+
+
+def register_codec(name: str, codec_class: Type[JSONCodec], preferred: bool = False) -> None:
+    """
+    Register an additional JSON codec.
+
+    Args:
+        name: Name used to select the codec
+        codec_class: JSONCodec subclass; raise ImportError from __init__ if
+            its backing library is missing
+        preferred: Try this codec before the built-in ones
+    """
+    global _CODECS
+    if preferred:
+        _CODECS = {name: codec_class, **{k: v for k, v in _CODECS.items() if k != name}}
+    else:
+        _CODECS[name] = codec_class
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Resolve a codec instance.
+
+    Args:
+        codec: Codec instance, registered codec name, or None to pick the
+            fastest installed codec
+
+    Returns:
+        JSONCodec instance
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec is not None:
+        if codec not in _CODECS:
+            raise ValueError(f"Unknown JSON codec: {codec}. Available: {list(_CODECS)}")
+        return _CODECS[codec]()
+
+    for codec_class in _CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JSONCodec()
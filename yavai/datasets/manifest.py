@@ -0,0 +1,222 @@
+"""Persisted SQLite manifest of the files in a dataset."""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from yavai.datasets.records import DatasetFile
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id  TEXT PRIMARY KEY,
+    name     TEXT,
+    size     INTEGER,
+    etag     TEXT,
+    s3a_path TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_files_name ON files (name);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# SQLite's default limit on host parameters per statement is 999
+_MAX_PARAMS = 900
+
+
+class DatasetManifest:
+    """
+    Local index of a dataset's files (file_id, name, size, ETag, s3a path).
+
+    The manifest is stored as a SQLite database, by default under
+    ``~/.yavai/manifests/<dataset_id>.sqlite``, so repeat jobs can resolve
+    file paths without calling the dataset API.
+    """
+
+    def __init__(self, dataset_id: str, path: Optional[str] = None):
+        self.dataset_id = dataset_id
+        if path:
+            self.path = Path(path)
+        else:
+            self.path = Path.home() / ".yavai" / "manifests" / f"{dataset_id}.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def refreshed_at(self) -> Optional[float]:
+        """Unix time of the last successful refresh, or None if never refreshed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'refreshed_at'"
+            ).fetchone()
+        return float(row[0]) if row else None
+
+    def refresh(self, api, page_size: int = 1000, resolve_paths: bool = True) -> Dict[str, int]:
+        """
+        Bring the manifest in line with the current dataset listing.
+
+        Only new files and files whose size or ETag changed are written (and
+        have their s3a path resolved); files no longer listed are removed.
+        Removal only happens after a complete, non-empty listing: a listing
+        that fails part-way raises before anything is deleted, and an empty
+        one leaves the stored rows in place.
+
+        Args:
+            api: DatasetAPI used to list files and resolve paths
+            page_size: Page size used for listing
+            resolve_paths: Resolve s3a paths for new/changed files now rather
+                than on first lookup
+
+        Returns:
+            Counts of added, updated, removed and unchanged files
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        page: List[DatasetFile] = []
+        listed = 0
+
+        with self._lock:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen (file_id TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM seen")
+
+        for record in api.iter_dataset_files(self.dataset_id, page_size=page_size):
+            page.append(record)
+            listed += 1
+            if len(page) >= _MAX_PARAMS:
+                self._apply_page(page, api, resolve_paths, counts)
+                page = []
+        if page:
+            self._apply_page(page, api, resolve_paths, counts)
+
+        if not listed:
+            logging.warning(f"Dataset {self.dataset_id} listed no files; "
+                            f"keeping the {len(self)} stored manifest rows")
+        with self._lock, self._conn:
+            if listed:
+                cursor = self._conn.execute(
+                    "DELETE FROM files WHERE file_id NOT IN (SELECT file_id FROM seen)"
+                )
+                counts["removed"] = cursor.rowcount
+            self._conn.execute("DELETE FROM seen")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)",
+                (str(time.time()),)
+            )
+
+        logging.info(f"Manifest for dataset {self.dataset_id} refreshed: {counts}")
+        return counts
+
+    def _apply_page(self, page: List[DatasetFile], api, resolve_paths: bool,
+                    counts: Dict[str, int]) -> None:
+        """Diff one page of the listing against the stored rows and write changes."""
+        ids = [record.file_id for record in page]
+        placeholders = ",".join("?" * len(ids))
+        with self._lock:
+            stored = {
+                row[0]: (row[1], row[2], row[3])
+                for row in self._conn.execute(
+                    f"SELECT file_id, size, etag, s3a_path FROM files "
+                    f"WHERE file_id IN ({placeholders})",
+                    ids
+                )
+            }
+
+        rows = []
+        for record in page:
+            previous = stored.get(record.file_id)
+            if previous is not None and previous[:2] == (record.size, record.etag):
+                counts["unchanged"] += 1
+                continue
+            counts["updated" if previous is not None else "added"] += 1
+            # Ask the API directly: api.get_file_path would answer from this
+            # (stale) manifest when it is attached
+            s3a_path = api._fetch_file_path(record.file_id) if resolve_paths else None
+            rows.append((record.file_id, record.name, record.size, record.etag, s3a_path))
+
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO seen (file_id) VALUES (?)",
+                                   [(i,) for i in ids])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (file_id, name, size, etag, s3a_path) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def get_file_path(self, file_id: str) -> Optional[str]:
+        """Return the stored s3a path for a file, or None if unknown or unresolved."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT s3a_path FROM files WHERE file_id = ?", (file_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_file_path(self, file_id: str, s3a_path: str) -> None:
+        """Store a resolved s3a path for a file already in the manifest."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE files SET s3a_path = ? WHERE file_id = ?", (s3a_path, file_id)
+            )
+
+    def contains(self, file_id: str) -> bool:
+        """Whether the file is listed in the manifest."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM files WHERE file_id = ?", (file_id,)
+            ).fetchone()
+        return row is not None
+
+    def find_by_name(self, name: str) -> List[DatasetFile]:
+        """Return files with an exact name."""
+        return self._select("WHERE name = ?", (name,))
+
+    def list_prefix(self, prefix: str = "") -> List[DatasetFile]:
+        """Return files whose name starts with ``prefix``, ordered by name."""
+        upper = _prefix_upper_bound(prefix)
+        if upper is None:
+            return self._select("WHERE name >= ? ORDER BY name", (prefix,))
+        # Range scan so the name index is used
+        return self._select("WHERE name >= ? AND name < ? ORDER BY name", (prefix, upper))
+
+    def _select(self, clause: str, params: tuple) -> List[DatasetFile]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT file_id, name, size, etag FROM files {clause}", params
+            ).fetchall()
+        return [DatasetFile(*row) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Smallest string greater than every string starting with ``prefix``, or
+    None if there is none (empty prefix, or only U+10FFFF characters).
+
+    SQLite compares TEXT as UTF-8 bytes, which orders like code points.
+    """
+    stripped = prefix.rstrip(chr(0x10FFFF))
+    if not stripped:
+        return None
+    following = ord(stripped[-1]) + 1
+    if 0xD800 <= following <= 0xDFFF:
+        following = 0xE000  # surrogates cannot be encoded
+    return stripped[:-1] + chr(following)
@@ -0,0 +1,50 @@
+"""Lightweight records returned by the dataset API."""
+
+from typing import Any, Dict, Optional
+
+
+class DatasetFile:
+    """Compact record for a single file listed in a dataset."""
+
+    __slots__ = ("file_id", "name", "size", "etag")
+
+    def __init__(self, file_id: str, name: str, size: Optional[int] = None,
+                 etag: Optional[str] = None):
+        self.file_id = file_id
+        self.name = name
+        self.size = size
+        self.etag = etag
+
+    @classmethod
+    def from_payload(cls, item: Dict) -> "DatasetFile":
+        """Build a record from one entry of a browse response."""
+        size = _first(item, "size", "fileSize")
+        return cls(
+            file_id=_first(item, "id", "fileId"),
+            name=_first(item, "name", "fileName"),
+            size=int(size) if size is not None else None,
+            etag=_first(item, "etag", "eTag"),
+        )
+
+    def __iter__(self):
+        return iter((self.file_id, self.name, self.size, self.etag))
+
+    def __eq__(self, other):
+        if not isinstance(other, DatasetFile):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return (f"DatasetFile(file_id={self.file_id!r}, name={self.name!r}, "
+                f"size={self.size!r}, etag={self.etag!r})")
+
+
+def _first(item: Dict, *keys: str) -> Any:
+    """Value of the first of ``keys`` present in ``item``, or None."""
+    for key in keys:
+        if key in item:
+            return item[key]
+    return None
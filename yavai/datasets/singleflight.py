@@ -0,0 +1,93 @@
+"""Single-flight coalescing of concurrent identical calls."""
+
+import asyncio
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """A call in flight and the outcome shared with its waiters."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time; concurrent callers with the same
+    key wait for that call and receive its result (or exception).
+
+    Results are shared by reference between all waiters of a call, so they
+    should be treated as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._futures: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Call ``fn(*args, **kwargs)`` unless a call for ``key`` is already in
+        flight, in which case wait for it and return its result.
+
+        Args:
+            key: Hashable identity of the call
+            fn: Callable performing the work
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        with self._lock:
+            existing = self._calls.get(key)
+            if existing is None:
+                call = self._calls[key] = _Call()
+
+        if existing is not None:
+            existing.event.wait()
+            if existing.error is not None:
+                raise existing.error
+            return existing.result
+
+        try:
+            result = call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return result
+
+    async def do_async(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Asyncio counterpart of ``do``: runs the blocking ``fn`` in the loop's
+        default executor and lets concurrent coroutines await the same call.
+
+        The executor job goes through ``do``, so it is also coalesced with
+        threads issuing the same call.
+        """
+        loop = asyncio.get_running_loop()
+        future_key = (id(loop), key)
+
+        with self._lock:
+            future = self._futures.get(future_key)
+            if future is None:
+                future = loop.run_in_executor(
+                    None, functools.partial(self.do, key, fn, *args, **kwargs)
+                )
+                self._futures[future_key] = future
+                future.add_done_callback(lambda _: self._forget(future_key))
+
+        # Shield so that cancelling one waiter does not cancel the shared call
+        return await asyncio.shield(future)
+
+    def _forget(self, future_key: Tuple[int, Hashable]) -> None:
+        with self._lock:
+            self._futures.pop(future_key, None)
@@ -1,6 +1,16 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 from yavai import config
 
+# S3 multipart limits: every part but the last must be at least 5 MiB,
+# and an upload has at most 10,000 parts
+MIN_PART_SIZE = 5 * 2 ** 20
+MAX_PARTS = 10000
+DEFAULT_PART_SIZE = 64 * 2 ** 20
+
 def get_s3_client():
     s3session = boto3.session.Session()
     return s3session.client(
@@ -11,7 +21,121 @@ def get_s3_client():
     )
 
 def extract_bucket_key(s3a_path):
-    if s3a_path.startswith('s3a://'):
-        s3a_path = s3a_path[6:]
+    for prefix in ('s3a://', 's3://'):
+        if s3a_path.startswith(prefix):
+            s3a_path = s3a_path[len(prefix):]
+            break
     components = s3a_path.split('/')
-    return components[0], '/'.join(components[1:])
\ No newline at end of file
+    return components[0], '/'.join(components[1:])
+
+def upload_stream(fileobj, bucket, key, part_size=DEFAULT_PART_SIZE, max_concurrency=4,
+                  s3=None, progress=None, **extra_args):
+    """
+    Upload a readable stream to S3 as a multipart upload with concurrent parts.
+
+    Parts are read sequentially from ``fileobj`` and uploaded by up to
+    ``max_concurrency`` threads; the next part is only read once fewer than
+    that many parts are in flight, so at most ``max_concurrency * part_size``
+    bytes are buffered.
+    A stream that fits in one part is sent with a single put_object. On any
+    error the multipart upload is aborted and the error re-raised.
+
+    Args:
+        fileobj: Binary file-like object with ``read(n)``
+        bucket: Target bucket
+        key: Target key
+        part_size: Bytes per part (at least 5 MiB)
+        max_concurrency: Parts uploaded in parallel
+        s3: boto3 S3 client (defaults to ``get_s3_client()``)
+        progress: Called with the stats dict after each part
+        **extra_args: Passed to create_multipart_upload/put_object (e.g. ContentType)
+
+    Returns:
+        Stats dict (bucket, key, parts, bytes, seconds, mb_per_s)
+    """
+    if part_size < MIN_PART_SIZE:
+        raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+    s3 = s3 or get_s3_client()
+    started = time.monotonic()
+    stats = {"bucket": bucket, "key": key, "parts": 0, "bytes": 0}
+    lock = threading.Lock()
+
+    def snapshot():
+        elapsed = time.monotonic() - started
+        return dict(stats, seconds=elapsed,
+                    mb_per_s=stats["bytes"] / 1e6 / elapsed if elapsed > 0 else 0.0)
+
+    data = _read_part(fileobj, part_size)
+    if len(data) < part_size:
+        s3.put_object(Bucket=bucket, Key=key, Body=data, **extra_args)
+        stats.update(parts=1, bytes=len(data))
+        result = snapshot()
+        if progress:
+            progress(result)
+        return result
+
+    upload_id = s3.create_multipart_upload(Bucket=bucket, Key=key, **extra_args)['UploadId']
+    slots = threading.BoundedSemaphore(max_concurrency)
+    etags = {}
+    futures = []
+
+    def upload_part(number, body):
+        try:
+            response = s3.upload_part(Bucket=bucket, Key=key, UploadId=upload_id,
+                                      PartNumber=number, Body=body)
+            with lock:
+                etags[number] = response['ETag']
+                stats["parts"] += 1
+                stats["bytes"] += len(body)
+                current = snapshot()
+            if progress:
+                progress(current)
+        finally:
+            slots.release()
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrency,
+                                thread_name_prefix="yavai-s3") as pool:
+            number = 1
+            # A slot is taken before each part is read and released once it
+            # is uploaded, so read and in-flight parts never exceed max_concurrency
+            slots.acquire()
+            while True:
+                if any(f.done() and f.exception() for f in futures):
+                    slots.release()
+                    break
+                futures.append(pool.submit(upload_part, number, data))
+                number += 1
+                if len(data) < part_size:
+                    break
+                slots.acquire()
+                data = _read_part(fileobj, part_size)
+                if not data:
+                    slots.release()
+                    break
+                if number > MAX_PARTS:
+                    slots.release()
+                    raise ValueError(f"Stream needs more than {MAX_PARTS} parts; "
+                                     f"increase part_size")
+            for future in futures:
+                future.result()
+
+        parts = [{"PartNumber": n, "ETag": etags[n]} for n in sorted(etags)]
+        s3.complete_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id,
+                                     MultipartUpload={"Parts": parts})
+    except BaseException:
+        s3.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        raise
+    return snapshot()
+
+def _read_part(fileobj, size):
+    """Read up to ``size`` bytes, looping over short reads."""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = fileobj.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
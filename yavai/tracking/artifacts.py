@@ -0,0 +1,154 @@
+# yavai/tracking/artifacts.py
+
+import json
+import logging
+import os
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from mimetypes import guess_type
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from yavai import config
+
+logger = logging.getLogger(__name__)
+
+# Files above the threshold are sent as multipart uploads of this chunk size
+DEFAULT_MULTIPART_THRESHOLD = 64 * 2 ** 20
+DEFAULT_MULTIPART_CHUNKSIZE = 16 * 2 ** 20
+
+
+def is_s3_uri(uri: Optional[str]) -> bool:
+    return bool(uri) and urlparse(uri).scheme in ("s3", "s3a")
+
+
+def get_artifact_s3_client():
+    """S3 client for the MLflow artifact store (MLFLOW_S3_ENDPOINT_URL, AWS_* credentials)."""
+    import boto3
+
+    verify = os.environ.get("MLFLOW_S3_IGNORE_TLS", "").lower() not in ("true", "1")
+    return boto3.session.Session().client(
+        service_name="s3",
+        aws_access_key_id=os.environ.get("AWS_ACCESS_KEY_ID") or config.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=(os.environ.get("AWS_SECRET_ACCESS_KEY")
+                               or config.AWS_SECRET_ACCESS_KEY),
+        endpoint_url=os.environ.get("MLFLOW_S3_ENDPOINT_URL") or config.MLFLOW_S3_ENDPOINT_URL,
+        verify=verify,
+    )
+
+
+class ArtifactUploader:
+    """
+    Upload files to an S3 artifact URI with a thread pool, using the same
+    key layout as MLflow's S3 artifact repository.
+
+    Files are uploaded ``max_workers`` at a time; files above
+    ``multipart_threshold`` are split into concurrent multipart chunks by
+    boto3's transfer manager. Content type/encoding and
+    ``MLFLOW_S3_UPLOAD_EXTRA_ARGS`` are applied as MLflow does.
+    """
+
+    def __init__(self, max_workers: int = 8, multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+                 multipart_chunksize: int = DEFAULT_MULTIPART_CHUNKSIZE, max_concurrency: int = 4,
+                 s3=None, progress: Optional[Callable[[Dict], None]] = None):
+        """
+        Args:
+            max_workers: Files uploaded concurrently
+            multipart_threshold: Size in bytes above which multipart upload is used
+            multipart_chunksize: Multipart chunk size in bytes
+            max_concurrency: Concurrent chunks per multipart file
+            s3: boto3 S3 client (defaults to ``get_artifact_s3_client()``)
+            progress: Called with the stats dict after each file
+        """
+        self.max_workers = max_workers
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunksize = multipart_chunksize
+        self.max_concurrency = max_concurrency
+        self.progress = progress
+        self._s3 = s3
+
+    def log_artifact(self, local_file: str, artifact_uri: str,
+                     artifact_path: Optional[str] = None) -> Dict:
+        """Upload one file to ``<artifact_uri>/<artifact_path>/<basename>``."""
+        bucket, prefix = _parse_uri(artifact_uri, artifact_path)
+        key = posixpath.join(prefix, os.path.basename(local_file))
+        return self._upload([(local_file, bucket, key)])
+
+    def log_artifacts(self, local_dir: str, artifact_uri: str,
+                      artifact_path: Optional[str] = None) -> Dict:
+        """Upload a directory tree to ``<artifact_uri>/<artifact_path>/<relative path>``."""
+        bucket, prefix = _parse_uri(artifact_uri, artifact_path)
+        local_dir = os.path.abspath(local_dir)
+        files = []
+        for root, _, names in os.walk(local_dir):
+            rel_root = os.path.relpath(root, local_dir)
+            upload_prefix = prefix if rel_root == "." else posixpath.join(
+                prefix, *rel_root.split(os.sep))
+            for name in names:
+                key = posixpath.join(upload_prefix, name)
+                files.append((os.path.join(root, name), bucket, key))
+        return self._upload(files)
+
+    def _upload(self, files: List[Tuple[str, str, str]]) -> Dict:
+        from boto3.s3.transfer import TransferConfig
+
+        s3 = self._s3 or get_artifact_s3_client()
+        transfer_config = TransferConfig(multipart_threshold=self.multipart_threshold,
+                                         multipart_chunksize=self.multipart_chunksize,
+                                         max_concurrency=self.max_concurrency)
+        environ_extra_args = _environ_extra_args()
+        lock = threading.Lock()
+        started = time.monotonic()
+        stats = {"files": len(files), "bytes": sum(os.path.getsize(f) for f, _, _ in files),
+                 "files_done": 0, "bytes_done": 0}
+
+        def snapshot():
+            elapsed = time.monotonic() - started
+            return dict(stats, seconds=elapsed,
+                        mb_per_s=stats["bytes_done"] / 1e6 / elapsed if elapsed > 0 else 0.0)
+
+        def upload(item):
+            local_file, bucket, key = item
+            extra_args = {}
+            guessed_type, guessed_encoding = guess_type(local_file)
+            if guessed_type is not None:
+                extra_args["ContentType"] = guessed_type
+            if guessed_encoding is not None:
+                extra_args["ContentEncoding"] = guessed_encoding
+            extra_args.update(environ_extra_args)
+            s3.upload_file(Filename=local_file, Bucket=bucket, Key=key,
+                           ExtraArgs=extra_args, Config=transfer_config)
+            with lock:
+                stats["files_done"] += 1
+                stats["bytes_done"] += os.path.getsize(local_file)
+                current = snapshot()
+            if self.progress:
+                self.progress(current)
+
+        workers = max(1, min(self.max_workers, len(files)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yavai-artifacts") as pool:
+            futures = [pool.submit(upload, item) for item in files]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+
+        result: Dict = snapshot()
+        if errors:
+            raise RuntimeError(f"{len(errors)} of {len(files)} artifact uploads failed; "
+                               f"first error: {errors[0]}") from errors[0]
+        logger.info(f"Uploaded {result['files']} artifacts ({result['bytes'] / 1e6:.1f} MB) "
+                    f"in {result['seconds']:.1f}s ({result['mb_per_s']:.1f} MB/s)")
+        return result
+
+
+def _parse_uri(artifact_uri: str, artifact_path: Optional[str]) -> Tuple[str, str]:
+    parsed = urlparse(artifact_uri)
+    prefix = parsed.path.lstrip("/")
+    if artifact_path:
+        prefix = posixpath.join(prefix, artifact_path)
+    return parsed.netloc, prefix
+
+
+def _environ_extra_args() -> Dict:
+    value = os.environ.get("MLFLOW_S3_UPLOAD_EXTRA_ARGS")
+    return json.loads(value) if value else {}
@@ -0,0 +1,225 @@
+# yavai/tracking/async_logger.py
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+
+logger = logging.getLogger(__name__)
+
+# MLflow log_batch limits per request
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_TAGS_PER_BATCH = 100
+MAX_ENTITIES_PER_BATCH = 1000
+
+
+class _Flush:
+    """Queue marker asking the worker to send everything buffered."""
+
+    def __init__(self, stop: bool = False):
+        self.stop = stop
+        self.done = threading.Event()
+
+
+class AsyncBatchLogger:
+    """
+    Queue metrics, params and tags in memory and send them from a background
+    thread through ``MlflowClient.log_batch``.
+
+    Buffered entities are flushed when ``batch_size`` of them have queued up,
+    every ``flush_interval`` seconds, on ``flush()``/``close()`` and at
+    interpreter exit. The queue holds at most ``max_queue`` entities; when it
+    is full, logging calls block until the worker catches up. Failed batches
+    are retried ``retries`` times and then dropped with an error log. A batch
+    the server rejects as invalid is split instead (metrics, params and tags
+    separately, then in halves), so only the offending entities are dropped.
+    """
+
+    def __init__(self, client, flush_interval: float = 5.0, batch_size: int = 1000,
+                 max_queue: int = 100_000, retries: int = 3,
+                 on_error: Optional[Callable[[Exception, int], None]] = None):
+        """
+        Args:
+            client: MlflowClient used for log_batch
+            flush_interval: Maximum seconds an entity waits before being sent
+            batch_size: Buffered entities that trigger a flush
+            max_queue: Queue capacity in entities (backpressure bound)
+            retries: Attempts per batch after the first failure
+            on_error: Called with (error, dropped entity count) when entities
+                are dropped
+        """
+        self._client = client
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self.retries = retries
+        self.on_error = on_error
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stats_lock = threading.Lock()
+        self._stats = {"sent": 0, "failed": 0, "batches": 0}
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="yavai-mlflow-logger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # Producers
+    def log_metric(self, run_id: str, key: str, value: float, step: Optional[int] = None,
+                   timestamp: Optional[int] = None) -> None:
+        timestamp = timestamp if timestamp is not None else int(time.time() * 1000)
+        self._put(("metrics", run_id, Metric(key, float(value), timestamp, step or 0)))
+
+    def log_metrics(self, run_id: str, metrics: Dict[str, float],
+                    step: Optional[int] = None) -> None:
+        timestamp = int(time.time() * 1000)
+        for key, value in metrics.items():
+            self.log_metric(run_id, key, value, step, timestamp)
+
+    def log_param(self, run_id: str, key: str, value: Any) -> None:
+        self._put(("params", run_id, Param(key, str(value))))
+
+    def log_params(self, run_id: str, params: Dict[str, Any]) -> None:
+        for key, value in params.items():
+            self.log_param(run_id, key, value)
+
+    def set_tag(self, run_id: str, key: str, value: Any) -> None:
+        self._put(("tags", run_id, RunTag(key, str(value))))
+
+    def set_tags(self, run_id: str, tags: Dict[str, Any]) -> None:
+        for key, value in tags.items():
+            self.set_tag(run_id, key, value)
+
+    def _put(self, item) -> None:
+        if self._closed:
+            raise RuntimeError("Async MLflow logger is closed")
+        self._queue.put(item)
+
+    # Control
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything queued so far; returns False if ``timeout`` expired first."""
+        if self._closed:
+            return True
+        marker = _Flush()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush and stop the worker thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        marker = _Flush(stop=True)
+        self._queue.put(marker)
+        marker.done.wait(timeout)
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """Entities queued, sent and dropped, and batches sent."""
+        with self._stats_lock:
+            return dict(self._stats, queued=self._queue.qsize())
+
+    # Worker
+    def _run(self) -> None:
+        buffers: Dict[str, Dict[str, Any]] = {}
+        pending = 0
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is None or isinstance(item, _Flush):
+                self._send_all(buffers)
+                buffers, pending = {}, 0
+                deadline = time.monotonic() + self.flush_interval
+                if item is not None:
+                    item.done.set()
+                    if item.stop:
+                        return
+                continue
+
+            kind, run_id, entity = item
+            buffer = buffers.setdefault(run_id, {"metrics": [], "params": {}, "tags": {}})
+            if kind == "metrics":
+                buffer["metrics"].append(entity)
+            else:
+                # Last value wins; log_batch rejects duplicate keys in one request
+                buffer[kind][entity.key] = entity
+            pending += 1
+            if pending >= self.batch_size:
+                self._send_all(buffers)
+                buffers, pending = {}, 0
+
+    def _send_all(self, buffers: Dict[str, Dict[str, Any]]) -> None:
+        for run_id, buffer in buffers.items():
+            metrics = buffer["metrics"]
+            params = list(buffer["params"].values())
+            tags = list(buffer["tags"].values())
+            while metrics or params or tags:
+                batch_params = params[:MAX_PARAMS_TAGS_PER_BATCH]
+                batch_tags = tags[:MAX_PARAMS_TAGS_PER_BATCH]
+                room = min(MAX_METRICS_PER_BATCH,
+                           MAX_ENTITIES_PER_BATCH - len(batch_params) - len(batch_tags))
+                batch_metrics = metrics[:room]
+                params = params[len(batch_params):]
+                tags = tags[len(batch_tags):]
+                metrics = metrics[len(batch_metrics):]
+                self._send(run_id, batch_metrics, batch_params, batch_tags)
+
+    def _send(self, run_id: str, metrics: List[Metric], params: List[Param],
+              tags: List[RunTag]) -> None:
+        count = len(metrics) + len(params) + len(tags)
+        for attempt in range(self.retries + 1):
+            try:
+                self._client.log_batch(run_id, metrics=metrics, params=params, tags=tags)
+                with self._stats_lock:
+                    self._stats["sent"] += count
+                    self._stats["batches"] += 1
+                return
+            except Exception as e:
+                rejected = _is_rejected(e)
+                if rejected and count > 1:
+                    self._split(run_id, metrics, params, tags)
+                    return
+                if rejected or attempt == self.retries:
+                    logger.error(f"Dropping {count} MLflow entities for run {run_id} "
+                                 f"({_describe(metrics, params, tags)}): {e}")
+                    with self._stats_lock:
+                        self._stats["failed"] += count
+                    if self.on_error:
+                        self.on_error(e, count)
+                    return
+                time.sleep(min(2 ** attempt * 0.5, 10))
+
+    def _split(self, run_id: str, metrics: List[Metric], params: List[Param],
+               tags: List[RunTag]) -> None:
+        """Resend a rejected batch in parts to isolate the invalid entities."""
+        groups = (metrics, params, tags)
+        if sum(1 for group in groups if group) > 1:
+            parts = [(metrics, [], []), ([], params, []), ([], [], tags)]
+        else:
+            # A single kind left: bisect it
+            half = (len(metrics) + len(params) + len(tags)) // 2
+            parts = [(metrics[:half], params[:half], tags[:half]),
+                     (metrics[half:], params[half:], tags[half:])]
+        for part_metrics, part_params, part_tags in parts:
+            if part_metrics or part_params or part_tags:
+                self._send(run_id, part_metrics, part_params, part_tags)
+
+
+def _is_rejected(error: Exception) -> bool:
+    """Whether MLflow refused the request as invalid, so resending it cannot succeed."""
+    return isinstance(error, MlflowException) and error.get_http_status_code() == 400
+
+
+def _describe(metrics: List[Metric], params: List[Param], tags: List[RunTag]) -> str:
+    """Keys of the entities in a batch, for error logs."""
+    groups: List[Tuple[str, List[Any]]] = [("metrics", metrics), ("params", params),
+                                           ("tags", tags)]
+    return "; ".join(f"{name}: {', '.join(sorted({e.key for e in entities}))}"
+                     for name, entities in groups if entities)
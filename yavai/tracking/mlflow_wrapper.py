@@ -3,7 +3,9 @@
 import getpass
 import logging
 import os
-from typing import Any, Dict, Optional, Union
+import threading
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Union
 import warnings
 
 import mlflow
@@ -14,16 +16,45 @@ from matplotlib.figure import Figure
 from plotly.graph_objs import Figure as PlotlyFigure
 
 from yavai import config
+from yavai.tracking.artifacts import ArtifactUploader, is_s3_uri
+from yavai.tracking.async_logger import AsyncBatchLogger
+from yavai.tracking.spool import SpooledRun, TrackingSpool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# mlflow.start_run arguments that spool mode can record
+_SPOOL_RUN_ARGS = {"run_id", "experiment_id", "run_name", "nested", "parent_run_id", "tags",
+                   "description"}
+
+# Spool/async logger methods for one entity and for a dict of them, per kind
+_ROUTES = {"param": ("log_param", "log_params"), "metric": ("log_metric", "log_metrics"),
+           "tag": ("set_tag", "set_tags")}
+
+
+class _FlushingActiveRun(mlflow.ActiveRun):
+    """ActiveRun that sends queued async entities before the ``with`` block ends the run."""
+
+    def __init__(self, run, flush):
+        super().__init__(run)
+        self._flush = flush
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._flush()
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
 
 class MLflowWrapper:
     """Wrapper for MLflow experiment tracking operations."""
     
     def __init__(self):
         self._username = getpass.getuser().lower()
+        self._async_logger: Optional[AsyncBatchLogger] = None
+        self._spool: Optional[TrackingSpool] = None
+        self._spool_stop: Optional[threading.Event] = None
+        self._spool_thread: Optional[threading.Thread] = None
+        self._experiment_name: Optional[str] = None
+        self._artifact_uploader: Optional[ArtifactUploader] = None
 
     def configure_aws_credentials(self) -> None:
         """Set AWS environment variables for S3 access."""
@@ -40,15 +71,31 @@ class MLflowWrapper:
             logger.warning("AWS credentials incomplete, skipping configuration")
 
     # Run Management
-    def start_run(self, **kwargs) -> mlflow.ActiveRun:
-        """Start a new MLflow run."""
-        return mlflow.start_run(**kwargs)
+    def start_run(self, **kwargs) -> Union[mlflow.ActiveRun, SpooledRun]:
+        """Start a new MLflow run (a local run in spool mode)."""
+        if self._spool is not None:
+            unsupported = sorted(k for k, v in kwargs.items() if k not in _SPOOL_RUN_ARGS and v)
+            if unsupported:
+                raise ValueError(f"start_run arguments not supported in spool mode: {unsupported}")
+            return self._spool.start_run(
+                experiment_name=self._experiment_name, end_run=self.end_run,
+                **{k: v for k, v in kwargs.items() if k in _SPOOL_RUN_ARGS})
+        run = mlflow.start_run(**kwargs)
+        if self._async_logger is not None:
+            return _FlushingActiveRun(run, self.flush)
+        return run
 
     def end_run(self, status: str = 'FINISHED') -> None:
         """End the active MLflow run."""
+        if self._spool is not None and self._spool.active_run_id is not None:
+            self._spool.end_run(status)
+            return
+        self.flush()
         mlflow.end_run(status)
 
     def active_run(self):
+        if self._spool is not None and self._spool.active_run_id is not None:
+            return SimpleNamespace(info=SimpleNamespace(run_id=self._spool.active_run_id))
         return mlflow.active_run()
 
     def get_run(self, run_id: str):
@@ -60,30 +107,198 @@ class MLflowWrapper:
     def get_experiment_by_name(self, name: str):
         return mlflow.get_experiment_by_name(name)
 
+    # Async Logging
+    def enable_async_logging(self, flush_interval: float = 5.0, batch_size: int = 1000,
+                             max_queue: int = 100_000) -> None:
+        """
+        Queue metrics, params and tags and send them in batches from a background thread.
+
+        Logging calls return immediately (blocking only when ``max_queue``
+        entities are waiting); entities are flushed every ``flush_interval``
+        seconds, once ``batch_size`` are buffered, on ``end_run()`` and at exit.
+        Enable after ``set_tracking_uri`` so the batch client targets the right server.
+        """
+        self.disable_async_logging()
+        self._async_logger = AsyncBatchLogger(
+            mlflow.MlflowClient(), flush_interval=flush_interval,
+            batch_size=batch_size, max_queue=max_queue)
+
+    def disable_async_logging(self) -> None:
+        """Flush queued entities and return to synchronous logging."""
+        if self._async_logger is not None:
+            self._async_logger.close()
+            self._async_logger = None
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Send all queued async entities to the tracking server."""
+        if self._async_logger is not None:
+            self._async_logger.flush(timeout)
+
+    # Spool Mode
+    def enable_spool(self, path: Optional[str] = None, sync_interval: Optional[float] = None,
+                     fsync: bool = False) -> TrackingSpool:
+        """
+        Write runs, params, metrics and tags to a local write-ahead spool instead of the server.
+
+        Tracking calls only append a line to the spool, so jobs are unaffected
+        by tracking-server latency or outages; runs started in this mode get
+        local ids and are created on the server when the spool is replayed.
+        Replay with ``sync_spool()``, ``python -m yavai.tracking.spool sync``,
+        or in the background every ``sync_interval`` seconds. Artifacts and
+        models are not spooled.
+
+        Args:
+            path: Spool file (defaults to ``~/.yavai/spool/tracking.jsonl``)
+            sync_interval: Seconds between background replays (None disables)
+            fsync: Force every record to disk
+        """
+        self.disable_spool(sync=False)
+        self._spool = TrackingSpool(path, fsync=fsync)
+        if sync_interval:
+            self._spool_stop = threading.Event()
+            self._spool_thread = threading.Thread(
+                target=self._sync_loop, args=(self._spool, self._spool_stop, sync_interval),
+                name="yavai-mlflow-spool", daemon=True)
+            self._spool_thread.start()
+        return self._spool
+
+    def disable_spool(self, sync: bool = True) -> None:
+        """Leave spool mode, replaying pending records first when ``sync`` is True."""
+        if self._spool is None:
+            return
+        if self._spool_stop is not None and self._spool_thread is not None:
+            self._spool_stop.set()
+            self._spool_thread.join()
+            self._spool_stop = self._spool_thread = None
+        if sync:
+            try:
+                self._spool.sync()
+            except Exception as e:
+                logger.warning(f"Spool sync failed, records kept in {self._spool.path}: {e}")
+        self._spool.close()
+        self._spool = None
+
+    def sync_spool(self, batch_size: int = 1000) -> Dict[str, int]:
+        """Replay pending spooled records to the tracking server."""
+        if self._spool is None:
+            raise RuntimeError("Spool mode is not enabled. Call enable_spool() first.")
+        return self._spool.sync(batch_size=batch_size)
+
+    @staticmethod
+    def _sync_loop(spool: TrackingSpool, stop: threading.Event, interval: float) -> None:
+        while not stop.wait(interval):
+            try:
+                spool.sync()
+            except Exception as e:
+                logger.warning(f"Background spool sync failed, will retry: {e}")
+
+    def _spool_run_id(self) -> Optional[str]:
+        """Run id for spooled records, starting a local run if none is active."""
+        if self._spool is None:
+            return None
+        if self._spool.active_run_id is not None:
+            return self._spool.active_run_id
+        run = mlflow.active_run()
+        run_id: str = (run.info.run_id if run is not None else
+                       self._spool.start_run(experiment_name=self._experiment_name,
+                                             end_run=self.end_run).info.run_id)
+        return run_id
+
+    def _async_run_id(self) -> Optional[str]:
+        """Active run id when async logging is on; None routes the call synchronously."""
+        if self._async_logger is None:
+            return None
+        run = mlflow.active_run()
+        return run.info.run_id if run else None
+
+    def _route(self, kind: str, payload: Dict[str, Any], step: Optional[int] = None) -> bool:
+        """
+        Hand ``payload`` (key -> value) of ``kind`` ('param', 'metric' or
+        'tag') to the spool or the async logger, whichever is active.
+        Returns False when the caller should log it with mlflow directly.
+        """
+        single, batch = _ROUTES[kind]
+        spool, run_id = self._spool, self._spool_run_id()
+        if spool is not None and run_id:
+            extra = (step,) if kind == "metric" else ()
+            for key, value in payload.items():
+                getattr(spool, single)(run_id, key, value, *extra)
+            return True
+        async_logger, run_id = self._async_logger, self._async_run_id()
+        if async_logger is not None and run_id:
+            options = {"step": step} if kind == "metric" else {}
+            getattr(async_logger, batch)(run_id, payload, **options)
+            return True
+        return False
+
     # Logging Methods
     def log_param(self, key: str, value: Any) -> None:
         """Log a single parameter."""
-        mlflow.log_param(key, value)
+        if not self._route("param", {key: value}):
+            mlflow.log_param(key, value)
 
     def log_params(self, params: Dict[str, Any]) -> None:
         """Log multiple parameters."""
-        mlflow.log_params(params)
+        if not self._route("param", params):
+            mlflow.log_params(params)
 
     def log_metric(self, key: str, value: float, step: Optional[int] = None) -> None:
         """Log a single metric."""
-        mlflow.log_metric(key, value, step=step)
+        if not self._route("metric", {key: value}, step):
+            mlflow.log_metric(key, value, step=step)
 
     def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None) -> None:
         """Log multiple metrics."""
-        mlflow.log_metrics(metrics, step=step)
+        if not self._route("metric", metrics, step):
+            mlflow.log_metrics(metrics, step=step)
+
+    def log_artifact(self, file_path: str, artifact_path: Optional[str] = None) -> None:
+        """Log a single artifact file (uploaded directly to S3 if parallel upload is configured)."""
+        uploader, artifact_uri = self._artifact_uploader, self._parallel_artifact_uri()
+        if uploader is not None and artifact_uri:
+            uploader.log_artifact(file_path, artifact_uri, artifact_path)
+            return
+        mlflow.log_artifact(file_path, artifact_path)
 
-    def log_artifact(self, file_path: str) -> None:
-        """Log a single artifact file."""
-        mlflow.log_artifact(file_path)
+    def log_artifacts(self, dir_path: str, artifact_path: Optional[str] = None) -> None:
+        """Log all files in a directory as artifacts (in parallel if configured for S3)."""
+        uploader, artifact_uri = self._artifact_uploader, self._parallel_artifact_uri()
+        if uploader is not None and artifact_uri:
+            uploader.log_artifacts(dir_path, artifact_uri, artifact_path)
+            return
+        mlflow.log_artifacts(dir_path, artifact_path)
+
+    def configure_artifact_upload(self, enabled: bool = True, max_workers: int = 8,
+                                  multipart_threshold: int = 64 * 2 ** 20,
+                                  multipart_chunksize: int = 16 * 2 ** 20,
+                                  max_concurrency: int = 4,
+                                  progress: Optional[Callable[[Dict], None]] = None) -> None:
+        """
+        Enable (or disable) parallel artifact uploads to S3/MinIO artifact stores.
+
+        Off by default: artifacts go through ``mlflow.log_artifact(s)`` until
+        this is called. Uploads write straight to the bucket with the
+        ``AWS_*``/``MLFLOW_S3_ENDPOINT_URL`` credentials.
 
-    def log_artifacts(self, dir_path: str) -> None:
-        """Log all files in a directory as artifacts."""
-        mlflow.log_artifacts(dir_path)
+        Args:
+            enabled: Use the parallel uploader for s3:// artifact URIs
+            max_workers: Files uploaded concurrently
+            multipart_threshold: Size in bytes above which multipart upload is used
+            multipart_chunksize: Multipart chunk size in bytes
+            max_concurrency: Concurrent chunks per multipart file
+            progress: Called with upload stats (files_done, bytes_done, mb_per_s, ...) per file
+        """
+        self._artifact_uploader = ArtifactUploader(
+            max_workers=max_workers, multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+            progress=progress) if enabled else None
+
+    def _parallel_artifact_uri(self) -> Optional[str]:
+        """Artifact URI of the active run if it is on S3 and parallel upload is enabled."""
+        if self._artifact_uploader is None:
+            return None
+        artifact_uri = mlflow.get_artifact_uri()
+        return artifact_uri if is_s3_uri(artifact_uri) else None
 
     def log_dict(self, dictionary: Dict[str, Any], artifact_path: str) -> None:
         """Log a dictionary as a JSON artifact."""
@@ -120,11 +335,13 @@ class MLflowWrapper:
     # Tags
     def set_tag(self, key: str, value: str) -> None:
         """Set a single tag."""
-        mlflow.set_tag(key, value)
+        if not self._route("tag", {key: value}):
+            mlflow.set_tag(key, value)
 
     def set_tags(self, tags: Dict[str, str]) -> None:
         """Set multiple tags."""
-        mlflow.set_tags(tags)
+        if not self._route("tag", tags):
+            mlflow.set_tags(tags)
 
     # Tracking URI Management
     def set_tracking_uri(self, uri: str) -> None:
@@ -191,6 +408,7 @@ class MLflowWrapper:
             return
 
         mlflow.set_experiment(experiment_name, **kwargs)
+        self._experiment_name = experiment_name
         logger.info(f"Active experiment set to: {experiment_name}")
         
         if self._username != "jovyan":
@@ -0,0 +1,479 @@
+# yavai/tracking/spool.py
+
+"""
+Local write-ahead spool for MLflow tracking calls.
+
+Every call is appended as one JSON line with a sequence number; ``sync``
+replays unsent lines to the tracking server in batches and records the
+last committed sequence number, so replays are resumable and idempotent.
+Records the server rejects permanently are moved to a dead-letter file,
+and the spool is emptied once all of it has been replayed.
+
+Usage:
+    python -m yavai.tracking.spool sync [PATH] [--tracking-uri URI]
+    python -m yavai.tracking.spool status [PATH]
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from yavai.tracking.async_logger import (
+    MAX_ENTITIES_PER_BATCH, MAX_METRICS_PER_BATCH, MAX_PARAMS_TAGS_PER_BATCH,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPOOL_PATH = Path.home() / ".yavai" / "spool" / "tracking.jsonl"
+
+# Prefix of run ids created while spooling; replaced by server run ids on sync
+LOCAL_RUN_PREFIX = "spool-"
+
+# Tag linking a server run to the spooled run it was created from
+SPOOL_RUN_TAG = "yavai.spool_run_id"
+
+# Bytes read from the end of the spool to recover the last sequence number
+_TAIL_BYTES = 65536
+
+# Tags MLflow uses for run descriptions and nesting
+_NOTE_TAG = "mlflow.note.content"
+_PARENT_TAG = "mlflow.parentRunId"
+
+
+class SpooledRun:
+    """Handle for a run started in spool mode; ends the run when used as a context manager."""
+
+    def __init__(self, run_id: str, run_name: Optional[str], end_run):
+        self.info = SimpleNamespace(run_id=run_id, run_name=run_name)
+        self._end_run = end_run
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._end_run("FINISHED" if exc_type is None else "FAILED")
+        return False
+
+
+class TrackingSpool:
+    """
+    Append-only JSONL log of tracking calls with batched, resumable replay.
+
+    Records are flushed to the OS on every append (``fsync=True`` also
+    forces them to disk). Replay state (committed sequence number, byte
+    offset and local-to-server run id mapping) lives next to the spool in
+    ``<path>.state.json``; records rejected by the server go to
+    ``<path>.dead.jsonl``.
+    """
+
+    def __init__(self, path: Optional[str] = None, fsync: bool = False):
+        self.path = Path(path) if path else DEFAULT_SPOOL_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.path.with_name(self.path.name + ".state.json")
+        self.dead_letter_path = self.path.with_name(self.path.name + ".dead.jsonl")
+        self.fsync = fsync
+        self._runs: List[str] = []
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._seq = self._last_seq()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    # Writing
+    def append(self, op: str, run_id: Optional[str] = None, **fields) -> int:
+        """Append one tracking call and return its sequence number."""
+        with self._lock:
+            self._seq += 1
+            record = {"seq": self._seq, "op": op, "run_id": run_id,
+                      "ts": int(time.time() * 1000), **fields}
+            with _locked(self._file):
+                self._file.write(json.dumps(record, default=str) + "\n")
+                self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            return self._seq
+
+    @property
+    def active_run_id(self) -> Optional[str]:
+        """Innermost run started (or resumed) in this spool and not yet ended."""
+        return self._runs[-1] if self._runs else None
+
+    def start_run(self, run_name: Optional[str] = None, experiment_name: Optional[str] = None,
+                  experiment_id: Optional[str] = None, tags: Optional[Dict[str, Any]] = None,
+                  end_run=None, run_id: Optional[str] = None, nested: bool = False,
+                  parent_run_id: Optional[str] = None,
+                  description: Optional[str] = None) -> SpooledRun:
+        """
+        Start a local run; the server run is created when the spool is synced.
+
+        Mirrors ``mlflow.start_run``: ``run_id`` resumes an existing run
+        (records are logged against it and nothing is created on sync),
+        ``nested`` starts a child of the active run, and ``parent_run_id``
+        and ``description`` are replayed as MLflow's parent and note tags.
+        """
+        if self.active_run_id is not None and not nested:
+            raise ValueError(f"Run {self.active_run_id} is already active; "
+                             f"end it first or pass nested=True")
+        if run_id is not None:
+            self._runs.append(run_id)
+            return SpooledRun(run_id, run_name, end_run or self.end_run)
+        run_tags = {k: str(v) for k, v in (tags or {}).items()}
+        if description is not None:
+            run_tags[_NOTE_TAG] = description
+        local_id = f"{LOCAL_RUN_PREFIX}{uuid.uuid4().hex}"
+        self.append("start_run", local_id, run_name=run_name, experiment_name=experiment_name,
+                    experiment_id=experiment_id, tags=run_tags,
+                    parent_run_id=parent_run_id or (self.active_run_id if nested else None))
+        self._runs.append(local_id)
+        return SpooledRun(local_id, run_name, end_run or self.end_run)
+
+    def end_run(self, status: str = "FINISHED") -> None:
+        if self._runs:
+            self.append("end_run", self._runs.pop(), status=status)
+
+    def log_metric(self, run_id: str, key: str, value: float, step: Optional[int] = None) -> None:
+        self.append("metric", run_id, key=key, value=float(value), step=step or 0)
+
+    def log_param(self, run_id: str, key: str, value: Any) -> None:
+        self.append("param", run_id, key=key, value=str(value))
+
+    def set_tag(self, run_id: str, key: str, value: Any) -> None:
+        self.append("tag", run_id, key=key, value=str(value))
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    # Replay
+    def pending(self) -> int:
+        """Number of records not yet committed to the server."""
+        state = self._load_state()
+        return sum(1 for record, _ in self._read(state["offset"]) if record is not None)
+
+    def sync(self, client=None, batch_size: int = MAX_ENTITIES_PER_BATCH,
+             compact: bool = True) -> Dict[str, int]:
+        """
+        Replay uncommitted records to the tracking server.
+
+        Metrics, params and tags are sent with ``log_batch`` grouped per run;
+        run starts and ends are replayed in order. The committed position is
+        saved after every batch, so an interrupted sync resumes where it
+        stopped. Re-sent records are harmless: the server ignores duplicate
+        metric points and identical params/tags, and spooled runs are found
+        again by their ``yavai.spool_run_id`` tag instead of being recreated.
+
+        Records the server rejects with a client error (HTTP 4xx other than
+        408/429) would fail every replay, so they are appended to
+        ``dead_letter_path`` with the error and skipped, as are lines that
+        are not valid JSON. Once every record has been committed the spool
+        file is emptied (``compact``).
+
+        Args:
+            client: MlflowClient (defaults to one for the current tracking URI)
+            batch_size: Records per batch (capped at MLflow's 1000 entities)
+            compact: Truncate the spool when it is fully replayed
+
+        Returns:
+            Stats (records, batches, runs_created, dead_lettered, committed_seq)
+
+        Raises:
+            Exception: The first transient server error; records before it
+                stay committed
+        """
+        if client is None:
+            from mlflow import MlflowClient
+            client = MlflowClient()
+        batch_size = max(1, min(batch_size, MAX_ENTITIES_PER_BATCH))
+        stats = {"records": 0, "batches": 0, "runs_created": 0, "dead_lettered": 0}
+
+        with self._sync_lock:
+            state = self._load_state()
+            if state["offset"] > (self.path.stat().st_size if self.path.exists() else 0):
+                logger.warning(f"{self.path} is shorter than its committed offset; "
+                               f"replaying it from the start")
+                state["offset"] = 0
+            batch: List[dict] = []
+            position = state["offset"]
+
+            def commit(records, end):
+                if records:
+                    state["seq"] = records[-1]["seq"]
+                state["offset"] = end
+                stats["records"] += len(records)
+                self._save_state(state)
+
+            def send(records):
+                try:
+                    return self._send_batch(client, state, records)
+                except Exception as e:
+                    if not _is_permanent(e):
+                        raise
+                    if len(records) > 1:
+                        # Resend one by one so only the rejected records are dropped
+                        return sum(send([r]) for r in records)
+                    self._dead_letter(records[0], e)
+                    stats["dead_lettered"] += 1
+                    return 0
+
+            def replay(record):
+                try:
+                    if record["op"] == "start_run":
+                        stats["runs_created"] += self._replay_start(client, state, record)
+                    elif record["op"] == "end_run":
+                        run_id = self._server_run_id(state, record["run_id"])
+                        if run_id:
+                            client.set_terminated(run_id,
+                                                  status=record.get("status") or "FINISHED",
+                                                  end_time=record["ts"])
+                except Exception as e:
+                    if not _is_permanent(e):
+                        raise
+                    self._dead_letter(record, e)
+                    stats["dead_lettered"] += 1
+
+            for record, end in self._read(state["offset"], dead_letter=True):
+                if record is None:
+                    stats["dead_lettered"] += 1
+                    position = end
+                    if not batch:
+                        commit([], end)
+                    continue
+                if record["op"] in ("metric", "param", "tag"):
+                    batch.append(record)
+                    position = end
+                    if _batch_full(batch, batch_size):
+                        stats["batches"] += send(batch)
+                        commit(batch, end)
+                        batch = []
+                    continue
+
+                if batch:
+                    stats["batches"] += send(batch)
+                    commit(batch, position)
+                    batch = []
+                replay(record)
+                commit([record], end)
+                position = end
+
+            if batch:
+                stats["batches"] += send(batch)
+                commit(batch, position)
+            if compact and state["offset"]:
+                self._compact(state)
+            stats["committed_seq"] = state["seq"]
+        return stats
+
+    def _dead_letter(self, record: dict, error: Exception) -> None:
+        """Set aside a record the server rejected so it no longer blocks replay."""
+        logger.warning(f"Tracking server rejected spooled {record['op']} #{record['seq']}, "
+                       f"moved to {self.dead_letter_path}: {error}")
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(dict(record, error=str(error)), default=str) + "\n")
+
+    def _dead_letter_line(self, line: bytes, error: Exception) -> None:
+        """Set aside a spool line that cannot be parsed."""
+        logger.warning(f"Unreadable line in {self.path}, moved to {self.dead_letter_path}: {error}")
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            text = line.decode("utf-8", errors="replace").rstrip("\n")
+            f.write(json.dumps({"line": text, "error": str(error)}) + "\n")
+
+    def _compact(self, state: dict) -> None:
+        """Empty the spool if every record in it is committed; appends wait meanwhile."""
+        with self._lock, open(self.path, "r+b") as f, _locked(f):
+            if os.fstat(f.fileno()).st_size != state["offset"]:
+                return  # records were appended after the replay
+            f.truncate(0)
+            state["offset"] = 0
+            self._save_state(state)
+
+    def _send_batch(self, client, state: dict, batch: List[dict]) -> int:
+        from mlflow.entities import Metric, Param, RunTag
+
+        by_run: Dict[str, Dict[str, Any]] = {}
+        for record in batch:
+            run_id = self._server_run_id(state, record["run_id"])
+            if run_id is None:
+                logger.warning(f"Skipping spooled {record['op']} "
+                               f"for unknown run {record['run_id']}")
+                continue
+            entry = by_run.setdefault(run_id, {"metrics": [], "params": {}, "tags": {}})
+            if record["op"] == "metric":
+                entry["metrics"].append(Metric(record["key"], record["value"], record["ts"],
+                                               record["step"]))
+            elif record["op"] == "param":
+                entry["params"][record["key"]] = Param(record["key"], record["value"])
+            else:
+                entry["tags"][record["key"]] = RunTag(record["key"], record["value"])
+
+        calls = 0
+        for run_id, entry in by_run.items():
+            client.log_batch(run_id, metrics=entry["metrics"],
+                             params=list(entry["params"].values()),
+                             tags=list(entry["tags"].values()))
+            calls += 1
+        return calls
+
+    def _replay_start(self, client, state: dict, record: dict) -> int:
+        """Create (or find) the server run for a spooled start_run; returns 1 if created."""
+        local_id = record["run_id"]
+        if local_id in state["runs"]:
+            return 0
+        experiment_id = record.get("experiment_id")
+        if experiment_id is None and record.get("experiment_name"):
+            experiment = client.get_experiment_by_name(record["experiment_name"])
+            experiment_id = (experiment.experiment_id if experiment
+                             else client.create_experiment(record["experiment_name"]))
+        experiment_id = experiment_id or "0"
+
+        existing = client.search_runs([experiment_id],
+                                      filter_string=f"tags.`{SPOOL_RUN_TAG}` = '{local_id}'",
+                                      max_results=1)
+        if existing:
+            state["runs"][local_id] = existing[0].info.run_id
+            return 0
+        tags = dict(record.get("tags") or {}, **{SPOOL_RUN_TAG: local_id})
+        parent_id = self._server_run_id(state, record.get("parent_run_id"))
+        if parent_id:
+            tags[_PARENT_TAG] = parent_id
+        run = client.create_run(experiment_id, start_time=record["ts"], tags=tags,
+                                run_name=record.get("run_name"))
+        state["runs"][local_id] = run.info.run_id
+        return 1
+
+    @staticmethod
+    def _server_run_id(state: dict, run_id: Optional[str]) -> Optional[str]:
+        if run_id is None:
+            return None
+        if run_id.startswith(LOCAL_RUN_PREFIX):
+            server_id: Optional[str] = state["runs"].get(run_id)
+            return server_id
+        return run_id
+
+    def _read(self, offset: int, dead_letter: bool = False):
+        """
+        Yield (record, end offset) for complete lines after ``offset``. A line
+        that is not valid JSON yields (None, end offset) and, with
+        ``dead_letter``, is appended to the dead-letter file.
+        """
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return  # a writer is mid-append
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    if dead_letter:
+                        self._dead_letter_line(line, e)
+                    yield None, offset
+                    continue
+                yield record, offset
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        return {"seq": state.get("seq", 0), "offset": state.get("offset", 0),
+                "runs": state.get("runs", {})}
+
+    def _save_state(self, state: dict) -> None:
+        tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+    def _last_seq(self) -> int:
+        """Sequence number of the last complete record in an existing spool."""
+        if not self.path.exists():
+            return 0
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            start = max(0, f.tell() - _TAIL_BYTES)
+            f.seek(start)
+            lines = f.read().split(b"\n")
+        if start > 0:
+            lines = lines[1:]  # first line is cut off
+        for line in reversed(lines):
+            try:
+                return int(json.loads(line)["seq"])
+            except (ValueError, KeyError, TypeError):
+                continue
+        return int(self._load_state()["seq"])
+
+
+@contextmanager
+def _locked(f):
+    """Hold an exclusive lock on an open file, where the platform supports it."""
+    try:
+        import fcntl
+    except ImportError:  # Windows: compaction is only safe against writers in this process
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _is_permanent(error: Exception) -> bool:
+    """Whether a server error will recur on retry (a 4xx other than timeout/throttling)."""
+    status_code = getattr(error, "get_http_status_code", None)
+    if status_code is None:
+        return False
+    status = status_code()
+    return 400 <= status < 500 and status not in (408, 429)
+
+
+def _batch_full(batch: List[dict], batch_size: int) -> bool:
+    params = sum(1 for r in batch if r["op"] == "param")
+    tags = sum(1 for r in batch if r["op"] == "tag")
+    metrics = len(batch) - params - tags
+    return (len(batch) >= batch_size or metrics >= MAX_METRICS_PER_BATCH
+            or params >= MAX_PARAMS_TAGS_PER_BATCH or tags >= MAX_PARAMS_TAGS_PER_BATCH)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay or inspect a yavai tracking spool.")
+    parser.add_argument("command", choices=["sync", "status"])
+    parser.add_argument("path", nargs="?", default=str(DEFAULT_SPOOL_PATH))
+    parser.add_argument("--tracking-uri",
+                        help="MLflow tracking URI (defaults to MLFLOW_TRACKING_URI)")
+    parser.add_argument("--batch-size", type=int, default=MAX_ENTITIES_PER_BATCH)
+    args = parser.parse_args(argv)
+
+    spool = TrackingSpool(args.path)
+    try:
+        if args.command == "status":
+            print(f"{spool.pending()} pending records in {spool.path}")
+            return 0
+        if args.tracking_uri:
+            import mlflow
+            mlflow.set_tracking_uri(args.tracking_uri)
+        stats = spool.sync(batch_size=args.batch_size)
+        print(f"Synced {stats['records']} records in {stats['batches']} batches "
+              f"({stats['runs_created']} runs created)")
+        if stats["dead_lettered"]:
+            print(f"{stats['dead_lettered']} rejected records moved to {spool.dead_letter_path}")
+        return 0
+    finally:
+        spool.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())